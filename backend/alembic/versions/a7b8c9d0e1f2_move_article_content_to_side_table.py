@@ -0,0 +1,48 @@
+"""move_article_content_to_side_table
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7b8c9d0e1f2'
+down_revision = 'f6a7b8c9d0e1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('article_contents',
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('content_hash', name=op.f('pk_article_contents'))
+    )
+
+    # Rows ingested before hashing was reliable get their hash computed here,
+    # using the same SHA-256 hex digest as rss_fetcher.calculate_content_hash
+    op.execute(
+        "UPDATE articles SET content_hash = encode(sha256(convert_to(content, 'UTF8')), 'hex') "
+        "WHERE content IS NOT NULL AND content <> '' AND (content_hash IS NULL OR content_hash = '')"
+    )
+    op.execute(
+        "INSERT INTO article_contents (content_hash, content, created_at) "
+        "SELECT DISTINCT ON (content_hash) content_hash, content, created_at FROM articles "
+        "WHERE content IS NOT NULL AND content <> '' "
+        "ORDER BY content_hash, created_at"
+    )
+    op.drop_column('articles', 'content')
+
+
+def downgrade():
+    op.add_column('articles', sa.Column('content', sa.Text(), nullable=True))
+    op.execute(
+        "UPDATE articles SET content = article_contents.content FROM article_contents "
+        "WHERE article_contents.content_hash = articles.content_hash"
+    )
+    op.drop_table('article_contents')
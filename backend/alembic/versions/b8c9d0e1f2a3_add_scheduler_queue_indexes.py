@@ -0,0 +1,42 @@
+"""add_scheduler_queue_indexes
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8c9d0e1f2a3'
+down_revision = 'a7b8c9d0e1f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Queue priority copied from the article so pending claims sort without a join
+    op.add_column('claims', sa.Column('priority', sa.Float(), nullable=False, server_default='0'))
+    op.execute(
+        "UPDATE claims SET priority = articles.influence_score FROM articles "
+        "WHERE articles.id = claims.article_id AND articles.influence_score IS NOT NULL"
+    )
+
+    # Partial indexes covering only the rows each scheduler scan can return.
+    # On articles the index is created on the parent and cascades to partitions.
+    op.create_index(
+        'ix_articles_pending_influence', 'articles', [sa.text('influence_score DESC')],
+        unique=False, postgresql_where=sa.text("status = 'pending'")
+    )
+    op.create_index(
+        'ix_claims_pending_priority', 'claims', [sa.text('priority DESC')],
+        unique=False, postgresql_where=sa.text("status = 'pending' AND is_checkable")
+    )
+
+
+def downgrade():
+    op.drop_index('ix_claims_pending_priority', table_name='claims')
+    op.drop_index('ix_articles_pending_influence', table_name='articles')
+    op.drop_column('claims', 'priority')
@@ -0,0 +1,76 @@
+"""add_investigation_techniques
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9d0e1f2a3b4'
+down_revision = 'b8c9d0e1f2a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'investigation_techniques',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('investigation_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('technique', sa.String(length=100), nullable=False),
+        sa.Column('confidence', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['investigation_id'], ['investigations.id'],
+            name=op.f('fk_investigation_techniques_investigation_id_investigations'), ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_investigation_techniques'))
+    )
+
+    # Backfill from the detector output, normalising names the same way as
+    # propaganda_detector.normalize_technique and keeping the highest
+    # confidence per technique
+    op.execute(r"""
+        INSERT INTO investigation_techniques (id, investigation_id, technique, confidence, created_at)
+        SELECT gen_random_uuid(), investigation_id, technique, max(confidence), min(created_at)
+        FROM (
+            SELECT i.id AS investigation_id,
+                   i.created_at,
+                   left(lower(regexp_replace(btrim(
+                       CASE jsonb_typeof(entry) WHEN 'object' THEN entry->>'technique' ELSE entry #>> '{}' END
+                   ), '[\s-]+', '_', 'g')), 100) AS technique,
+                   CASE WHEN jsonb_typeof(entry->'confidence') = 'number'
+                        THEN least(greatest((entry->>'confidence')::float, 0.0), 1.0) END AS confidence
+            FROM investigations i
+            CROSS JOIN LATERAL jsonb_array_elements(i.propaganda_signals->'techniques_detected') AS entry
+            WHERE jsonb_typeof(i.propaganda_signals->'techniques_detected') = 'array'
+              AND jsonb_typeof(entry) IN ('object', 'string')
+        ) detected
+        WHERE technique <> ''
+        GROUP BY investigation_id, technique
+    """)
+
+    op.create_index(
+        'ix_investigation_techniques_investigation', 'investigation_techniques',
+        ['investigation_id'], unique=False
+    )
+    op.create_index(
+        'ix_investigation_techniques_technique', 'investigation_techniques',
+        ['technique', 'investigation_id'], unique=False
+    )
+    op.create_index(
+        'ix_investigations_propaganda_signals', 'investigations', ['propaganda_signals'],
+        unique=False, postgresql_using='gin', postgresql_ops={'propaganda_signals': 'jsonb_path_ops'}
+    )
+
+
+def downgrade():
+    op.drop_index('ix_investigations_propaganda_signals', table_name='investigations')
+    op.drop_index('ix_investigation_techniques_technique', table_name='investigation_techniques')
+    op.drop_index('ix_investigation_techniques_investigation', table_name='investigation_techniques')
+    op.drop_table('investigation_techniques')
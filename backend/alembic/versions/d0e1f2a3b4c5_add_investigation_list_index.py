@@ -0,0 +1,25 @@
+"""add_investigation_list_index
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd0e1f2a3b4c5'
+down_revision = 'c9d0e1f2a3b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Sort key of the investigations list and its cursor, so a page is an
+    # index range scan instead of a sort of every (wide) investigation row
+    op.create_index('ix_investigations_created', 'investigations', ['created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_investigations_created', table_name='investigations')
@@ -0,0 +1,58 @@
+"""add_article_counters
+
+Revision ID: d4e5f6a7b8c9
+Revises: c7d8e9f1a2b3
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e5f6a7b8c9'
+down_revision = 'c7d8e9f1a2b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Add denormalised counter columns
+    op.add_column('articles', sa.Column('claim_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('articles', sa.Column('completed_investigation_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from existing claims and investigations
+    op.execute("""
+        UPDATE articles a SET claim_count = c.claim_count
+        FROM (
+            SELECT article_id, COUNT(*) AS claim_count
+            FROM claims
+            GROUP BY article_id
+        ) c
+        WHERE c.article_id = a.id
+    """)
+    op.execute("""
+        UPDATE articles a SET completed_investigation_count = i.investigation_count
+        FROM (
+            SELECT claims.article_id, COUNT(investigations.id) AS investigation_count
+            FROM claims
+            JOIN investigations ON investigations.claim_id = claims.id
+            WHERE investigations.status = 'completed'
+            GROUP BY claims.article_id
+        ) i
+        WHERE i.article_id = a.id
+    """)
+
+    # Composite index matching the default articles list ordering
+    op.create_index(
+        'ix_articles_investigation_rank',
+        'articles',
+        ['completed_investigation_count', 'created_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_articles_investigation_rank', table_name='articles')
+    op.drop_column('articles', 'completed_investigation_count')
+    op.drop_column('articles', 'claim_count')
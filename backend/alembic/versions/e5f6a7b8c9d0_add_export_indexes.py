@@ -0,0 +1,26 @@
+"""add_export_indexes
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5f6a7b8c9d0'
+down_revision = 'd4e5f6a7b8c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Ordered range scans for incremental (since=...) exports
+    op.create_index('ix_investigations_updated', 'investigations', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_evidence_created', 'evidence', ['created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_evidence_created', table_name='evidence')
+    op.drop_index('ix_investigations_updated', table_name='investigations')
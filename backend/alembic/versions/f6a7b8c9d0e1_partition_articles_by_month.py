@@ -0,0 +1,119 @@
+"""partition_articles_by_month
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6a7b8c9d0e1'
+down_revision = 'e5f6a7b8c9d0'
+branch_labels = None
+depends_on = None
+
+# Monthly partitions pre-created after the current month
+MONTHS_AHEAD = 2
+
+ARTICLE_INDEXES = [
+    ('ix_articles_source', ['source_id']),
+    ('ix_articles_published', ['published_at']),
+    ('ix_articles_status', ['status']),
+    ('ix_articles_hash', ['content_hash']),
+    ('ix_articles_url', ['url']),
+    ('ix_articles_influence', ['influence_score']),
+    ('ix_articles_investigation_rank', ['completed_investigation_count', 'created_at', 'id']),
+]
+
+
+def _add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _drop_article_indexes():
+    for name, _ in ARTICLE_INDEXES:
+        op.drop_index(name, table_name='articles')
+
+
+def _create_article_indexes():
+    for name, columns in ARTICLE_INDEXES:
+        op.create_index(name, 'articles', columns, unique=False)
+
+
+def upgrade():
+    # Foreign keys can't reference a partitioned table unless they include the
+    # partition key, so claims -> articles becomes an ORM-level relationship
+    op.drop_constraint('fk_claims_article_id_articles', 'claims', type_='foreignkey')
+
+    # The partition key must be NOT NULL
+    op.execute(
+        "UPDATE articles SET created_at = COALESCE(published_at, timezone('utc', now())) "
+        "WHERE created_at IS NULL"
+    )
+
+    _drop_article_indexes()
+    op.execute('ALTER TABLE articles RENAME TO articles_legacy')
+    op.execute('ALTER TABLE articles_legacy RENAME CONSTRAINT pk_articles TO pk_articles_legacy')
+    op.execute('ALTER TABLE articles_legacy RENAME CONSTRAINT uq_articles_url TO uq_articles_legacy_url')
+
+    # Same columns and defaults; url uniqueness moves to the fetcher because a
+    # unique constraint on a partitioned table must include created_at
+    op.execute('CREATE TABLE articles (LIKE articles_legacy INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)')
+    op.execute('ALTER TABLE articles ALTER COLUMN created_at SET NOT NULL')
+    op.execute('ALTER TABLE articles ADD CONSTRAINT pk_articles PRIMARY KEY (id, created_at)')
+    op.create_foreign_key(
+        'fk_articles_source_id_news_sources', 'articles', 'news_sources',
+        ['source_id'], ['id'], ondelete='CASCADE'
+    )
+
+    # Catch-all for rows outside any monthly partition (e.g. if maintenance stalls)
+    op.execute('CREATE TABLE articles_default PARTITION OF articles DEFAULT')
+
+    bind = op.get_bind()
+    now = datetime.utcnow()
+    oldest = bind.execute(sa.text('SELECT min(created_at) FROM articles_legacy')).scalar() or now
+    month = oldest.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    last = _add_months(now.replace(day=1, hour=0, minute=0, second=0, microsecond=0), MONTHS_AHEAD)
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE articles_{month:%Y_%m} PARTITION OF articles "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+        )
+        month = upper
+
+    op.execute('INSERT INTO articles SELECT * FROM articles_legacy')
+    op.execute('DROP TABLE articles_legacy')
+
+    # Indexes on the parent cascade to every partition, including future ones
+    _create_article_indexes()
+
+
+def downgrade():
+    _drop_article_indexes()
+    op.execute('ALTER TABLE articles RENAME TO articles_partitioned')
+    op.execute('ALTER TABLE articles_partitioned RENAME CONSTRAINT pk_articles TO pk_articles_partitioned')
+
+    op.execute('CREATE TABLE articles (LIKE articles_partitioned INCLUDING DEFAULTS)')
+    op.execute('INSERT INTO articles SELECT * FROM articles_partitioned')
+    op.execute('DROP TABLE articles_partitioned')
+
+    op.create_primary_key('pk_articles', 'articles', ['id'])
+    op.create_unique_constraint('uq_articles_url', 'articles', ['url'])
+    op.alter_column('articles', 'created_at', existing_type=sa.DateTime(), nullable=True)
+    op.create_foreign_key(
+        'fk_articles_source_id_news_sources', 'articles', 'news_sources',
+        ['source_id'], ['id'], ondelete='CASCADE'
+    )
+    _create_article_indexes()
+
+    op.create_foreign_key(
+        'fk_claims_article_id_articles', 'claims', 'articles',
+        ['article_id'], ['id'], ondelete='CASCADE'
+    )
@@ -1,15 +1,42 @@
 """Article endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func, case
+from datetime import datetime
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from app.db.session import get_db
-from app.models import Article, Claim, NewsSource, Investigation
+from app.db.session import get_async_read_db
+from app.core.pagination import TOTAL_MODE_PATTERN, apply_page, split_page, count_total
+from app.core.fieldsets import parse_fields, project, pick, fieldset_etag
+from app.core.responses import paginated
+from app.core.http_cache import make_etag, etag_matches, not_modified
+from app.models import Article, Claim, NewsSource
 from app.schemas.article import ArticleResponse, ArticleDetailResponse
 from app.schemas.common import PaginatedResponse
 
 router = APIRouter()
 
+# Selectable fields -> columns. Only requested columns are read, so `content`
+# stays in Postgres unless a client asks for it.
+FIELD_COLUMNS = {
+    "id": Article.id,
+    "source_id": Article.source_id,
+    "source_name": NewsSource.name,
+    "title": Article.title,
+    "url": Article.url,
+    "author": Article.author,
+    "published_at": Article.published_at,
+    "status": Article.status,
+    "claim_count": Article.claim_count,
+    "investigation_count": Article.completed_investigation_count,
+    "created_at": Article.created_at,
+    "updated_at": Article.updated_at,
+    "content": Article.content,
+}
+LIST_FIELDS = list(ArticleResponse.model_fields) + ["investigation_count"]
+DETAIL_FIELDS = list(ArticleDetailResponse.model_fields)
 
 @router.get("", response_model=PaginatedResponse)
 async def list_articles(
@@ -17,74 +44,122 @@ async def list_articles(
     status: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    total_mode: str = Query(default="exact", regex=TOTAL_MODE_PATTERN),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """List articles with pagination."""
-    # Subquery to count completed investigations per article
-    investigation_count = (
-        db.query(
-            Article.id.label("article_id"),
-            func.count(Investigation.id).label("investigation_count")
-        )
-        .outerjoin(Claim, Claim.article_id == Article.id)
-        .outerjoin(Investigation, Investigation.claim_id == Claim.id)
-        .filter(Investigation.status == "completed")
-        .group_by(Article.id)
-        .subquery()
-    )
+    """List articles with offset or cursor pagination."""
+    names = parse_fields(fields, allowed=list(FIELD_COLUMNS), default=LIST_FIELDS)
 
-    query = db.query(
-        Article,
-        NewsSource.name.label("source_name"),
-        func.count(Claim.id).label("claim_count"),
-        func.coalesce(investigation_count.c.investigation_count, 0).label("investigation_count")
-    ).outerjoin(NewsSource).outerjoin(Claim).outerjoin(
-        investigation_count, investigation_count.c.article_id == Article.id
-    ).group_by(Article.id, NewsSource.name, investigation_count.c.investigation_count)
+    # Claim and investigation counts are denormalised onto the article row,
+    # so this is a plain range scan over ix_articles_investigation_rank
+    stmt = select(*project(FIELD_COLUMNS, names, required=("investigation_count", "created_at", "id")))
+    if "source_name" in names:
+        stmt = stmt.outerjoin(NewsSource, NewsSource.id == Article.source_id)
 
     if source_id:
-        query = query.filter(Article.source_id == source_id)
+        stmt = stmt.where(Article.source_id == source_id)
     if status:
-        query = query.filter(Article.status == status)
+        stmt = stmt.where(Article.status == status)
+
+    total = await count_total(db, stmt, total_mode, "articles", filtered=bool(source_id or status))
 
-    total = query.count()
     # Sort by investigation count (DESC) first, then by created_at (DESC)
-    results = query.order_by(
-        func.coalesce(investigation_count.c.investigation_count, 0).desc(),
-        Article.created_at.desc()
-    ).offset(offset).limit(limit).all()
-
-    items = []
-    for article, source_name, claim_count, investigation_count in results:
-        article_dict = ArticleResponse.model_validate(article).model_dump()
-        article_dict["source_name"] = source_name
-        article_dict["claim_count"] = claim_count
-        article_dict["investigation_count"] = investigation_count
-        items.append(article_dict)
-
-    return {
-        "items": items,
-        "total": total,
-        "limit": limit,
-        "offset": offset
-    }
+    rows = (await db.execute(apply_page(
+        stmt,
+        sort_columns=[Article.completed_investigation_count, Article.created_at, Article.id],
+        cursor_types=[int, datetime.fromisoformat, UUID],
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    ))).all()
+    rows, next_cursor = split_page(
+        rows, limit, lambda row: (row.investigation_count, row.created_at, row.id)
+    )
+
+    return paginated(
+        (pick(row, names) for row in rows),
+        total=total,
+        limit=limit,
+        offset=0 if cursor else offset,
+        next_cursor=next_cursor
+    )
+
+
+def _article_etag(article_id, article_updated_at, source_updated_at, claims_updated_at, claim_count) -> str:
+    """ETag covering the article row, its source name and its claim list."""
+    return make_etag("article", article_id, article_updated_at, source_updated_at, claims_updated_at, claim_count)
+
+
+async def _article_version(db: AsyncSession, article_id: str, with_claims: bool):
+    """Fetch the values _article_etag is built from, or None if the article doesn't exist."""
+    columns = [Article.updated_at, NewsSource.updated_at.label("source_updated_at")]
+    stmt = select(*columns).outerjoin(NewsSource, NewsSource.id == Article.source_id)
+    if with_claims:
+        # Correlated aggregates rather than GROUP BY: articles is partitioned, so
+        # its primary key is (id, created_at) and doesn't cover updated_at
+        stmt = stmt.add_columns(
+            select(func.max(Claim.updated_at))
+            .where(Claim.article_id == Article.id)
+            .scalar_subquery().label("claims_updated_at"),
+            select(func.count(Claim.id))
+            .where(Claim.article_id == Article.id)
+            .scalar_subquery().label("claim_count")
+        )
+
+    version = (await db.execute(stmt.where(Article.id == article_id))).first()
+    if version and not with_claims:
+        return (*version, None, None)
+    return version
 
 
 @router.get("/{article_id}", response_model=ArticleDetailResponse)
-async def get_article(article_id: str, db: Session = Depends(get_db)):
+async def get_article(
+    article_id: str,
+    request: Request,
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
     """Get article details."""
-    article = db.query(Article).filter(Article.id == article_id).first()
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
+    names = parse_fields(fields, allowed=list(FIELD_COLUMNS) + ["claims"], default=DETAIL_FIELDS)
+    with_claims = "claims" in names
 
-    # Get source name
-    source = db.query(NewsSource).filter(NewsSource.id == article.source_id).first()
+    if request.headers.get("if-none-match"):
+        # Cheap version probe so revalidation skips loading and serializing the body
+        version = await _article_version(db, article_id, with_claims)
+        if not version:
+            raise HTTPException(status_code=404, detail="Article not found")
+        etag = fieldset_etag(_article_etag(article_id, *version), names, DETAIL_FIELDS)
+        if etag_matches(request, etag):
+            return not_modified(etag)
 
-    # Get claims
-    claims = db.query(Claim).filter(Claim.article_id == article_id).all()
+    row = (await db.execute(
+        select(
+            *project(FIELD_COLUMNS, names, required=("updated_at",)),
+            NewsSource.updated_at.label("source_updated_at")
+        )
+        .outerjoin(NewsSource, NewsSource.id == Article.source_id)
+        .where(Article.id == article_id)
+    )).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Article not found")
 
-    article_dict = ArticleDetailResponse.model_validate(article).model_dump()
-    article_dict["source_name"] = source.name if source else None
-    article_dict["claims"] = [{"id": str(c.id), "claim_text": c.claim_text, "status": c.status} for c in claims]
+    article_dict = pick(row, names)
+    claims_updated_at = claim_count = None
+    if with_claims:
+        claims = (await db.execute(
+            select(Claim.id, Claim.claim_text, Claim.status, Claim.updated_at).where(Claim.article_id == article_id)
+        )).all()
+        article_dict["claims"] = [{"id": str(c.id), "claim_text": c.claim_text, "status": c.status} for c in claims]
+        claims_updated_at = max((c.updated_at for c in claims if c.updated_at), default=None)
+        claim_count = len(claims)
+
+    etag = fieldset_etag(
+        _article_etag(article_id, row.updated_at, row.source_updated_at, claims_updated_at, claim_count),
+        names,
+        DETAIL_FIELDS
+    )
 
-    return article_dict
+    # Sparse bodies don't satisfy ArticleDetailResponse, so skip response_model validation
+    return JSONResponse(jsonable_encoder(article_dict), headers={"ETag": etag})
@@ -1,15 +1,61 @@
 """Claim endpoints."""
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from datetime import datetime
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from app.db.session import get_db
+from app.db.session import get_async_read_db
+from app.core.pagination import TOTAL_MODE_PATTERN, apply_page, split_page, count_total
+from app.core.fieldsets import parse_fields, project, pick, fieldset_etag
+from app.core.responses import paginated
+from app.core.http_cache import make_etag, etag_matches, not_modified
 from app.models import Claim, Article, Investigation
 from app.schemas.claim import ClaimResponse, ClaimDetailResponse
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import PaginatedResponse, BatchGetRequest, BatchGetResponse
 from app.core.exceptions import NotFoundError
 
 router = APIRouter()
 
+# Selectable fields -> columns. `context` is only read when requested.
+FIELD_COLUMNS = {
+    "id": Claim.id,
+    "article_id": Claim.article_id,
+    "article_title": Article.title,
+    "claim_text": Claim.claim_text,
+    "claim_type": Claim.claim_type,
+    "context": Claim.context,
+    "is_checkable": Claim.is_checkable,
+    "extraction_confidence": Claim.extraction_confidence,
+    "status": Claim.status,
+    "created_at": Claim.created_at,
+    "updated_at": Claim.updated_at,
+}
+LIST_FIELDS = [name for name in ClaimResponse.model_fields if name != "context"]
+DETAIL_FIELDS = list(ClaimDetailResponse.model_fields)
+
+# Investigation columns embedded in claim details
+INVESTIGATION_SUMMARY_COLUMNS = (
+    Investigation.id,
+    Investigation.verdict,
+    Investigation.confidence_score,
+    Investigation.summary,
+    Investigation.evidence_count,
+)
+
+
+def _investigation_summary(row) -> dict:
+    """Serialize the investigation embedded in a claim detail."""
+    return {
+        "id": str(row.id),
+        "verdict": row.verdict,
+        "confidence_score": row.confidence_score,
+        "summary": row.summary,
+        "evidence_count": row.evidence_count
+    }
+
 
 @router.get("", response_model=PaginatedResponse)
 async def list_claims(
@@ -17,49 +63,165 @@ async def list_claims(
     status: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    total_mode: str = Query(default="exact", regex=TOTAL_MODE_PATTERN),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """List claims with pagination."""
-    query = db.query(Claim)
+    """List claims with offset or cursor pagination."""
+    names = parse_fields(fields, allowed=list(FIELD_COLUMNS), default=LIST_FIELDS)
+
+    stmt = select(*project(FIELD_COLUMNS, names, required=("created_at", "id")))
+    if "article_title" in names:
+        stmt = stmt.outerjoin(Article, Article.id == Claim.article_id)
 
     if article_id:
-        query = query.filter(Claim.article_id == article_id)
+        stmt = stmt.where(Claim.article_id == article_id)
     if status:
-        query = query.filter(Claim.status == status)
+        stmt = stmt.where(Claim.status == status)
+
+    total = await count_total(db, stmt, total_mode, "claims", filtered=bool(article_id or status))
+    rows = (await db.execute(apply_page(
+        stmt,
+        sort_columns=[Claim.created_at, Claim.id],
+        cursor_types=[datetime.fromisoformat, UUID],
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    ))).all()
+    rows, next_cursor = split_page(rows, limit, lambda row: (row.created_at, row.id))
+
+    return paginated(
+        (pick(row, names) for row in rows),
+        total=total,
+        limit=limit,
+        offset=0 if cursor else offset,
+        next_cursor=next_cursor
+    )
+
+
+@router.post(":batchGet", response_model=BatchGetResponse)
+async def batch_get_claims(
+    body: BatchGetRequest,
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Resolve many claims in one call.
 
-    total = query.count()
-    claims = query.offset(offset).limit(limit).all()
+    Claims (with article titles) and their investigations are each fetched
+    with a single IN query. Results follow request order; unknown ids come
+    back with found=false.
+    """
+    names = parse_fields(fields, allowed=list(FIELD_COLUMNS) + ["investigation"], default=DETAIL_FIELDS)
+    ids = list(dict.fromkeys(body.ids))
+
+    stmt = select(*project(FIELD_COLUMNS, names, required=("id",)))
+    if "article_title" in names:
+        stmt = stmt.outerjoin(Article, Article.id == Claim.article_id)
+    rows = (await db.execute(stmt.where(Claim.id.in_(ids)))).all()
+    claims = {row.id: pick(row, names) for row in rows}
+
+    if "investigation" in names and claims:
+        for claim_dict in claims.values():
+            claim_dict["investigation"] = None
+        investigations = (await db.execute(
+            select(Investigation.claim_id, *INVESTIGATION_SUMMARY_COLUMNS)
+            .where(Investigation.claim_id.in_(list(claims)))
+            .order_by(Investigation.created_at)
+        )).all()
+        # Keep the first investigation per claim, matching GET /claims/{id}
+        for investigation in investigations:
+            claim_dict = claims[investigation.claim_id]
+            if claim_dict["investigation"] is None:
+                claim_dict["investigation"] = _investigation_summary(investigation)
 
     return {
-        "items": [ClaimResponse.model_validate(c) for c in claims],
-        "total": total,
-        "limit": limit,
-        "offset": offset
+        "items": [
+            {"id": claim_id, "found": claim_id in claims, "item": claims.get(claim_id)}
+            for claim_id in body.ids
+        ]
     }
 
 
+def _claim_etag(claim_id, claim_updated_at, investigations_updated_at, investigation_count) -> str:
+    """ETag covering the claim row and its investigations.
+
+    The article's updated_at is left out on purpose: it moves whenever the
+    article's counters change, while the title shown here is fixed.
+    """
+    return make_etag("claim", claim_id, claim_updated_at, investigations_updated_at, investigation_count)
+
+
+async def _claim_version(db: AsyncSession, claim_id: str, with_investigation: bool):
+    """Fetch the values _claim_etag is built from, or None if the claim doesn't exist."""
+    stmt = select(Claim.updated_at)
+    if with_investigation:
+        # Correlated aggregates rather than GROUP BY, which would have to cover
+        # the article's whole (partitioned) primary key
+        stmt = stmt.add_columns(
+            select(func.max(Investigation.updated_at))
+            .where(Investigation.claim_id == Claim.id)
+            .scalar_subquery().label("investigations_updated_at"),
+            select(func.count(Investigation.id))
+            .where(Investigation.claim_id == Claim.id)
+            .scalar_subquery().label("investigation_count")
+        )
+
+    version = (await db.execute(stmt.where(Claim.id == claim_id))).first()
+    if version and not with_investigation:
+        return (*version, None, None)
+    return version
+
+
 @router.get("/{claim_id}", response_model=ClaimDetailResponse)
-async def get_claim(claim_id: str, db: Session = Depends(get_db)):
+async def get_claim(
+    claim_id: str,
+    request: Request,
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
     """Get claim details with investigation."""
-    claim = db.query(Claim).filter(Claim.id == claim_id).first()
-    if not claim:
-        raise NotFoundError(resource="Claim", resource_id=claim_id)
+    names = parse_fields(fields, allowed=list(FIELD_COLUMNS) + ["investigation"], default=DETAIL_FIELDS)
+    with_investigation = "investigation" in names
+
+    if request.headers.get("if-none-match"):
+        # Cheap version probe so revalidation skips loading and serializing the body
+        version = await _claim_version(db, claim_id, with_investigation)
+        if not version:
+            raise NotFoundError(resource="Claim", resource_id=claim_id)
+        etag = fieldset_etag(_claim_etag(claim_id, *version), names, DETAIL_FIELDS)
+        if etag_matches(request, etag):
+            return not_modified(etag)
 
-    # Get article title
-    article = db.query(Article).filter(Article.id == claim.article_id).first()
+    # Claim and article title in one statement
+    row = (await db.execute(
+        select(*project(FIELD_COLUMNS, names, required=("updated_at",)))
+        .outerjoin(Article, Article.id == Claim.article_id)
+        .where(Claim.id == claim_id)
+    )).first()
+    if not row:
+        raise NotFoundError(resource="Claim", resource_id=claim_id)
 
-    # Get investigation
-    investigation = db.query(Investigation).filter(Investigation.claim_id == claim_id).first()
+    claim_dict = pick(row, names)
+    investigations_updated_at = investigation_count = None
+    if with_investigation:
+        # Get investigations (normally just one)
+        investigations = (await db.execute(
+            select(*INVESTIGATION_SUMMARY_COLUMNS, Investigation.updated_at)
+            .where(Investigation.claim_id == claim_id)
+            .order_by(Investigation.created_at)
+        )).all()
+        investigation = investigations[0] if investigations else None
+        claim_dict["investigation"] = _investigation_summary(investigation) if investigation else None
+        investigations_updated_at = max((i.updated_at for i in investigations if i.updated_at), default=None)
+        investigation_count = len(investigations)
 
-    claim_dict = ClaimDetailResponse.model_validate(claim).model_dump()
-    claim_dict["article_title"] = article.title if article else None
-    if investigation:
-        claim_dict["investigation"] = {
-            "id": str(investigation.id),
-            "verdict": investigation.verdict,
-            "confidence_score": investigation.confidence_score,
-            "summary": investigation.summary,
-            "evidence_count": investigation.evidence_count
-        }
+    etag = fieldset_etag(
+        _claim_etag(claim_id, row.updated_at, investigations_updated_at, investigation_count),
+        names,
+        DETAIL_FIELDS
+    )
 
-    return claim_dict
+    # Sparse bodies don't satisfy ClaimDetailResponse, so skip response_model validation
+    return JSONResponse(jsonable_encoder(claim_dict), headers={"ETag": etag})
@@ -0,0 +1,78 @@
+"""Server-sent events endpoint for live pipeline updates."""
+import asyncio
+import json
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.logging import logger
+from app.core.redis import get_async_redis_client
+from app.services.events.publisher import EVENTS_CHANNEL
+
+router = APIRouter()
+
+# Seconds between keep-alive comments when no events arrive
+KEEPALIVE_INTERVAL_SECONDS = 15.0
+
+# Client reconnect delay advertised to EventSource (milliseconds)
+RETRY_MILLISECONDS = 5000
+
+
+def format_sse(event_type: str, data: str) -> str:
+    """Format one server-sent event frame."""
+    return f"event: {event_type}\ndata: {data}\n\n"
+
+
+async def _event_stream(request: Request) -> AsyncIterator[str]:
+    """Relay Redis pub/sub messages to one SSE client until it disconnects."""
+    pubsub = get_async_redis_client().pubsub(ignore_subscribe_messages=True)
+    await pubsub.subscribe(EVENTS_CHANNEL)
+
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+
+        while not await request.is_disconnected():
+            message = await pubsub.get_message(timeout=KEEPALIVE_INTERVAL_SECONDS)
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+
+            raw = message["data"]
+            payload = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+            try:
+                event_type = json.loads(payload).get("type", "message")
+            except (ValueError, AttributeError):
+                event_type = "message"
+            yield format_sse(event_type, payload)
+
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.error("event_stream_failed", error=str(e))
+    finally:
+        await pubsub.unsubscribe(EVENTS_CHANNEL)
+        await pubsub.close()
+
+
+@router.get("/stream")
+async def stream_events(request: Request):
+    """
+    Stream pipeline events as server-sent events.
+
+    Event types:
+        investigation.created: A claim was fact-checked
+        article.processed: Claim extraction finished for an article
+        queue.depth: Processing queue counts changed
+
+    Returns:
+        text/event-stream response
+    """
+    return StreamingResponse(
+        _event_stream(request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+        },
+    )
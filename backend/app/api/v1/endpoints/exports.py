@@ -0,0 +1,215 @@
+"""Bulk export endpoints.
+
+Stream whole result sets as newline-delimited JSON or CSV. Rows are read
+through a server-side cursor in fixed-size batches and written out as each
+batch arrives, so memory stays constant regardless of corpus size.
+Consumers pull incremental deltas by passing the largest timestamp they
+have already seen as ``since``.
+
+The timestamps are set by the application when a row is flushed, not when
+it commits, so a transaction that commits late (a long Celery task) can
+make a row visible with a timestamp older than a watermark a consumer has
+already passed. Each incremental export therefore starts
+EXPORT_SINCE_OVERLAP_SECONDS before ``since`` and re-sends that window;
+consumers must upsert rows by id. A row committed later than that after
+its timestamp is still missed and only shows up in a full export.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from app.config import settings
+from app.db.session import async_read_sessionmaker
+from app.models import Investigation, Claim, Evidence, Article
+
+router = APIRouter()
+
+# Rows fetched from the server-side cursor per round trip
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_FORMAT_PATTERN = "^(ndjson|csv)$"
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+INVESTIGATION_COLUMNS = [
+    Investigation.id,
+    Investigation.claim_id,
+    Claim.claim_text,
+    Article.id.label("article_id"),
+    Article.title.label("article_title"),
+    Article.url.label("article_url"),
+    Investigation.verdict,
+    Investigation.confidence_score,
+    Investigation.summary,
+    Investigation.evidence_count,
+    Investigation.supporting_evidence_count,
+    Investigation.refuting_evidence_count,
+    Investigation.propaganda_signals,
+    Investigation.status,
+    Investigation.created_at,
+    Investigation.updated_at,
+]
+
+EVIDENCE_COLUMNS = [
+    Evidence.id,
+    Evidence.investigation_id,
+    Investigation.claim_id,
+    Investigation.verdict,
+    Evidence.source_name,
+    Evidence.source_url,
+    Evidence.source_reliability,
+    Evidence.snippet,
+    Evidence.stance,
+    Evidence.relevance_score,
+    Evidence.published_at,
+    Evidence.created_at,
+]
+
+
+def _json_default(value):
+    """Serialize UUIDs and datetimes for export rows."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_value(value):
+    """Flatten a value into a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=_json_default)
+    return value
+
+
+def _encode_batch(rows, fieldnames: List[str], export_format: str) -> str:
+    """Encode one batch of rows as NDJSON lines or CSV records."""
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows([[_csv_value(row[name]) for name in fieldnames] for row in rows])
+        return buffer.getvalue()
+
+    return "".join(
+        json.dumps({name: row[name] for name in fieldnames}, default=_json_default) + "\n"
+        for row in rows
+    )
+
+
+async def _stream_rows(stmt, export_format: str) -> AsyncIterator[str]:
+    """Run a select on a server-side cursor and yield encoded batches."""
+    fieldnames = [column.key for column in stmt.selected_columns]
+
+    if export_format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(fieldnames)
+        yield buffer.getvalue()
+
+    # The session is owned by the generator so it lives as long as the response
+    session_factory = await async_read_sessionmaker()
+    async with session_factory() as db:
+        result = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for batch in result.mappings().partitions():
+            yield _encode_batch(batch, fieldnames, export_format)
+
+
+def _export_response(stmt, export_format: str, name: str) -> StreamingResponse:
+    """Wrap a streamed export in a download response."""
+    return StreamingResponse(
+        _stream_rows(stmt, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'},
+    )
+
+
+def _watermark(since: datetime) -> datetime:
+    """Lower bound for a ``since`` export: naive UTC, minus the overlap window."""
+    return _naive_utc(since) - timedelta(seconds=settings.EXPORT_SINCE_OVERLAP_SECONDS)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """
+    Convert a query timestamp to naive UTC, as the columns store it.
+
+    asyncpg rejects comparing an aware datetime with a TIMESTAMP column,
+    and inside the streaming body that error would truncate a response
+    whose 200 status has already been sent.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@router.get("/investigations")
+async def export_investigations(
+    format: str = Query(default="ndjson", regex=EXPORT_FORMAT_PATTERN),
+    since: Optional[datetime] = None,
+    verdict: Optional[str] = None,
+):
+    """
+    Stream investigations with their claim and article info.
+
+    Args:
+        format: 'ndjson' or 'csv'
+        since: Only include investigations updated at or after this time,
+            less the overlap window (naive values are taken as UTC)
+        verdict: Only include investigations with this verdict
+
+    Returns:
+        Streaming response ordered by (updated_at, id)
+    """
+    stmt = select(*INVESTIGATION_COLUMNS).outerjoin(
+        Claim, Claim.id == Investigation.claim_id
+    ).outerjoin(
+        Article, Article.id == Claim.article_id
+    )
+
+    if since:
+        stmt = stmt.where(Investigation.updated_at >= _watermark(since))
+    if verdict:
+        stmt = stmt.where(Investigation.verdict == verdict)
+
+    stmt = stmt.order_by(Investigation.updated_at, Investigation.id)
+    return _export_response(stmt, format, "investigations")
+
+
+@router.get("/evidence")
+async def export_evidence(
+    format: str = Query(default="ndjson", regex=EXPORT_FORMAT_PATTERN),
+    since: Optional[datetime] = None,
+    verdict: Optional[str] = None,
+):
+    """
+    Stream evidence records with their investigation verdict.
+
+    Args:
+        format: 'ndjson' or 'csv'
+        since: Only include evidence created at or after this time,
+            less the overlap window (naive values are taken as UTC)
+        verdict: Only include evidence whose investigation has this verdict
+
+    Returns:
+        Streaming response ordered by (created_at, id)
+    """
+    stmt = select(*EVIDENCE_COLUMNS).join(
+        Investigation, Investigation.id == Evidence.investigation_id
+    )
+
+    if since:
+        stmt = stmt.where(Evidence.created_at >= _watermark(since))
+    if verdict:
+        stmt = stmt.where(Investigation.verdict == verdict)
+
+    stmt = stmt.order_by(Evidence.created_at, Evidence.id)
+    return _export_response(stmt, format, "evidence")
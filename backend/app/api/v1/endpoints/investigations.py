@@ -1,94 +1,296 @@
 """Investigation endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import Optional
-from app.db.session import get_db
+from datetime import datetime
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from app.db.replicas import is_replica_session
+from app.db.session import AsyncSessionLocal, get_async_read_db
+from app.core.pagination import TOTAL_MODE_PATTERN, apply_page, split_page, count_total
+from app.core.fieldsets import parse_fields, project, pick, fieldset_etag
+from app.core.responses import paginated
+from app.core.http_cache import make_etag, etag_matches, not_modified
+from app.services.cache.investigation_cache import get_cached_investigation, cache_investigation
 from app.models import Investigation, Claim, Evidence, Article
 from app.schemas.investigation import InvestigationResponse, InvestigationDetailResponse
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import PaginatedResponse, BatchGetRequest, BatchGetResponse
 
 router = APIRouter()
 
 
+# Selectable fields -> columns. `reasoning` is only read when requested.
+FIELD_COLUMNS = {
+    "id": Investigation.id,
+    "claim_id": Investigation.claim_id,
+    "claim_text": Claim.claim_text,
+    "verdict": Investigation.verdict,
+    "confidence_score": Investigation.confidence_score,
+    "summary": Investigation.summary,
+    "reasoning": Investigation.reasoning,
+    "evidence_count": Investigation.evidence_count,
+    "supporting_evidence_count": Investigation.supporting_evidence_count,
+    "refuting_evidence_count": Investigation.refuting_evidence_count,
+    "propaganda_signals": Investigation.propaganda_signals,
+    "status": Investigation.status,
+    "created_at": Investigation.created_at,
+    "updated_at": Investigation.updated_at,
+    "article_id": Article.id,
+    "article_title": Article.title,
+    "article_url": Article.url,
+}
+JOINED_FIELDS = {"claim_text", "article_id", "article_title", "article_url"}
+LIST_FIELDS = list(InvestigationResponse.model_fields)
+DETAIL_FIELDS = list(InvestigationDetailResponse.model_fields)
+
+
+# Evidence columns embedded in investigation details
+EVIDENCE_COLUMNS = (
+    Evidence.id,
+    Evidence.source_name,
+    Evidence.source_url,
+    Evidence.snippet,
+    Evidence.stance,
+    Evidence.relevance_score,
+    Evidence.source_reliability,
+)
+
+
+def _evidence_item(row) -> dict:
+    """Serialize one evidence row embedded in an investigation detail."""
+    return {
+        "id": str(row.id),
+        "source_name": row.source_name,
+        "source_url": row.source_url,
+        "snippet": row.snippet,
+        "stance": row.stance,
+        "relevance_score": row.relevance_score,
+        "source_reliability": row.source_reliability
+    }
+
+
+def _join_claim_and_article(stmt):
+    """Outer-join the claim and article onto an Investigation select."""
+    return stmt.outerjoin(
+        Claim, Claim.id == Investigation.claim_id
+    ).outerjoin(
+        Article, Article.id == Claim.article_id
+    )
+
+
 @router.get("", response_model=PaginatedResponse)
 async def list_investigations(
     verdict: Optional[str] = None,
     min_confidence: Optional[float] = None,
     limit: int = 20,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    total_mode: str = Query(default="exact", regex=TOTAL_MODE_PATTERN),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """List investigations with pagination."""
-    query = db.query(Investigation)
+    """List investigations with offset or cursor pagination."""
+    names = parse_fields(fields, allowed=list(FIELD_COLUMNS), default=LIST_FIELDS)
 
+    stmt = select(*project(FIELD_COLUMNS, names, required=("created_at", "id")))
+    filters = []
     if verdict:
-        query = query.filter(Investigation.verdict == verdict)
+        filters.append(Investigation.verdict == verdict)
     if min_confidence:
-        query = query.filter(Investigation.confidence_score >= min_confidence)
+        filters.append(Investigation.confidence_score >= min_confidence)
+    stmt = stmt.where(*filters)
+
+    # Counted before the joins: they're to-one outer joins, so they don't change
+    # the total, but Postgres would still hash the whole claims and articles tables
+    total = await count_total(
+        db, select(Investigation.id).where(*filters), total_mode, "investigations", filtered=bool(filters)
+    )
+
+    # Claim text and article info come from the same statement (no per-row lookups)
+    if JOINED_FIELDS.intersection(names):
+        stmt = _join_claim_and_article(stmt)
 
-    total = query.count()
-    investigations = query.offset(offset).limit(limit).all()
+    rows = (await db.execute(apply_page(
+        stmt,
+        sort_columns=[Investigation.created_at, Investigation.id],
+        cursor_types=[datetime.fromisoformat, UUID],
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    ))).all()
+    rows, next_cursor = split_page(rows, limit, lambda row: (row.created_at, row.id))
 
-    # Add claim text and article info to each investigation
-    items = []
-    for inv in investigations:
-        claim = db.query(Claim).filter(Claim.id == inv.claim_id).first()
-        inv_dict = InvestigationResponse.model_validate(inv).model_dump()
-        inv_dict["claim_text"] = claim.claim_text if claim else None
+    return paginated(
+        (pick(row, names) for row in rows),
+        total=total,
+        limit=limit,
+        offset=0 if cursor else offset,
+        next_cursor=next_cursor
+    )
+
+
+@router.post(":batchGet", response_model=BatchGetResponse)
+async def batch_get_investigations(
+    body: BatchGetRequest,
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Resolve many investigations in one call.
 
-        # Add article information
-        if claim and claim.article_id:
-            article = db.query(Article).filter(Article.id == claim.article_id).first()
-            if article:
-                inv_dict["article_id"] = str(article.id)
-                inv_dict["article_title"] = article.title
-                inv_dict["article_url"] = article.url
+    Investigations (with claim and article info) and their evidence are each
+    fetched with a single IN query. Results follow request order; unknown ids
+    come back with found=false.
+    """
+    names = parse_fields(fields, allowed=list(FIELD_COLUMNS) + ["evidence"], default=DETAIL_FIELDS)
+    ids = list(dict.fromkeys(body.ids))
 
-        items.append(inv_dict)
+    stmt = select(*project(FIELD_COLUMNS, names, required=("id",)))
+    if JOINED_FIELDS.intersection(names):
+        stmt = _join_claim_and_article(stmt)
+    rows = (await db.execute(stmt.where(Investigation.id.in_(ids)))).all()
+    investigations = {row.id: pick(row, names) for row in rows}
+
+    if "evidence" in names and investigations:
+        for inv_dict in investigations.values():
+            inv_dict["evidence"] = []
+        evidence = (await db.execute(
+            select(Evidence.investigation_id, *EVIDENCE_COLUMNS)
+            .where(Evidence.investigation_id.in_(list(investigations)))
+        )).all()
+        for e in evidence:
+            investigations[e.investigation_id]["evidence"].append(_evidence_item(e))
 
     return {
-        "items": items,
-        "total": total,
-        "limit": limit,
-        "offset": offset
+        "items": [
+            {"id": investigation_id, "found": investigation_id in investigations,
+             "item": investigations.get(investigation_id)}
+            for investigation_id in body.ids
+        ]
     }
 
 
+def _investigation_etag(
+    investigation_id, investigation_updated_at, claim_updated_at, evidence_count, evidence_created_at
+) -> str:
+    """
+    ETag covering the investigation, its claim and its evidence.
+
+    The article's updated_at is left out on purpose: it moves whenever the
+    article's counters change, while the title/url shown here are fixed.
+    """
+    return make_etag(
+        "investigation", investigation_id, investigation_updated_at,
+        claim_updated_at, evidence_count, evidence_created_at
+    )
+
+
+async def _load_investigation(
+    db: AsyncSession, investigation_id: str, names: List[str]
+) -> Optional[Tuple[str, str, dict]]:
+    """
+    Load an investigation's requested fields.
+
+    Returns:
+        (status, full-representation ETag, JSON-ready body), or None if it
+        doesn't exist
+    """
+    stmt = select(
+        *project(FIELD_COLUMNS, names, required=("updated_at", "status")),
+        Claim.updated_at.label("claim_updated_at")
+    )
+    with_evidence = "evidence" in names
+    if not with_evidence:
+        # The ETag still covers evidence, via correlated aggregates in the same statement
+        stmt = stmt.add_columns(
+            select(func.count(Evidence.id))
+            .where(Evidence.investigation_id == Investigation.id)
+            .scalar_subquery().label("evidence_rows"),
+            select(func.max(Evidence.created_at))
+            .where(Evidence.investigation_id == Investigation.id)
+            .scalar_subquery().label("evidence_created_at")
+        )
+    row = (await db.execute(
+        _join_claim_and_article(stmt).where(Investigation.id == investigation_id)
+    )).first()
+    if not row:
+        return None
+
+    inv_dict = pick(row, names)
+    if with_evidence:
+        evidence = (await db.execute(
+            select(*EVIDENCE_COLUMNS, Evidence.created_at).where(Evidence.investigation_id == investigation_id)
+        )).all()
+        inv_dict["evidence"] = [_evidence_item(e) for e in evidence]
+        evidence_rows = len(evidence)
+        evidence_created_at = max((e.created_at for e in evidence if e.created_at), default=None)
+    else:
+        evidence_rows, evidence_created_at = row.evidence_rows, row.evidence_created_at
+
+    etag = _investigation_etag(
+        investigation_id, row.updated_at, row.claim_updated_at, evidence_rows, evidence_created_at
+    )
+    return row.status, etag, jsonable_encoder(inv_dict)
+
+
 @router.get("/{investigation_id}", response_model=InvestigationDetailResponse)
-async def get_investigation(investigation_id: str, db: Session = Depends(get_db)):
+async def get_investigation(
+    investigation_id: str,
+    request: Request,
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
     """Get investigation details with evidence."""
-    investigation = db.query(Investigation).filter(Investigation.id == investigation_id).first()
-    if not investigation:
+    names = parse_fields(fields, allowed=list(FIELD_COLUMNS) + ["evidence"], default=DETAIL_FIELDS)
+    sparse = names != DETAIL_FIELDS
+
+    # Completed investigations are served from Redis without touching Postgres
+    cached = await get_cached_investigation(investigation_id)
+    if cached:
+        etag = fieldset_etag(cached["etag"], names, DETAIL_FIELDS)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        body = {name: cached["body"][name] for name in names} if sparse else cached["body"]
+        return JSONResponse(body, headers={"ETag": etag})
+
+    if request.headers.get("if-none-match"):
+        # Cheap version probe so revalidation skips loading and serializing the body
+        version = (await db.execute(
+            select(
+                Investigation.updated_at,
+                Claim.updated_at.label("claim_updated_at"),
+                func.count(Evidence.id).label("evidence_count"),
+                func.max(Evidence.created_at).label("evidence_created_at")
+            )
+            .outerjoin(Claim, Claim.id == Investigation.claim_id)
+            .outerjoin(Evidence, Evidence.investigation_id == Investigation.id)
+            .where(Investigation.id == investigation_id)
+            .group_by(Investigation.id, Claim.id)
+        )).first()
+        if not version:
+            raise HTTPException(status_code=404, detail="Investigation not found")
+        etag = fieldset_etag(_investigation_etag(investigation_id, *version), names, DETAIL_FIELDS)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+    loaded = await _load_investigation(db, investigation_id, names)
+    if not loaded:
         raise HTTPException(status_code=404, detail="Investigation not found")
+    status, etag, body = loaded
+
+    # Only the full representation is cached; sparse requests are cut from it
+    if status == "completed" and not sparse:
+        if is_replica_session(db):
+            # A lagging replica could put back what a worker's commit just
+            # evicted, for the whole TTL; cache (and serve) the primary's copy
+            async with AsyncSessionLocal() as primary:
+                loaded = await _load_investigation(primary, investigation_id, names)
+            if not loaded:
+                raise HTTPException(status_code=404, detail="Investigation not found")
+            status, etag, body = loaded
+        if status == "completed":
+            await cache_investigation(investigation_id, etag, body)
 
-    # Get claim
-    claim = db.query(Claim).filter(Claim.id == investigation.claim_id).first()
-
-    # Get evidence
-    evidence = db.query(Evidence).filter(Evidence.investigation_id == investigation_id).all()
-
-    inv_dict = InvestigationDetailResponse.model_validate(investigation).model_dump()
-    inv_dict["claim_text"] = claim.claim_text if claim else None
-
-    # Add article information
-    if claim and claim.article_id:
-        article = db.query(Article).filter(Article.id == claim.article_id).first()
-        if article:
-            inv_dict["article_id"] = str(article.id)
-            inv_dict["article_title"] = article.title
-            inv_dict["article_url"] = article.url
-
-    inv_dict["evidence"] = [
-        {
-            "id": str(e.id),
-            "source_name": e.source_name,
-            "source_url": e.source_url,
-            "snippet": e.snippet,
-            "stance": e.stance,
-            "relevance_score": e.relevance_score,
-            "source_reliability": e.source_reliability
-        }
-        for e in evidence
-    ]
-
-    return inv_dict
+    return JSONResponse(body, headers={"ETag": fieldset_etag(etag, names, DETAIL_FIELDS)})
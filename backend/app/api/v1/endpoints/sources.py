@@ -1,8 +1,12 @@
 """News source endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import datetime
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.db.session import get_db
+from app.db.session import get_async_db, get_async_read_db
+from app.core.pagination import TOTAL_MODE_PATTERN, apply_page, split_page, count_total
 from app.models import NewsSource
 from app.schemas.source import NewsSourceResponse, NewsSourceCreate, NewsSourceUpdate
 from app.schemas.common import PaginatedResponse
@@ -15,42 +19,55 @@ async def list_sources(
     is_active: Optional[bool] = None,
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    total_mode: str = Query(default="exact", regex=TOTAL_MODE_PATTERN),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """List all news sources."""
-    query = db.query(NewsSource)
+    stmt = select(NewsSource)
 
     if is_active is not None:
-        query = query.filter(NewsSource.is_active == is_active)
+        stmt = stmt.where(NewsSource.is_active == is_active)
 
-    total = query.count()
-    sources = query.offset(offset).limit(limit).all()
+    total = await count_total(db, stmt, total_mode, "news_sources", filtered=is_active is not None)
+    sources = (await db.execute(apply_page(
+        stmt,
+        sort_columns=[NewsSource.created_at, NewsSource.id],
+        cursor_types=[datetime.fromisoformat, UUID],
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    ))).scalars().all()
+    sources, next_cursor = split_page(sources, limit, lambda s: (s.created_at, s.id))
 
     return {
         "items": [NewsSourceResponse.model_validate(s) for s in sources],
         "total": total,
         "limit": limit,
-        "offset": offset
+        "offset": 0 if cursor else offset,
+        "next_cursor": next_cursor
     }
 
 
 @router.post("", response_model=NewsSourceResponse, status_code=201)
 async def create_source(
     source: NewsSourceCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new news source."""
     db_source = NewsSource(**source.model_dump())
     db.add(db_source)
-    db.commit()
-    db.refresh(db_source)
+    await db.commit()
+    await db.refresh(db_source)
     return NewsSourceResponse.model_validate(db_source)
 
 
 @router.get("/{source_id}", response_model=NewsSourceResponse)
-async def get_source(source_id: str, db: Session = Depends(get_db)):
+async def get_source(source_id: str, db: AsyncSession = Depends(get_async_read_db)):
     """Get a specific news source."""
-    source = db.query(NewsSource).filter(NewsSource.id == source_id).first()
+    source = (await db.execute(
+        select(NewsSource).where(NewsSource.id == source_id)
+    )).scalars().first()
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
     return NewsSourceResponse.model_validate(source)
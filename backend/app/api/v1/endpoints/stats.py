@@ -1,8 +1,9 @@
 """Stats API endpoints."""
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.services.stats.dashboard_stats import get_dashboard_overview
+from app.core.redis import get_redis
 from app.schemas.stats import DashboardStatsResponse
 from typing import Optional
 import json
@@ -13,28 +14,10 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_redis():
-    """Get Redis connection.
-
-    Returns:
-        Redis connection or None if unavailable
-    """
-    try:
-        import redis
-        from app.core.config import settings
-
-        r = redis.from_url(settings.REDIS_URL)
-        r.ping()
-        return r
-    except Exception as e:
-        logger.warning(f"Redis connection failed: {e}")
-        return None
-
-
 @router.get("/overview", response_model=DashboardStatsResponse)
 def get_stats_overview(
     time_range: str = Query(default="24h", regex="^(24h|7d|30d)$"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get comprehensive dashboard statistics.
 
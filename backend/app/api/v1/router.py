@@ -1,6 +1,6 @@
 """API v1 router."""
 from fastapi import APIRouter
-from app.api.v1.endpoints import articles, claims, investigations, sources, health, stats
+from app.api.v1.endpoints import articles, claims, investigations, sources, health, stats, exports, events
 
 api_router = APIRouter()
 
@@ -10,3 +10,5 @@ api_router.include_router(articles.router, prefix="/articles", tags=["articles"]
 api_router.include_router(claims.router, prefix="/claims", tags=["claims"])
 api_router.include_router(investigations.router, prefix="/investigations", tags=["investigations"])
 api_router.include_router(stats.router, prefix="/stats", tags=["stats"])
+api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
+api_router.include_router(events.router, prefix="/events", tags=["events"])
@@ -0,0 +1,92 @@
+"""Sparse fieldsets: the `fields=` query parameter."""
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from app.core.exceptions import ValidationError
+from app.core.http_cache import make_etag
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str], default: Sequence[str]) -> List[str]:
+    """
+    Parse a comma-separated `fields` parameter.
+
+    Args:
+        fields: Raw parameter value, e.g. "id,title,status"
+        allowed: Field names the endpoint can return
+        default: Fields returned when the parameter is omitted
+
+    Returns:
+        Requested field names in request order, without duplicates
+
+    Raises:
+        ValidationError: If a name is unknown or nothing was requested
+    """
+    if not fields:
+        return list(default)
+
+    names = []
+    for part in fields.split(","):
+        name = part.strip()
+        if not name:
+            continue
+        if name not in allowed:
+            raise ValidationError(
+                f"Unknown field '{name}'. Allowed: {', '.join(allowed)}", field="fields"
+            )
+        if name not in names:
+            names.append(name)
+
+    if not names:
+        raise ValidationError("At least one field must be requested", field="fields")
+    return names
+
+
+def project(columns: Dict[str, Any], names: Iterable[str], required: Iterable[str] = ()) -> list:
+    """
+    Labelled columns for the requested fields.
+
+    Only these columns are selected, so unrequested large text columns are
+    never read from Postgres.
+
+    Args:
+        columns: Map of field name -> column expression
+        names: Requested field names (names not in columns are skipped)
+        required: Extra fields needed internally, e.g. sort keys for cursors
+
+    Returns:
+        List of labelled column expressions for select()
+    """
+    wanted = list(names)
+    wanted += [name for name in required if name not in wanted]
+    return [columns[name].label(name) for name in wanted if name in columns]
+
+
+def pick(row, names: Iterable[str]) -> dict:
+    """
+    Build the response dict for a projected row, keeping only requested fields.
+
+    Args:
+        row: Result row selected via project()
+        names: Requested field names
+
+    Returns:
+        Dict of requested fields present on the row
+    """
+    mapping = row._mapping
+    return {name: mapping[name] for name in names if name in mapping}
+
+
+def fieldset_etag(etag: str, names: Sequence[str], default: Sequence[str]) -> str:
+    """
+    ETag for a sparse representation of a resource.
+
+    Args:
+        etag: ETag of the full representation
+        names: Requested field names
+        default: Fields of the full representation
+
+    Returns:
+        The ETag unchanged for the full representation, otherwise one
+        varying with the field list
+    """
+    if list(names) == list(default):
+        return etag
+    return make_etag(etag, *names)
@@ -0,0 +1,41 @@
+"""HTTP conditional request helpers (ETag / If-None-Match)."""
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values that determine a representation.
+
+    Args:
+        parts: Row ids, updated_at timestamps, child counts, etc.
+
+    Returns:
+        Weak ETag header value, e.g. W/"3f2a..."
+    """
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weak prefix so tags compare with the weak comparison function."""
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches an ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    target = _opaque_tag(etag)
+    return any(_opaque_tag(candidate) == target for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 Not Modified response."""
+    return Response(status_code=304, headers={"ETag": etag})
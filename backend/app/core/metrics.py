@@ -0,0 +1,186 @@
+"""Prometheus metrics."""
+import os
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    make_asgi_app,
+    multiprocess,
+    start_http_server,
+)
+
+# Database connection pools (labels: process role, pool name)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the pool (includes connecting)",
+    ["role", "pool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+    ["role", "pool"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool",
+    ["role", "pool"],
+    multiprocess_mode="livesum",
+)
+
+# Pipeline dispatch (label: stage, claim_extraction or fact_checking).
+# Drain rate actually achieved is rate(pipeline_task_duration_seconds_count).
+PIPELINE_BACKLOG = Gauge(
+    "pipeline_backlog",
+    "Items pending in the database at the last sweep",
+    ["stage"],
+    multiprocess_mode="mostrecent",
+)
+PIPELINE_QUEUED = Gauge(
+    "pipeline_queued_tasks",
+    "Tasks waiting in the stage's broker queues at the last sweep",
+    ["stage"],
+    multiprocess_mode="mostrecent",
+)
+PIPELINE_DISPATCH_BATCH = Gauge(
+    "pipeline_dispatch_batch_size",
+    "Items queued by the last sweep",
+    ["stage"],
+    multiprocess_mode="mostrecent",
+)
+PIPELINE_DRAIN_RATE = Gauge(
+    "pipeline_estimated_drain_rate_per_second",
+    "Tasks per second the stage's workers can complete (worker slots / mean task latency)",
+    ["stage"],
+    multiprocess_mode="mostrecent",
+)
+PIPELINE_IDLE_SLOTS = Gauge(
+    "pipeline_idle_worker_slots",
+    "Worker processes serving the stage that were not running a task at the last sweep",
+    ["stage"],
+    multiprocess_mode="mostrecent",
+)
+PIPELINE_TASK_DURATION = Histogram(
+    "pipeline_task_duration_seconds",
+    "Wall time of completed extraction and fact-check tasks",
+    ["stage"],
+    buckets=(1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 240.0),
+)
+WORKER_IDLE_SECONDS = Counter(
+    "celery_worker_idle_seconds_total",
+    "Time worker processes spent waiting between tasks",
+    ["worker"],
+)
+
+# Ollama admission control (labels: model, workload)
+LLM_SLOT_WAIT = Histogram(
+    "llm_slot_wait_seconds",
+    "Time spent queued for an Ollama slot",
+    ["model", "workload"],
+    buckets=(0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+LLM_ADMISSION_TIMEOUTS = Counter(
+    "llm_admission_timeouts_total",
+    "Ollama calls abandoned because no slot freed up in time",
+    ["model", "workload"],
+)
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "Ollama generation time (outcome: ok, slow or error)",
+    ["model", "workload", "outcome"],
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 90.0, 120.0, 180.0),
+)
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "llm_time_to_first_token_seconds",
+    "Time from sending a streamed request to its first token (includes prompt evaluation)",
+    ["model", "workload"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0),
+)
+LLM_TOKENS_PER_SECOND = Histogram(
+    "llm_tokens_per_second",
+    "Generation speed of streamed requests",
+    ["model", "workload"],
+    buckets=(1, 2, 5, 10, 20, 30, 50, 75, 100, 150, 250),
+)
+LLM_EARLY_STOPS = Counter(
+    "llm_early_stops_total",
+    "Streamed JSON generations cut off once the JSON value was complete",
+    ["model", "workload"],
+)
+LLM_PROMPT_TOKENS = Histogram(
+    "llm_prompt_tokens",
+    "Prompt tokens evaluated per request (Ollama's prompt_eval_count)",
+    ["model", "workload"],
+    buckets=(64, 128, 256, 512, 1024, 1536, 2048, 3072, 4096, 8192),
+)
+LLM_EVAL_TOKENS = Histogram(
+    "llm_eval_tokens",
+    "Tokens generated per request (Ollama's eval_count, or streamed chunks when stopped early)",
+    ["model", "workload"],
+    buckets=(16, 32, 64, 128, 256, 384, 512, 1024, 1536, 2048),
+)
+LLM_INPUT_TRUNCATIONS = Counter(
+    "llm_input_truncations_total",
+    "Prompt inputs cut to fit the context budget",
+    ["workload"],
+)
+LLM_BACKEND_REQUESTS = Counter(
+    "llm_backend_requests_total",
+    "LLM calls per inference backend (outcome: ok, slow or error)",
+    ["backend", "model", "outcome"],
+)
+LLM_JSON_RESULTS = Counter(
+    "llm_json_results_total",
+    "JSON generations by parse result (ok, repaired, invalid: parsed but missing required fields, failed: wasted)",
+    ["model", "workload", "result"],
+)
+LLM_TIMEOUT_SECONDS = Gauge(
+    "llm_timeout_seconds",
+    "Current adaptive Ollama timeout",
+    ["model", "workload"],
+    multiprocess_mode="mostrecent",
+)
+LLM_BREAKER_STATE = Gauge(
+    "llm_circuit_breaker_state",
+    "Ollama circuit breaker state (0 closed, 1 half-open, 2 open)",
+    ["model"],
+    multiprocess_mode="mostrecent",
+)
+LLM_BREAKER_REJECTIONS = Counter(
+    "llm_circuit_breaker_rejections_total",
+    "Ollama calls failed fast by the open circuit breaker",
+    ["model", "workload"],
+)
+
+
+def _registry():
+    """
+    Registry to expose.
+
+    With PROMETHEUS_MULTIPROC_DIR set (Celery prefork workers), metrics from
+    every child process are read from that directory and aggregated.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def metrics_app():
+    """ASGI app serving the Prometheus text format, mounted at /metrics."""
+    return make_asgi_app(registry=_registry())
+
+
+def start_metrics_server(port: int):
+    """Serve /metrics on its own port (for processes without an HTTP server)."""
+    start_http_server(port, registry=_registry())
+
+
+def mark_process_dead(pid: int):
+    """Drop a finished child's live gauges in multiprocess mode."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,158 @@
+"""Pagination helpers shared by list endpoints.
+
+Two modes are supported:
+
+- offset mode (``limit``/``offset``), kept for compatibility;
+- keyset mode (``limit``/``cursor``), where ``cursor`` is an opaque token
+  holding the sort-key values of the last row on the previous page. Deep
+  pages cost the same as the first one because Postgres can seek straight
+  to the cursor position instead of scanning and discarding ``offset`` rows.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, literal, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ValidationError
+
+# Allowed values for the ``total_mode`` query parameter
+TOTAL_MODE_PATTERN = "^(exact|estimated|none)$"
+
+
+def _encode_value(value: Any) -> Any:
+    """Convert a sort-key value into something JSON can carry."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort-key values into an opaque URL-safe cursor."""
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[Callable[[Any], Any]]) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string from a previous page
+        types: One converter per sort column (e.g. datetime.fromisoformat, UUID)
+
+    Returns:
+        List of typed sort-key values
+
+    Raises:
+        ValidationError: If the cursor is malformed or does not match the sort key
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(raw, list) or len(raw) != len(types):
+            raise ValueError("cursor does not match sort key")
+        return [convert(value) for convert, value in zip(types, raw)]
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid cursor: {e}", field="cursor")
+
+
+def apply_page(
+    stmt,
+    sort_columns: Sequence[Any],
+    cursor_types: Sequence[Callable[[Any], Any]],
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+):
+    """
+    Order a select by ``sort_columns`` (all descending) and restrict it to one page.
+
+    With a cursor, rows strictly after the cursor position are selected via a
+    row-value comparison; otherwise ``offset`` is applied. One extra row is
+    fetched so split_page can tell whether another page exists.
+    """
+    stmt = stmt.order_by(*[column.desc() for column in sort_columns])
+
+    if cursor:
+        values = decode_cursor(cursor, cursor_types)
+        stmt = stmt.where(
+            tuple_(*sort_columns) < tuple_(*[
+                literal(value, column.type) for column, value in zip(sort_columns, values)
+            ])
+        )
+    elif offset:
+        stmt = stmt.offset(offset)
+
+    return stmt.limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[Any],
+    limit: int,
+    sort_key: Callable[[Any], Sequence[Any]],
+) -> Tuple[Sequence[Any], Optional[str]]:
+    """
+    Trim the look-ahead row fetched by apply_page.
+
+    Returns:
+        Tuple of (rows for this page, cursor for the next page or None)
+    """
+    if len(rows) > limit:
+        page = rows[:limit]
+        return page, encode_cursor(sort_key(page[-1]))
+    return rows, None
+
+
+async def estimate_row_count(db: AsyncSession, table_name: str) -> Optional[int]:
+    """
+    Estimate a table's row count from planner statistics (pg_class.reltuples).
+
+    Partitioned tables are summed over their partitions. Returns None when
+    the table has never been analyzed.
+    """
+    estimate = (await db.execute(
+        text(
+            "SELECT SUM(c.reltuples) FROM pg_class c "
+            "WHERE c.relkind = 'r' AND c.reltuples >= 0 AND ("
+            "  c.oid = to_regclass(:table_name) "
+            "  OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(:table_name))"
+            ")"
+        ),
+        {"table_name": table_name}
+    )).scalar()
+    return int(estimate) if estimate is not None else None
+
+
+async def count_total(
+    db: AsyncSession,
+    stmt,
+    total_mode: str,
+    table_name: str,
+    filtered: bool,
+) -> Optional[int]:
+    """
+    Compute the ``total`` field of a paginated response.
+
+    Args:
+        db: Database session
+        stmt: Filtered select whose row count is the exact total
+        total_mode: 'exact', 'estimated' or 'none'
+        table_name: Table used for the planner estimate
+        filtered: Whether filters apply (estimates only cover whole tables)
+
+    Returns:
+        Total row count, an estimate, or None when not requested
+    """
+    if total_mode == "none":
+        return None
+    if total_mode == "estimated" and not filtered:
+        estimate = await estimate_row_count(db, table_name)
+        if estimate is not None:
+            return estimate
+    return await db.scalar(select(func.count()).select_from(stmt.order_by(None).subquery()))
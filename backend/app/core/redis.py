@@ -0,0 +1,43 @@
+"""Shared Redis clients."""
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.core.logging import logger
+
+_client: Optional[redis.Redis] = None
+_async_client: Optional[aioredis.Redis] = None
+
+
+def get_redis_client() -> redis.Redis:
+    """Return the process-wide synchronous Redis client (connection pooled)."""
+    global _client
+    if _client is None:
+        _client = redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+def get_async_redis_client() -> aioredis.Redis:
+    """Return the process-wide asyncio Redis client (connection pooled)."""
+    global _async_client
+    if _async_client is None:
+        _async_client = aioredis.from_url(settings.REDIS_URL)
+    return _async_client
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """
+    Get a Redis client if Redis is reachable.
+
+    Returns:
+        Redis client or None if unavailable
+    """
+    try:
+        client = get_redis_client()
+        client.ping()
+        return client
+    except Exception as e:
+        logger.warning("redis_unavailable", error=str(e))
+        return None
@@ -0,0 +1,58 @@
+"""Fast JSON response helpers for list endpoints."""
+from typing import Any, Iterable, Optional
+from uuid import UUID
+import orjson
+from fastapi.responses import JSONResponse
+from app.config import settings
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode types orjson doesn't handle natively."""
+    # asyncpg returns its own UUID subclass, which orjson only accepts via default
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def paginated(
+    items: Iterable[dict],
+    total: Optional[int],
+    limit: int,
+    offset: int,
+    next_cursor: Optional[str]
+) -> Any:
+    """
+    Build a PaginatedResponse payload.
+
+    With FAST_JSON_RESPONSES enabled the payload is returned as a
+    FastJSONResponse, which bypasses response_model validation and the stdlib
+    json encoder. Items must then already be JSON-ready dicts (UUIDs and
+    datetimes are handled natively by orjson).
+
+    Args:
+        items: Projected row dicts
+        total: Total row count, or None
+        limit: Page size
+        offset: Offset of this page
+        next_cursor: Keyset cursor for the next page
+
+    Returns:
+        FastJSONResponse or dict (validated by FastAPI as before)
+    """
+    payload = {
+        "items": list(items),
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor
+    }
+    if settings.FAST_JSON_RESPONSES:
+        return FastJSONResponse(payload)
+    return payload
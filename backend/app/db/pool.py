@@ -0,0 +1,106 @@
+"""Connection pool profiles and pool instrumentation."""
+import time
+import uuid
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from app.config import settings
+from app.core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUT_TIMEOUTS, DB_POOL_CHECKOUT_WAIT
+
+
+class _InstrumentedPool:
+    """Pool mixin recording how long each checkout waits for a connection."""
+
+    metrics_name = "primary"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(settings.DB_POOL_ROLE, self.metrics_name).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(settings.DB_POOL_ROLE, self.metrics_name).observe(
+                time.perf_counter() - start
+            )
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep its metrics name
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    """QueuePool with checkout-wait metrics."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout-wait metrics."""
+
+
+class InstrumentedNullPool(_InstrumentedPool, NullPool):
+    """NullPool (PgBouncer mode) with connect-time metrics."""
+
+
+def engine_options(is_async: bool = False, connect_args: Optional[dict] = None) -> dict:
+    """
+    Keyword arguments for create_engine / create_async_engine.
+
+    Pool sizes come from the profile for settings.DB_POOL_ROLE. In PgBouncer
+    mode connections aren't pooled here at all (PgBouncer does that), and
+    asyncpg is told not to keep server-side prepared statements, which
+    don't survive transaction pooling.
+
+    Args:
+        is_async: Options for an asyncpg engine
+        connect_args: Extra DBAPI connect arguments
+
+    Returns:
+        Dictionary of engine keyword arguments
+    """
+    connect_args = dict(connect_args or {})
+    options = {"echo": settings.DB_ECHO}
+
+    if settings.DB_PGBOUNCER_MODE:
+        options["poolclass"] = InstrumentedNullPool
+        if is_async:
+            connect_args.update(
+                statement_cache_size=0,
+                prepared_statement_cache_size=0,
+                prepared_statement_name_func=lambda: f"__asyncpg_{uuid.uuid4()}__",
+            )
+    else:
+        pool_size, max_overflow = settings.db_pool_profile
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=True,  # Verify connections before using
+        )
+
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def instrument_engine(engine, name: str):
+    """
+    Label an engine's pool for metrics and track checked-out connections.
+
+    Args:
+        engine: Engine or AsyncEngine created with engine_options()
+        name: Pool label, e.g. 'primary' or 'replica-0'
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    sync_engine.pool.metrics_name = name
+    checked_out = DB_POOL_CHECKED_OUT.labels(settings.DB_POOL_ROLE, name)
+
+    event.listen(sync_engine, "checkout", lambda *args: checked_out.inc())
+    event.listen(sync_engine, "checkin", lambda *args: checked_out.dec())
@@ -0,0 +1,148 @@
+"""Read-replica selection with replication-lag checks."""
+import asyncio
+import itertools
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.core.logging import logger
+
+# Seconds a replica is behind the primary; 0 when it has replayed all the WAL
+# it received (an idle primary stops advancing pg_last_xact_replay_timestamp).
+# NULL (lag unknown) when no WAL receiver is streaming: a replica cut off from
+# the primary has also replayed everything it received, however stale that is.
+# A server that isn't in recovery reports 0 so plain copies work for local testing.
+LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN NULL "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+# Session.info key naming the replica a session reads from
+REPLICA_INFO_KEY = "read_replica"
+
+
+def is_replica_session(db) -> bool:
+    """Whether a (sync or async) session reads from a replica rather than the primary."""
+    return REPLICA_INFO_KEY in db.info
+
+
+class ReadReplica:
+    """One replica: its engines, session factories and last measured lag."""
+
+    def __init__(self, name: str, engine: Engine, async_engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.async_engine = async_engine
+        # Sessions are tagged so callers can tell replica reads from primary ones
+        info = {REPLICA_INFO_KEY: name}
+        self.session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine, info=info)
+        self.async_session_factory = async_sessionmaker(
+            async_engine, autoflush=False, expire_on_commit=False, info=info
+        )
+        self.lag: Optional[float] = None  # None until checked, or while unreachable
+        self.checked_at = 0.0
+        self._available: Optional[bool] = None
+
+    def record(self, lag: Optional[float], max_lag: float, error: Optional[str] = None):
+        """Store a lag measurement, logging only when the replica changes state."""
+        self.lag = lag
+        available = self.usable(max_lag)
+        if available == self._available:
+            return
+        self._available = available
+        if available:
+            logger.info("read_replica_available", replica=self.name, lag_seconds=lag)
+        else:
+            logger.warning(
+                "read_replica_unavailable",
+                replica=self.name, lag_seconds=lag, max_lag_seconds=max_lag, error=error
+            )
+
+    def usable(self, max_lag: float) -> bool:
+        """Whether the replica answered its last check within max_lag."""
+        return self.lag is not None and self.lag <= max_lag
+
+
+class ReplicaRouter:
+    """
+    Pick a read replica that is reachable and not too far behind the primary.
+
+    Lag is measured at most once per check_interval per replica, from the
+    request path; replicas that are unreachable or lag by more than max_lag
+    are skipped until a later check passes. Healthy replicas are used round
+    robin. When none is healthy the caller falls back to the primary.
+    """
+
+    def __init__(self, replicas: List[ReadReplica], max_lag: float, check_interval: float):
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+
+    def _due(self, replica: ReadReplica) -> bool:
+        """Claim the next lag check for a replica, so concurrent callers don't all probe it."""
+        with self._lock:
+            now = time.monotonic()
+            if now - replica.checked_at < self.check_interval:
+                return False
+            replica.checked_at = now
+            return True
+
+    def _pick(self) -> Optional[ReadReplica]:
+        """Next usable replica in round-robin order, or None."""
+        usable = [replica for replica in self.replicas if replica.usable(self.max_lag)]
+        if not usable:
+            return None
+        return usable[next(self._turn) % len(usable)]
+
+    def _record(self, replica: ReadReplica, lag):
+        """Store a LAG_QUERY result; NULL means the lag is unknown."""
+        if lag is None:
+            replica.record(None, self.max_lag, error="no streaming WAL receiver")
+        else:
+            replica.record(float(lag), self.max_lag)
+
+    def check(self, replica: ReadReplica):
+        """Measure a replica's lag over its sync engine."""
+        try:
+            with replica.engine.connect() as conn:
+                lag = conn.execute(LAG_QUERY).scalar()
+        except Exception as e:
+            replica.record(None, self.max_lag, error=str(e))
+            return
+        self._record(replica, lag)
+
+    async def check_async(self, replica: ReadReplica):
+        """Measure a replica's lag over its async engine."""
+        try:
+            async with replica.async_engine.connect() as conn:
+                lag = (await conn.execute(LAG_QUERY)).scalar()
+        except Exception as e:
+            replica.record(None, self.max_lag, error=str(e))
+            return
+        self._record(replica, lag)
+
+    def choose(self) -> Optional[ReadReplica]:
+        """Refresh stale lag checks and pick a replica (sync callers)."""
+        for replica in self.replicas:
+            if self._due(replica):
+                self.check(replica)
+        return self._pick()
+
+    async def choose_async(self) -> Optional[ReadReplica]:
+        """Refresh stale lag checks and pick a replica (async callers)."""
+        due = [replica for replica in self.replicas if self._due(replica)]
+        if due:
+            await asyncio.gather(*(self.check_async(replica) for replica in due))
+        return self._pick()
@@ -1,20 +1,87 @@
 """Database session management."""
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.config import settings
+from app.db.pool import engine_options, instrument_engine
+from app.db.replicas import ReadReplica, ReplicaRouter
+
+
+def to_async_database_url(url: str) -> str:
+    """Rewrite a psycopg2 database URL to use the asyncpg driver."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
 
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,
-    max_overflow=20,
-    echo=settings.DEBUG,  # Log SQL statements in debug mode
-)
+
+# Create database engine (pool sized by settings.DB_POOL_ROLE)
+engine = create_engine(settings.DATABASE_URL, **engine_options())
+instrument_engine(engine, "primary")
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine used by FastAPI endpoints so queries don't block the event loop
+async_engine = create_async_engine(
+    to_async_database_url(settings.DATABASE_URL),
+    **engine_options(is_async=True)
+)
+instrument_engine(async_engine, "primary_async")
+
+# Async session factory (objects stay usable after commit for serialization)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+def _read_replica(index: int, url: str) -> ReadReplica:
+    """Engines for one read replica; short connect timeouts keep a dead replica from stalling requests."""
+    timeout = settings.READ_REPLICA_CONNECT_TIMEOUT_SECONDS
+    replica = ReadReplica(
+        name=make_url(url).render_as_string(hide_password=True),
+        engine=create_engine(url, **engine_options(connect_args={"connect_timeout": timeout})),
+        async_engine=create_async_engine(
+            to_async_database_url(url),
+            **engine_options(is_async=True, connect_args={"timeout": timeout})
+        ),
+    )
+    instrument_engine(replica.engine, f"replica{index}")
+    instrument_engine(replica.async_engine, f"replica{index}_async")
+    return replica
+
+
+# Routes read-only sessions to replicas (empty when none are configured)
+read_router = ReplicaRouter(
+    [_read_replica(index, url) for index, url in enumerate(settings.read_replica_urls_list)],
+    max_lag=settings.READ_REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.READ_REPLICA_CHECK_INTERVAL_SECONDS,
+)
+
+
+async def async_read_sessionmaker() -> async_sessionmaker:
+    """Async session factory for read-only work: a healthy replica, else the primary."""
+    replica = await read_router.choose_async()
+    return replica.async_session_factory if replica else AsyncSessionLocal
+
+
+def reset_pools_after_fork():
+    """
+    Drop connections inherited from a parent process.
+
+    Called in each Celery prefork child: sharing the parent's sockets
+    between processes corrupts them. close=False leaves the parent's
+    connections open for the parent.
+    """
+    engines = [engine, async_engine.sync_engine]
+    for replica in read_router.replicas:
+        engines += [replica.engine, replica.async_engine.sync_engine]
+    for each in engines:
+        each.dispose(close=False)
+
 
 def get_db():
     """
@@ -26,3 +93,36 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency function to get an async database session.
+    Yields session and ensures it's closed after request.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_read_db():
+    """
+    Dependency function to get a database session for read-only queries.
+    Uses a read replica within READ_REPLICA_MAX_LAG_SECONDS of the primary,
+    falling back to the primary when none is configured or healthy.
+    """
+    replica = read_router.choose()
+    db = replica.session_factory() if replica else SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db():
+    """
+    Dependency function to get an async database session for read-only queries.
+    Replica selection and fallback as in get_read_db.
+    """
+    session_factory = await async_read_sessionmaker()
+    async with session_factory() as db:
+        yield db
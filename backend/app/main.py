@@ -6,7 +6,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.core.logging import setup_logging, logger
 from app.core.exceptions import register_exception_handlers
+from app.core.metrics import metrics_app
 from app.api.v1.router import api_router
+from app.services.cache.investigation_cache import register_cache_invalidation
 
 # Setup logging
 setup_logging()
@@ -35,6 +37,12 @@ register_exception_handlers(app)
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
+# Prometheus metrics (database pool checkout waits etc.)
+app.mount("/metrics", metrics_app())
+
+# Drop cached investigation payloads when their rows change
+register_cache_invalidation()
+
 
 @app.on_event("startup")
 async def startup_event():
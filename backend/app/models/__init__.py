@@ -1,16 +1,20 @@
 """Database models package."""
 from app.models.source import NewsSource
+from app.models.article_content import ArticleContent
 from app.models.article import Article
 from app.models.claim import Claim
 from app.models.investigation import Investigation
 from app.models.evidence import Evidence
+from app.models.investigation_technique import InvestigationTechnique
 from app.models.api_key import APIKey
 
 __all__ = [
     "NewsSource",
+    "ArticleContent",
     "Article",
     "Claim",
     "Investigation",
     "Evidence",
+    "InvestigationTechnique",
     "APIKey",
 ]
@@ -1,34 +1,59 @@
 """Article database model."""
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, Float, ForeignKey, Index
+from sqlalchemy import Column, String, DateTime, Text, Float, Integer, ForeignKey, Index, select, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property
 from app.db.base import Base
+from app.models.article_content import ArticleContent
 
 
 class Article(Base):
-    """Article model for ingested news articles."""
+    """
+    Article model for ingested news articles.
+
+    The table is range-partitioned by month on created_at (see
+    app.services.retention.partitions), so the database primary key is
+    (id, created_at). The ORM still identifies articles by id alone.
+    """
 
     __tablename__ = "articles"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     source_id = Column(UUID(as_uuid=True), ForeignKey("news_sources.id", ondelete="CASCADE"))
     title = Column(Text, nullable=False)
-    url = Column(Text, nullable=False, unique=True)
+    url = Column(Text, nullable=False)  # Unique per ingestion (enforced by the fetcher, not the partitioned table)
     author = Column(String(255))
     published_at = Column(DateTime)
-    content = Column(Text)  # Full article text (PII redacted)
-    content_hash = Column(String(64))  # SHA-256 hash for deduplication
+    content_hash = Column(String(64))  # SHA-256 hash for deduplication; keys article_contents
     influence_score = Column(Float, default=0.0)  # U.S. politics influence score (0.0-1.0)
     status = Column(String(50), default="pending")  # 'pending', 'processing', 'processed', 'verified', 'error'
+    # Denormalised counters, maintained by the claim extraction and fact-check tasks
+    claim_count = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_investigation_count = Column(Integer, nullable=False, default=0, server_default="0")
     extra_metadata = Column(JSONB, default=dict)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, primary_key=True, nullable=False, default=datetime.utcnow)  # Partition key
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Full article text (PII redacted), read from article_contents only when accessed.
+    # Read-only: write bodies with rss_fetcher.store_article_content and set content_hash.
+    content = column_property(
+        select(ArticleContent.content)
+        .where(ArticleContent.content_hash == content_hash)
+        .correlate_except(ArticleContent)
+        .scalar_subquery(),
+        deferred=True
+    )
+
     # Relationships
     source = relationship("NewsSource", back_populates="articles")
-    claims = relationship("Claim", back_populates="article", cascade="all, delete-orphan")
+    # claims.article_id can't carry a foreign key to a partitioned table, so the join is declared here
+    claims = relationship(
+        "Claim",
+        primaryjoin="Article.id == foreign(Claim.article_id)",
+        back_populates="article",
+        cascade="all, delete-orphan"
+    )
 
     # Indexes
     __table_args__ = (
@@ -38,7 +63,16 @@ class Article(Base):
         Index("ix_articles_hash", "content_hash"),
         Index("ix_articles_url", "url"),
         Index("ix_articles_influence", "influence_score"),
+        # Extraction queue: pending articles by influence (see process_pending_articles)
+        Index(
+            "ix_articles_pending_influence", influence_score.desc(),
+            postgresql_where=text("status = 'pending'")
+        ),
+        # Supports the default list ordering (investigation count, created_at, id) DESC
+        Index("ix_articles_investigation_rank", "completed_investigation_count", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
+    __mapper_args__ = {"primary_key": [id]}
 
     def __repr__(self):
         return f"<Article(title='{self.title[:50]}...', status='{self.status}')>"
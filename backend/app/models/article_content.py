@@ -0,0 +1,23 @@
+"""Article content database model."""
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Text
+from app.db.base import Base
+
+
+class ArticleContent(Base):
+    """
+    Article bodies, stored once per distinct content hash.
+
+    Kept apart from articles so scans over the hot metadata columns don't
+    drag the text through the buffer cache. Postgres TOAST compresses the
+    content column transparently.
+    """
+
+    __tablename__ = "article_contents"
+
+    content_hash = Column(String(64), primary_key=True)  # SHA-256 of content
+    content = Column(Text, nullable=False)  # Full article text (PII redacted)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ArticleContent(hash='{self.content_hash[:12]}', length={len(self.content or '')})>"
@@ -1,7 +1,7 @@
 """Claim database model."""
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, Boolean, Float, ForeignKey, Index
+from sqlalchemy import Column, String, DateTime, Text, Boolean, Float, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -13,19 +13,21 @@ class Claim(Base):
     __tablename__ = "claims"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    article_id = Column(UUID(as_uuid=True), ForeignKey("articles.id", ondelete="CASCADE"))
+    article_id = Column(UUID(as_uuid=True))  # articles is partitioned; no FK (see Article.claims)
     claim_text = Column(Text, nullable=False)
     claim_type = Column(String(50))  # 'factual', 'opinion', 'prediction', 'statistic'
     context = Column(Text)  # Surrounding context from article
     is_checkable = Column(Boolean, default=True)
     extraction_confidence = Column(Float)  # 0.0 to 1.0
     status = Column(String(50), default="pending")  # 'pending', 'checking', 'verified', 'error'
+    # Denormalised from Article.influence_score so the fact-check queue is ordered without a join
+    priority = Column(Float, nullable=False, default=0.0, server_default="0")
     extra_metadata = Column(JSONB, default=dict)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    article = relationship("Article", back_populates="claims")
+    article = relationship("Article", primaryjoin="foreign(Claim.article_id) == Article.id", back_populates="claims")
     investigations = relationship("Investigation", back_populates="claim", cascade="all, delete-orphan")
 
     # Indexes
@@ -34,6 +36,11 @@ class Claim(Base):
         Index("ix_claims_status", "status"),
         Index("ix_claims_checkable", "is_checkable"),
         Index("ix_claims_type", "claim_type"),
+        # Fact-check queue: pending, checkable claims by priority (see process_pending_claims)
+        Index(
+            "ix_claims_pending_priority", priority.desc(),
+            postgresql_where=text("status = 'pending' AND is_checkable")
+        ),
     )
 
     def __repr__(self):
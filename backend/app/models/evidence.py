@@ -35,6 +35,7 @@ class Evidence(Base):
         Index("ix_evidence_stance", "stance"),
         Index("ix_evidence_relevance", "relevance_score"),
         Index("ix_evidence_reliability", "source_reliability"),
+        Index("ix_evidence_created", "created_at", "id"),
     )
 
     def __repr__(self):
@@ -31,6 +31,7 @@ class Investigation(Base):
     # Relationships
     claim = relationship("Claim", back_populates="investigations")
     evidence = relationship("Evidence", back_populates="investigation", cascade="all, delete-orphan")
+    techniques = relationship("InvestigationTechnique", back_populates="investigation", cascade="all, delete-orphan")
 
     # Indexes
     __table_args__ = (
@@ -38,6 +39,13 @@ class Investigation(Base):
         Index("ix_investigations_verdict", "verdict"),
         Index("ix_investigations_confidence", "confidence_score"),
         Index("ix_investigations_status", "status"),
+        Index("ix_investigations_updated", "updated_at", "id"),
+        Index("ix_investigations_created", "created_at", "id"),  # List sort key
+        # Containment (@>) queries on the raw detector output
+        Index(
+            "ix_investigations_propaganda_signals", "propaganda_signals",
+            postgresql_using="gin", postgresql_ops={"propaganda_signals": "jsonb_path_ops"}
+        ),
     )
 
     def __repr__(self):
@@ -0,0 +1,36 @@
+"""Investigation propaganda technique database model."""
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+
+
+class InvestigationTechnique(Base):
+    """
+    One propaganda technique detected in an investigated claim.
+
+    Normalised copy of Investigation.propaganda_signals["techniques_detected"],
+    so technique counts and per-source rankings are plain indexed aggregates.
+    """
+
+    __tablename__ = "investigation_techniques"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    investigation_id = Column(UUID(as_uuid=True), ForeignKey("investigations.id", ondelete="CASCADE"), nullable=False)
+    technique = Column(String(100), nullable=False)  # Normalised name, e.g. 'appeal_to_fear'
+    confidence = Column(Float)  # 0.0 to 1.0
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    investigation = relationship("Investigation", back_populates="techniques")
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_investigation_techniques_investigation", "investigation_id"),
+        Index("ix_investigation_techniques_technique", "technique", "investigation_id"),
+    )
+
+    def __repr__(self):
+        return f"<InvestigationTechnique(technique='{self.technique}', confidence={self.confidence})>"
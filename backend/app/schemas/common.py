@@ -1,18 +1,38 @@
 """Common Pydantic schemas."""
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
+from uuid import UUID
+from app.config import settings
 
 
 class PaginatedResponse(BaseModel):
     """Paginated response wrapper."""
     items: list
-    total: int
+    total: Optional[int] = None  # None when total_mode=none
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # Opaque keyset cursor for the next page
 
 
 class MessageResponse(BaseModel):
     """Simple message response."""
     message: str
     detail: Optional[str] = None
+
+
+class BatchGetRequest(BaseModel):
+    """Request body for :batchGet endpoints."""
+    ids: List[UUID] = Field(..., min_length=1, max_length=settings.BATCH_GET_MAX_IDS)
+
+
+class BatchGetItem(BaseModel):
+    """One :batchGet result; `item` is None when the id was not found."""
+    id: UUID
+    found: bool
+    item: Optional[dict] = None
+
+
+class BatchGetResponse(BaseModel):
+    """:batchGet results, in request order."""
+    items: List[BatchGetItem]
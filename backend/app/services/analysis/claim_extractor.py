@@ -2,8 +2,10 @@
 import json
 from typing import List, Dict, Any
 from sqlalchemy.orm import Session
+from app.services.llm.budget import fit_input
+from app.services.llm.errors import LLMUnavailableError
 from app.services.llm.ollama_client import OllamaClient
-from app.services.llm.prompts import CLAIM_EXTRACTION_PROMPT
+from app.services.llm.prompts import CLAIM_EXTRACTION_PROMPT, CLAIM_EXTRACTION_SCHEMA
 from app.models.article import Article
 from app.models.claim import Claim
 from app.core.logging import logger
@@ -13,7 +15,7 @@ class ClaimExtractor:
     """Extract verifiable claims from articles using LLM."""
 
     def __init__(self):
-        self.ollama_client = OllamaClient()
+        self.ollama_client = OllamaClient(workload="extraction")
 
     async def extract_claims(self, article: Article, db: Session) -> List[Claim]:
         """
@@ -31,8 +33,11 @@ class ClaimExtractor:
             return []
 
         try:
-            # Format prompt with article content
-            prompt = CLAIM_EXTRACTION_PROMPT.format(article_text=article.content)
+            # Format prompt with article content, cut to the context budget
+            article_text = fit_input(
+                CLAIM_EXTRACTION_PROMPT, article.content, self.ollama_client.profile, "extraction"
+            )
+            prompt = CLAIM_EXTRACTION_PROMPT.format(article_text=article_text)
 
             # Call Ollama with retry logic
             claims_data = await self._extract_with_retry(prompt)
@@ -51,7 +56,8 @@ class ClaimExtractor:
                     context=claim_dict.get('context', ''),
                     is_checkable=claim_dict.get('checkability', 0.0) > 0.5,
                     extraction_confidence=claim_dict.get('checkability', 0.0),
-                    status='pending'
+                    status='pending',
+                    priority=article.influence_score or 0.0
                 )
                 claims.append(claim)
 
@@ -75,7 +81,7 @@ class ClaimExtractor:
         """
         for attempt in range(max_retries):
             try:
-                result = await self.ollama_client.generate_json(prompt)
+                result = await self.ollama_client.generate_json(prompt, schema=CLAIM_EXTRACTION_SCHEMA)
 
                 # Handle case where result is a dict with 'claims' key
                 if isinstance(result, dict) and 'claims' in result:
@@ -95,6 +101,9 @@ class ClaimExtractor:
                 if attempt < max_retries - 1:
                     continue
                 return []
+            except LLMUnavailableError:
+                # Saturated or circuit open; trying again here can't help
+                raise
             except Exception as e:
                 logger.error("ollama_error", attempt=attempt+1, error=str(e))
                 if attempt < max_retries - 1:
@@ -1,6 +1,6 @@
 """Service for searching evidence for claims."""
 from typing import List, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy import or_
 from app.models.article import Article
 from app.models.claim import Claim
@@ -42,7 +42,8 @@ class EvidenceSearcher:
                 return []
 
             # Search articles containing keywords
-            query = db.query(Article).filter(
+            # Content is deferred on Article; every match needs it for snippets
+            query = db.query(Article).options(undefer(Article.content)).filter(
                 Article.status == 'processed'
             )
 
@@ -1,8 +1,10 @@
 """Service for fact-checking claims using evidence and Ollama LLM."""
 from typing import List
 from sqlalchemy.orm import Session
+from app.services.llm.budget import fit_items
+from app.services.llm.errors import LLMUnavailableError
 from app.services.llm.ollama_client import OllamaClient
-from app.services.llm.prompts import FACT_CHECKING_PROMPT
+from app.services.llm.prompts import FACT_CHECKING_PROMPT, FACT_CHECKING_SCHEMA
 from app.models.claim import Claim
 from app.models.investigation import Investigation
 from app.models.evidence import Evidence
@@ -13,7 +15,7 @@ class FactChecker:
     """Fact-check claims using evidence and LLM analysis."""
 
     def __init__(self):
-        self.ollama_client = OllamaClient()
+        self.ollama_client = OllamaClient(workload="fact_check")
 
     async def fact_check_claim(
         self,
@@ -33,8 +35,15 @@ class FactChecker:
             Investigation object (not yet committed to DB)
         """
         try:
-            # Format evidence for prompt
-            evidence_text = self._format_evidence(evidence_list)
+            # Format evidence for prompt; whole trailing items are dropped
+            # when it doesn't fit the context budget
+            evidence_items = fit_items(
+                FACT_CHECKING_PROMPT + claim.claim_text,
+                self._format_evidence(evidence_list),
+                self.ollama_client.profile,
+                "fact_check"
+            )
+            evidence_text = "\n".join(evidence_items) or "No evidence found."
 
             # Format prompt
             prompt = FACT_CHECKING_PROMPT.format(
@@ -89,7 +98,7 @@ class FactChecker:
             logger.error("fact_check_failed", claim_id=str(claim.id), error=str(e))
             raise
 
-    def _format_evidence(self, evidence_list: List[Evidence]) -> str:
+    def _format_evidence(self, evidence_list: List[Evidence]) -> List[str]:
         """
         Format evidence list for prompt.
 
@@ -97,11 +106,8 @@ class FactChecker:
             evidence_list: List of Evidence records
 
         Returns:
-            Formatted string of evidence for LLM prompt
+            One formatted entry per evidence record, in order
         """
-        if not evidence_list:
-            return "No evidence found."
-
         formatted = []
         for i, evidence in enumerate(evidence_list, 1):
             formatted.append(
@@ -111,7 +117,7 @@ class FactChecker:
                 f"   Snippet: {evidence.snippet}\n"
             )
 
-        return "\n".join(formatted)
+        return formatted
 
     async def _check_with_retry(self, prompt: str, max_retries: int = 3) -> dict:
         """
@@ -126,7 +132,7 @@ class FactChecker:
         """
         for attempt in range(max_retries):
             try:
-                result = await self.ollama_client.generate_json(prompt)
+                result = await self.ollama_client.generate_json(prompt, schema=FACT_CHECKING_SCHEMA)
 
                 # Validate required fields
                 if isinstance(result, dict) and 'verdict' in result:
@@ -137,6 +143,9 @@ class FactChecker:
                         continue
                     return {}
 
+            except LLMUnavailableError:
+                # Saturated or circuit open; trying again here can't help
+                raise
             except Exception as e:
                 logger.error("ollama_error", attempt=attempt+1, error=str(e))
                 if attempt < max_retries - 1:
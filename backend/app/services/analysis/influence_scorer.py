@@ -24,7 +24,8 @@ class InfluenceScorer:
     def calculate_influence_score(
         self,
         article: Article,
-        source: Optional[NewsSource] = None
+        source: Optional[NewsSource] = None,
+        content: Optional[str] = None
     ) -> float:
         """
         Calculate influence score (0.0 to 1.0) based on:
@@ -35,6 +36,8 @@ class InfluenceScorer:
         Args:
             article: Article to score
             source: NewsSource (optional, will use article.source if available)
+            content: Article text (optional, defaults to article.content; pass it for
+                articles not yet flushed, whose deferred content can't be loaded)
 
         Returns:
             Float between 0.0 and 1.0 representing political influence
@@ -53,11 +56,13 @@ class InfluenceScorer:
                 score += 0.2
 
         # Political keyword density in content (0.0 - 0.4)
-        if article.content:
-            content_lower = article.content.lower()
+        if content is None:
+            content = article.content
+        if content:
+            content_lower = content.lower()
             keyword_count = sum(1 for keyword in self.POLITICAL_KEYWORDS if keyword in content_lower)
             # Normalize by content length (per 1000 chars)
-            density = (keyword_count / (len(article.content) / 1000)) if article.content else 0
+            density = keyword_count / (len(content) / 1000)
             score += min(0.4, density * 0.1)
 
         # Title relevance (0.0 - 0.2)
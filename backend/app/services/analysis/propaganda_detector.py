@@ -1,15 +1,69 @@
 """Service for detecting propaganda in text."""
-from typing import Dict, Any
+import re
+from typing import Dict, Any, List, Optional, Tuple
+from app.services.llm.budget import fit_input
+from app.services.llm.errors import LLMUnavailableError
 from app.services.llm.ollama_client import OllamaClient
-from app.services.llm.prompts import PROPAGANDA_DETECTION_PROMPT
+from app.services.llm.prompts import PROPAGANDA_DETECTION_PROMPT, PROPAGANDA_DETECTION_SCHEMA
 from app.core.logging import logger
 
+# Longest technique name stored in investigation_techniques
+MAX_TECHNIQUE_LENGTH = 100
+
+
+def normalize_technique(name: str) -> str:
+    """Normalise an LLM technique name, e.g. 'Appeal to fear' -> 'appeal_to_fear'."""
+    return re.sub(r"[\s-]+", "_", name.strip()).lower()[:MAX_TECHNIQUE_LENGTH]
+
+
+def extract_techniques(signals: Optional[Dict[str, Any]]) -> List[Tuple[str, Optional[float]]]:
+    """
+    Flatten detector output into (technique, confidence) pairs.
+
+    Entries may be {technique, confidence, evidence} objects or bare names.
+    Names are normalised and each technique is kept once, at its highest
+    confidence.
+
+    Args:
+        signals: Result of PropagandaDetector.detect_propaganda
+
+    Returns:
+        List of (technique, confidence) tuples
+    """
+    if not isinstance(signals, dict):
+        return []
+
+    entries = signals.get('techniques_detected')
+    if not isinstance(entries, list):
+        return []
+
+    techniques: Dict[str, Optional[float]] = {}
+    for entry in entries:
+        if isinstance(entry, dict):
+            name, confidence = entry.get('technique'), entry.get('confidence')
+        else:
+            name, confidence = entry, None
+
+        if not isinstance(name, str) or not name.strip():
+            continue
+        try:
+            confidence = max(0.0, min(1.0, float(confidence))) if confidence is not None else None
+        except (TypeError, ValueError):
+            confidence = None
+
+        name = normalize_technique(name)
+        current = techniques.get(name)
+        if name not in techniques or (confidence is not None and (current is None or confidence > current)):
+            techniques[name] = confidence
+
+    return list(techniques.items())
+
 
 class PropagandaDetector:
     """Detect propaganda techniques in text using LLM."""
 
     def __init__(self):
-        self.ollama_client = OllamaClient()
+        self.ollama_client = OllamaClient(workload="propaganda")
 
     async def detect_propaganda(self, text: str) -> Dict[str, Any]:
         """
@@ -22,10 +76,15 @@ class PropagandaDetector:
             Dictionary with:
             - techniques_detected: list of {technique, confidence, evidence}
             - overall_propaganda_score: float (0.0-1.0)
+
+        Raises:
+            LLMUnavailableError: Ollama can't take the call right now
         """
         try:
-            # Format prompt with text
-            prompt = PROPAGANDA_DETECTION_PROMPT.format(text=text)
+            # Format prompt with text, cut to the context budget
+            prompt = PROPAGANDA_DETECTION_PROMPT.format(
+                text=fit_input(PROPAGANDA_DETECTION_PROMPT, text, self.ollama_client.profile, "propaganda")
+            )
 
             # Call Ollama with retry logic
             result = await self._detect_with_retry(prompt)
@@ -52,6 +111,9 @@ class PropagandaDetector:
 
             return result
 
+        except LLMUnavailableError:
+            # Let the task defer the claim rather than store empty signals
+            raise
         except Exception as e:
             logger.error("propaganda_detection_failed", error=str(e))
             return {
@@ -76,7 +138,7 @@ class PropagandaDetector:
         """
         for attempt in range(max_retries):
             try:
-                result = await self.ollama_client.generate_json(prompt)
+                result = await self.ollama_client.generate_json(prompt, schema=PROPAGANDA_DETECTION_SCHEMA)
 
                 # Validate result format
                 if isinstance(result, dict) and 'overall_propaganda_score' in result:
@@ -108,6 +170,9 @@ class PropagandaDetector:
                         'overall_propaganda_score': 0.0
                     }
 
+            except LLMUnavailableError:
+                # Saturated or circuit open; trying again here can't help
+                raise
             except Exception as e:
                 logger.error(
                     "ollama_propaganda_error",
@@ -0,0 +1,100 @@
+"""Redis-backed cache for completed investigation detail responses.
+
+Completed investigations are effectively immutable, so their serialized
+detail payload (plus ETag) is cached in Redis and served without touching
+Postgres. Entries are dropped whenever an Investigation or Evidence row
+for that investigation is flushed, via SQLAlchemy session events that fire
+in whichever process performs the write (API or Celery worker). The TTL
+bounds staleness for changes made outside the ORM.
+"""
+import json
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.logging import logger
+from app.core.redis import get_async_redis_client, get_redis_client
+from app.models.evidence import Evidence
+from app.models.investigation import Investigation
+
+CACHE_KEY = "investigation:detail:{}"
+
+# session.info key collecting investigation ids touched in the current transaction
+_PENDING_KEY = "invalidated_investigation_ids"
+
+
+async def get_cached_investigation(investigation_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached investigation payload.
+
+    Returns:
+        Dict with 'etag' and 'body', or None on miss or Redis failure
+    """
+    if not settings.INVESTIGATION_CACHE_ENABLED:
+        return None
+    try:
+        cached = await get_async_redis_client().get(CACHE_KEY.format(investigation_id))
+        return json.loads(cached) if cached else None
+    except Exception as e:
+        logger.warning("investigation_cache_get_failed", error=str(e))
+        return None
+
+
+async def cache_investigation(investigation_id: str, etag: str, body: Dict[str, Any]) -> None:
+    """Store a JSON-ready investigation payload and its ETag."""
+    if not settings.INVESTIGATION_CACHE_ENABLED:
+        return
+    try:
+        await get_async_redis_client().setex(
+            CACHE_KEY.format(investigation_id),
+            settings.INVESTIGATION_CACHE_TTL_SECONDS,
+            json.dumps({"etag": etag, "body": body}),
+        )
+    except Exception as e:
+        logger.warning("investigation_cache_set_failed", error=str(e))
+
+
+def invalidate_investigations(investigation_ids: Iterable[str]) -> None:
+    """Drop cached payloads for the given investigation ids."""
+    keys = [CACHE_KEY.format(i) for i in investigation_ids]
+    if not keys:
+        return
+    try:
+        get_redis_client().delete(*keys)
+    except Exception as e:
+        logger.warning("investigation_cache_invalidate_failed", error=str(e))
+
+
+def _collect_invalidations(session: Session, flush_context, instances) -> None:
+    """Record investigations whose rows changed in this flush."""
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for obj in list(session.dirty) + list(session.deleted) + list(session.new):
+        if isinstance(obj, Investigation) and obj.id is not None:
+            pending.add(str(obj.id))
+        elif isinstance(obj, Evidence) and obj.investigation_id is not None:
+            pending.add(str(obj.investigation_id))
+
+
+def _apply_invalidations(session: Session) -> None:
+    """Invalidate collected ids once the transaction has committed."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        invalidate_investigations(pending)
+
+
+def _discard_invalidations(session: Session) -> None:
+    """Forget collected ids when the transaction rolls back."""
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_cache_invalidation() -> None:
+    """Attach the invalidation listeners to all ORM sessions (idempotent)."""
+    if not settings.INVESTIGATION_CACHE_ENABLED:
+        return
+    if event.contains(Session, "before_flush", _collect_invalidations):
+        return
+    event.listen(Session, "before_flush", _collect_invalidations)
+    event.listen(Session, "after_commit", _apply_invalidations)
+    event.listen(Session, "after_rollback", _discard_invalidations)
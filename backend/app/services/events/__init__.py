@@ -0,0 +1 @@
+"""Pipeline event publishing package."""
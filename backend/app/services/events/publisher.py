@@ -0,0 +1,94 @@
+"""Publish pipeline events to Redis pub/sub.
+
+Celery tasks call these helpers after their database commit so that
+subscribers (the SSE endpoint) only ever see committed state. Publishing
+is best-effort: a Redis outage is logged and never fails the task.
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.logging import logger
+from app.core.redis import get_redis_client
+from app.services.stats.dashboard_stats import get_processing_queue_status
+
+# Redis pub/sub channel carrying all pipeline events
+EVENTS_CHANNEL = "factcheck:events"
+
+# Event types
+INVESTIGATION_CREATED = "investigation.created"
+ARTICLE_PROCESSED = "article.processed"
+QUEUE_DEPTH = "queue.depth"
+
+# Held for PIPELINE_QUEUE_DEPTH_INTERVAL_SECONDS by whichever worker last published the depth
+QUEUE_DEPTH_GUARD_KEY = "factcheck:events:queue_depth_guard"
+# Set while a trailing publish is scheduled for the end of the current window
+QUEUE_DEPTH_TRAILING_KEY = "factcheck:events:queue_depth_trailing"
+QUEUE_DEPTH_TRAILING_TTL_SECONDS = 60  # A trailing publish that never ran stops blocking new ones
+
+
+def publish_event(event_type: str, data: Dict[str, Any]) -> None:
+    """
+    Publish an event to the pipeline events channel.
+
+    Args:
+        event_type: Event type name (e.g. 'investigation.created')
+        data: JSON-serializable event payload
+    """
+    message = json.dumps({
+        "type": event_type,
+        "data": data,
+        "timestamp": datetime.utcnow().isoformat(),
+    }, default=str)
+
+    try:
+        get_redis_client().publish(EVENTS_CHANNEL, message)
+    except Exception as e:
+        logger.warning("event_publish_failed", event_type=event_type, error=str(e))
+
+
+def publish_queue_depth(db: Session) -> Optional[float]:
+    """
+    Publish the current processing queue depth.
+
+    Every finished task calls this, and the depth takes several count
+    queries, so across all workers it is published at most once per
+    PIPELINE_QUEUE_DEPTH_INTERVAL_SECONDS. A change inside a window can't
+    simply be dropped: if it is the last one (the queue just drained),
+    subscribers would keep the stale depth. The first call throttled in a
+    window claims a trailing publish instead, for the caller to schedule.
+
+    Returns:
+        Seconds until the window closes when this call claimed the trailing
+        publish, else None
+    """
+    redis = get_redis_client()
+    try:
+        if not redis.set(QUEUE_DEPTH_GUARD_KEY, 1, nx=True, ex=settings.PIPELINE_QUEUE_DEPTH_INTERVAL_SECONDS):
+            if not redis.set(QUEUE_DEPTH_TRAILING_KEY, 1, nx=True, ex=QUEUE_DEPTH_TRAILING_TTL_SECONDS):
+                return None
+            # -2: the window closed in the meantime
+            remaining_ms = redis.pttl(QUEUE_DEPTH_GUARD_KEY)
+            return max(remaining_ms, 0) / 1000
+    except Exception as e:
+        logger.warning("event_publish_failed", event_type=QUEUE_DEPTH, error=str(e))
+        return None
+
+    try:
+        queue = get_processing_queue_status(db)
+    except Exception as e:
+        logger.warning("queue_depth_query_failed", error=str(e))
+        return None
+    publish_event(QUEUE_DEPTH, queue)
+    return None
+
+
+def release_trailing_publish() -> None:
+    """Let the next throttled call claim a trailing publish again."""
+    try:
+        get_redis_client().delete(QUEUE_DEPTH_TRAILING_KEY)
+    except Exception as e:
+        logger.warning("event_publish_failed", event_type=QUEUE_DEPTH, error=str(e))
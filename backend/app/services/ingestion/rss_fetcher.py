@@ -2,15 +2,19 @@
 import hashlib
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from time import mktime
+from uuid import UUID
 
 import feedparser
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.models.source import NewsSource
 from app.models.article import Article
+from app.models.article_content import ArticleContent
 from app.services.analysis.influence_scorer import InfluenceScorer
 
 # Set up logging
@@ -32,6 +36,24 @@ def calculate_content_hash(content: str) -> str:
     return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
 
+def store_article_content(db: Session, content: str, content_hash: str) -> None:
+    """
+    Store an article body in article_contents, once per distinct hash.
+
+    Args:
+        db: Database session
+        content: Article content (PII redacted)
+        content_hash: Hash from calculate_content_hash
+    """
+    if not content:
+        return
+    db.execute(
+        insert(ArticleContent)
+        .values(content_hash=content_hash, content=content)
+        .on_conflict_do_nothing(index_elements=[ArticleContent.content_hash])
+    )
+
+
 def redact_article_content(content: str) -> str:
     """
     Redact personally identifiable information from article content.
@@ -139,7 +161,7 @@ def extract_article_content(entry: Dict) -> str:
     return ""
 
 
-def fetch_and_store_articles(source: NewsSource, db: Session) -> int:
+def fetch_and_store_articles(source: NewsSource, db: Session) -> List[Tuple[UUID, float]]:
     """
     Fetch articles from RSS source and store them in the database.
 
@@ -148,12 +170,15 @@ def fetch_and_store_articles(source: NewsSource, db: Session) -> int:
         db: Database session
 
     Returns:
-        Count of new articles added
+        (id, influence_score) of each new article added
 
     Raises:
         Exception: If critical error occurs during fetching
     """
-    new_articles_count = 0
+    new_articles = []
+    # URLs added in this batch; the session doesn't autoflush, so the
+    # existence query below can't see them
+    batch_urls = set()
 
     try:
         # Fetch RSS feed entries
@@ -167,12 +192,16 @@ def fetch_and_store_articles(source: NewsSource, db: Session) -> int:
                     logger.warning("Skipping entry without URL")
                     continue
 
+                # articles is partitioned, so url can't carry a unique constraint.
+                # Serialise concurrent fetchers on the URL until this transaction commits.
+                db.execute(select(func.pg_advisory_xact_lock(func.hashtext(article_url))))
+
                 # Check if article already exists by URL
                 existing_article = db.query(Article).filter(
                     Article.url == article_url
                 ).first()
 
-                if existing_article:
+                if existing_article or article_url in batch_urls:
                     logger.debug(f"Article already exists: {article_url}")
                     continue
 
@@ -190,6 +219,9 @@ def fetch_and_store_articles(source: NewsSource, db: Session) -> int:
                 # Calculate content hash for deduplication
                 content_hash = calculate_content_hash(redacted_content)
 
+                # Bodies live in article_contents; identical bodies are stored once
+                store_article_content(db, redacted_content, content_hash)
+
                 # Create new article
                 new_article = Article(
                     source_id=source.id,
@@ -197,22 +229,27 @@ def fetch_and_store_articles(source: NewsSource, db: Session) -> int:
                     url=article_url,
                     author=author,
                     published_at=published_at,
-                    content=redacted_content,
                     content_hash=content_hash,
                     status="pending"
                 )
 
                 # Calculate and set influence score
                 scorer = InfluenceScorer()
-                new_article.influence_score = scorer.calculate_influence_score(new_article, source)
+                new_article.influence_score = scorer.calculate_influence_score(
+                    new_article, source, content=redacted_content
+                )
 
                 db.add(new_article)
-                new_articles_count += 1
+                batch_urls.add(article_url)
+                new_articles.append(new_article)
                 logger.info(f"Added new article: {title[:50]}...")
 
             except IntegrityError as e:
-                # Handle unique constraint violations (duplicate URLs)
+                # Handle unique constraint violations (duplicate URLs);
+                # the rollback discards the articles added so far
                 db.rollback()
+                new_articles.clear()
+                batch_urls.clear()
                 logger.warning(f"Duplicate article detected: {e}")
                 continue
 
@@ -224,14 +261,16 @@ def fetch_and_store_articles(source: NewsSource, db: Session) -> int:
         # Update source's last_fetched_at timestamp
         source.last_fetched_at = datetime.utcnow()
 
-        # Commit all changes
+        # Commit all changes, keeping what the extraction tasks are routed by
+        db.flush()
+        added = [(article.id, article.influence_score) for article in new_articles]
         db.commit()
 
         logger.info(
-            f"Successfully fetched {new_articles_count} new articles from {source.name}"
+            f"Successfully fetched {len(added)} new articles from {source.name}"
         )
 
-        return new_articles_count
+        return added
 
     except Exception as e:
         db.rollback()
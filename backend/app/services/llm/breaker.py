@@ -0,0 +1,199 @@
+"""Circuit breaker for Ollama, shared by every worker through Redis.
+
+Closed: calls go through and their outcomes are counted in 10-second
+buckets. Once a window of OLLAMA_BREAKER_WINDOW_SECONDS holds at least
+OLLAMA_BREAKER_MIN_CALLS calls and the error rate or the share of slow
+calls crosses its threshold, the breaker opens.
+
+Open: calls fail immediately with CircuitOpenError for
+OLLAMA_BREAKER_OPEN_SECONDS.
+
+Half-open: after that, exactly one caller is let through as a probe. Its
+success closes the breaker with fresh counters; its failure opens it for
+another period. Everyone else keeps failing fast meanwhile.
+"""
+import time
+import uuid
+from typing import List, Optional
+
+from app.config import settings
+from app.core.logging import logger
+from app.core.metrics import LLM_BREAKER_REJECTIONS, LLM_BREAKER_STATE
+from app.core.redis import get_redis_client
+from app.services.llm.errors import CircuitOpenError
+
+KEY_PREFIX = "factcheck:llm:{model}"
+BUCKET_SECONDS = 10
+
+# Values of the llm_circuit_breaker_state gauge
+STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+# KEYS: state, probe   ARGV: now (ms), open period (ms), probe ttl (ms), token
+_ALLOW_SCRIPT = """
+local state = redis.call('HGET', KEYS[1], 'state')
+if not state or state == 'closed' then
+    return 'closed'
+end
+local opened_at = tonumber(redis.call('HGET', KEYS[1], 'opened_at')) or 0
+if tonumber(ARGV[1]) - opened_at < tonumber(ARGV[2]) then
+    return 'open'
+end
+if redis.call('SET', KEYS[2], ARGV[4], 'NX', 'PX', ARGV[3]) then
+    redis.call('HSET', KEYS[1], 'state', 'half_open')
+    return 'probe'
+end
+return 'open'
+"""
+
+# KEYS: state, probe, current bucket, every bucket in the window
+# ARGV: outcome (ok/slow/error), token if probing, now (ms), min calls,
+#       error rate, slow rate, bucket ttl (ms)
+# Returns the new state, or 'opened' / 'reclosed' / 'reopened' on a transition
+_RECORD_SCRIPT = """
+local outcome, token, now = ARGV[1], ARGV[2], ARGV[3]
+if token ~= '' then
+    if redis.call('GET', KEYS[2]) ~= token then
+        return redis.call('HGET', KEYS[1], 'state') or 'closed'
+    end
+    redis.call('DEL', KEYS[2])
+    if outcome == 'ok' then
+        redis.call('HSET', KEYS[1], 'state', 'closed')
+        for i = 4, #KEYS do
+            redis.call('DEL', KEYS[i])
+        end
+        return 'reclosed'
+    end
+    redis.call('HSET', KEYS[1], 'state', 'open', 'opened_at', now)
+    return 'reopened'
+end
+
+redis.call('HINCRBY', KEYS[3], 'calls', 1)
+if outcome ~= 'ok' then
+    redis.call('HINCRBY', KEYS[3], outcome, 1)
+end
+redis.call('PEXPIRE', KEYS[3], ARGV[7])
+
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+if state ~= 'closed' then
+    return state
+end
+local calls, errors, slow = 0, 0, 0
+for i = 4, #KEYS do
+    local bucket = redis.call('HMGET', KEYS[i], 'calls', 'error', 'slow')
+    calls = calls + (tonumber(bucket[1]) or 0)
+    errors = errors + (tonumber(bucket[2]) or 0)
+    slow = slow + (tonumber(bucket[3]) or 0)
+end
+if calls >= tonumber(ARGV[4]) and
+        (errors / calls >= tonumber(ARGV[5]) or slow / calls >= tonumber(ARGV[6])) then
+    redis.call('HSET', KEYS[1], 'state', 'open', 'opened_at', now)
+    return 'opened'
+end
+return 'closed'
+"""
+
+# KEYS: probe   ARGV: token
+_ABANDON_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+end
+return 1
+"""
+
+
+class CircuitBreaker:
+    """Error-rate and latency circuit breaker for one model."""
+
+    def __init__(self, model: str):
+        self.model = model
+        prefix = KEY_PREFIX.format(model=model)
+        self.state_key = f"{prefix}:breaker"
+        self.probe_key = f"{prefix}:breaker:probe"
+        self.bucket_prefix = f"{prefix}:breaker:calls:"
+
+    def _window_keys(self, now: float) -> List[str]:
+        """Bucket keys covering the window, current bucket first."""
+        current = int(now) // BUCKET_SECONDS
+        count = max(settings.OLLAMA_BREAKER_WINDOW_SECONDS // BUCKET_SECONDS, 1)
+        return [f"{self.bucket_prefix}{current - i}" for i in range(count)]
+
+    def _set_state(self, state: str):
+        LLM_BREAKER_STATE.labels(self.model).set(STATE_VALUES[state])
+
+    def allow(self, workload: str) -> Optional[str]:
+        """
+        Admit a call or fail fast.
+
+        Args:
+            workload: Caller's workload, for the rejection metric
+
+        Returns:
+            A probe token when this call is the half-open probe, else None
+
+        Raises:
+            CircuitOpenError: The breaker is open
+        """
+        token = uuid.uuid4().hex
+        try:
+            result = get_redis_client().eval(
+                _ALLOW_SCRIPT, 2, self.state_key, self.probe_key,
+                int(time.time() * 1000),
+                int(settings.OLLAMA_BREAKER_OPEN_SECONDS * 1000),
+                int(settings.OLLAMA_TIMEOUT_MAX_SECONDS * 1000) + 30000,
+                token
+            )
+        except Exception as e:
+            logger.warning("llm_breaker_unavailable", model=self.model, error=str(e))
+            return None
+
+        result = result.decode() if isinstance(result, bytes) else result
+        if result == "open":
+            LLM_BREAKER_REJECTIONS.labels(self.model, workload).inc()
+            raise CircuitOpenError(f"circuit open for {self.model}")
+        if result == "probe":
+            self._set_state("half_open")
+            logger.info("llm_breaker_probe", model=self.model, workload=workload)
+            return token
+        return None
+
+    def abandon(self, probe_token: Optional[str]):
+        """Let another caller probe when this one never reached Ollama."""
+        if not probe_token:
+            return
+        try:
+            get_redis_client().eval(_ABANDON_SCRIPT, 1, self.probe_key, probe_token)
+        except Exception as e:
+            logger.warning("llm_breaker_unavailable", model=self.model, error=str(e))
+
+    def record(self, outcome: str, probe_token: Optional[str] = None):
+        """
+        Count a finished call, opening or closing the breaker as needed.
+
+        Args:
+            outcome: 'ok', 'slow' (succeeded, but slower than
+                OLLAMA_BREAKER_SLOW_CALL_SECONDS) or 'error'
+            probe_token: Token returned by allow() for the half-open probe
+        """
+        now = time.time()
+        buckets = self._window_keys(now)
+        try:
+            result = get_redis_client().eval(
+                _RECORD_SCRIPT, 3 + len(buckets), self.state_key, self.probe_key, buckets[0], *buckets,
+                outcome, probe_token or "", int(now * 1000),
+                settings.OLLAMA_BREAKER_MIN_CALLS,
+                settings.OLLAMA_BREAKER_ERROR_RATE,
+                settings.OLLAMA_BREAKER_SLOW_RATE,
+                (settings.OLLAMA_BREAKER_WINDOW_SECONDS + BUCKET_SECONDS) * 1000
+            )
+        except Exception as e:
+            logger.warning("llm_breaker_unavailable", model=self.model, error=str(e))
+            return
+
+        result = result.decode() if isinstance(result, bytes) else result
+        if result in ("opened", "reopened"):
+            logger.warning("llm_breaker_open", model=self.model, outcome=outcome, probe=bool(probe_token))
+            result = "open"
+        elif result == "reclosed":
+            logger.info("llm_breaker_closed", model=self.model)
+            result = "closed"
+        self._set_state(result)
@@ -0,0 +1,123 @@
+"""Token estimates and context budgeting for prompts.
+
+Ollama silently drops the start of a prompt that overflows the model's
+context window (num_ctx), which for our templates means losing the
+instructions, not the article tail. Inputs are therefore cut to fit
+before the prompt is built:
+
+    input budget = OLLAMA_CONTEXT_TOKENS - profile.max_tokens
+                   - template tokens - OLLAMA_CONTEXT_MARGIN_TOKENS
+
+Token counts are estimated from character length with a conservative
+characters-per-token ratio, which is cheap enough to run on every article.
+It is deliberately not calibrated from Ollama's prompt_eval_count: Ollama
+reuses the cached prompt prefix between requests and only counts the
+tokens it evaluated, so that figure undercounts the prompt.
+"""
+import math
+import re
+from typing import List, Tuple
+
+from app.config import settings
+from app.core.metrics import LLM_INPUT_TRUNCATIONS
+from app.services.llm.prompts import GenerationProfile
+
+CHARS_PER_TOKEN = 3.5  # Below the ~4 typical for English prose, so estimates err high
+
+# Preferred cut points, best first: paragraph, sentence, word
+_BOUNDARIES = (re.compile(r"\n\s*\n"), re.compile(r"(?<=[.!?])\s"), re.compile(r"\s"))
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate how many tokens text takes."""
+    return math.ceil(len(text or "") / CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> Tuple[str, bool]:
+    """
+    Cut text to at most about max_tokens, at a paragraph, sentence or word
+    boundary in its last fifth where there is one.
+
+    Args:
+        text: Text to cut
+        max_tokens: Token budget
+
+    Returns:
+        (text, whether it was cut)
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text, False
+
+    limit = max(int(max_tokens * CHARS_PER_TOKEN), 0)
+    head = text[:limit]
+    for boundary in _BOUNDARIES:
+        cuts = [match.start() for match in boundary.finditer(head) if match.start() >= limit * 0.8]
+        if cuts:
+            return head[:cuts[-1]].rstrip(), True
+    return head, True
+
+
+def input_budget(template: str, profile: GenerationProfile) -> int:
+    """Tokens left for the variable part of a prompt built from template."""
+    budget = (
+        settings.OLLAMA_CONTEXT_TOKENS
+        - profile.max_tokens
+        - estimate_tokens(template)
+        - settings.OLLAMA_CONTEXT_MARGIN_TOKENS
+    )
+    return max(budget, 0)
+
+
+def fit_input(template: str, text: str, profile: GenerationProfile, workload: str) -> str:
+    """
+    Truncate the variable part of a prompt so the whole request fits the context.
+
+    Args:
+        template: Prompt template the text will be inserted into
+        text: Article, evidence or claim text
+        profile: Generation profile (its max_tokens is reserved for output)
+        workload: Prompt type, for the truncation metric
+
+    Returns:
+        Text, cut to the budget if needed
+    """
+    text, truncated = truncate_to_tokens(text, input_budget(template, profile))
+    if truncated:
+        LLM_INPUT_TRUNCATIONS.labels(workload).inc()
+    return text
+
+
+def fit_items(
+    template: str,
+    items: List[str],
+    profile: GenerationProfile,
+    workload: str,
+    separator: str = "\n"
+) -> List[str]:
+    """
+    Drop whole items from the end of a list until, joined, they fit the context.
+
+    The first item is always kept, cut to the budget if it alone overflows,
+    so the model never sees a half item followed by nothing.
+
+    Args:
+        template: Prompt template the joined items will be inserted into
+        items: Formatted entries (e.g. evidence), most important first
+        profile: Generation profile (its max_tokens is reserved for output)
+        workload: Prompt type, for the truncation metric
+        separator: What the entries will be joined with
+
+    Returns:
+        Items that fit, in order
+    """
+    budget = input_budget(template, profile)
+    kept = list(items)
+    while len(kept) > 1 and estimate_tokens(separator.join(kept)) > budget:
+        kept.pop()
+    truncated = len(kept) < len(items)
+    if kept:
+        kept[0], cut = truncate_to_tokens(kept[0], budget)
+        truncated = truncated or cut
+    if truncated:
+        LLM_INPUT_TRUNCATIONS.labels(workload).inc()
+    return kept
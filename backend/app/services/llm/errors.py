@@ -0,0 +1,13 @@
+"""Errors raised instead of calling Ollama."""
+
+
+class LLMUnavailableError(Exception):
+    """The call was not made because Ollama can't take it right now."""
+
+
+class AdmissionTimeout(LLMUnavailableError):
+    """No Ollama slot became free within OLLAMA_ADMISSION_TIMEOUT_SECONDS."""
+
+
+class CircuitOpenError(LLMUnavailableError):
+    """Ollama is failing or too slow; the call was rejected without being made."""
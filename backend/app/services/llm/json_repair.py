@@ -0,0 +1,165 @@
+"""Tolerant JSON parsing for LLM output.
+
+With Ollama's structured output the response is normally valid JSON, but
+older servers, `format: "json"` mode and generations cut off at
+num_predict still produce text json.loads rejects: markdown fences, prose
+around the value, trailing commas, raw newlines inside strings, or a
+value truncated mid-way. Rather than discarding a multi-second generation
+for that, the text is scanned once, repaired, and if it was truncated,
+cut back to the last complete element.
+"""
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class JSONRepairError(ValueError):
+    """The text holds no recoverable JSON value."""
+
+
+class JSONValueScanner:
+    """
+    Find where the first top-level JSON value ends in streamed text.
+
+    Fed chunk by chunk, it tracks bracket depth outside strings, so a
+    streaming caller can stop as soon as the value is complete instead of
+    waiting for whatever the model generates after it.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, chunk: str) -> Optional[int]:
+        """
+        Scan the next chunk.
+
+        Returns:
+            Index in chunk just past the value's closing bracket once the
+            value is complete, else None
+        """
+        for index, ch in enumerate(chunk):
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch in "{[":
+                self.started = True
+                self.depth += 1
+            elif not self.started:
+                continue  # Prose before the value
+            elif ch == '"':
+                self.in_string = True
+            elif ch in "}]":
+                self.depth -= 1
+                if self.depth == 0:
+                    return index + 1
+        return None
+
+
+def _closing(stack: List[str]) -> str:
+    return "".join(reversed(stack))
+
+
+def _strip_trailing(out: List[str]):
+    """Drop whitespace and dangling commas before a closing bracket."""
+    while out and (out[-1].isspace() or out[-1] == ","):
+        out.pop()
+
+
+def repair_json(text: str) -> List[str]:
+    """
+    Rewrite the first JSON value in text so json.loads can read it.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        Candidates to try in order. For a truncated value these are the
+        text cut back to each earlier element boundary, latest first,
+        since the last element may be incomplete; then the text with its
+        brackets closed as-is.
+
+    Raises:
+        JSONRepairError: No '{' or '[' in text
+    """
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    if not starts:
+        raise JSONRepairError("no JSON object or array in output")
+
+    out: List[str] = []
+    stack: List[str] = []
+    boundaries: List[Tuple[int, Tuple[str, ...]]] = []  # (len(out), open brackets) at each comma
+    in_string = escape = False
+
+    for ch in text[min(starts):]:
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            elif ch == "\n":
+                ch = "\\n"
+            out.append(ch)
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            _strip_trailing(out)
+            out.append(stack.pop())
+            if not stack:
+                break
+            continue
+        elif ch == ",":
+            boundaries.append((len(out), tuple(stack)))
+        out.append(ch)
+
+    if in_string:
+        out.append('"')
+    _strip_trailing(out)
+    if out and out[-1] == ":":
+        out.append("null")
+
+    repaired = "".join(out) + _closing(stack)
+    if not stack:
+        return [repaired]
+    truncated = [
+        "".join(out[:position]) + _closing(list(open_brackets))
+        for position, open_brackets in reversed(boundaries)
+    ]
+    return [*truncated, repaired]
+
+
+def parse_json(text: str) -> Tuple[Any, bool]:
+    """
+    Parse model output as JSON, repairing it if needed.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        (parsed value, whether repair was needed)
+
+    Raises:
+        JSONRepairError: Nothing parseable could be recovered
+    """
+    try:
+        return json.loads(text), False
+    except (json.JSONDecodeError, TypeError):
+        pass
+
+    for candidate in repair_json(text or ""):
+        try:
+            return json.loads(candidate), True
+        except json.JSONDecodeError:
+            continue
+    raise JSONRepairError("output is not valid JSON and could not be repaired")
@@ -0,0 +1,176 @@
+"""Cluster-wide admission control for Ollama requests.
+
+Every worker process shares one Ollama host, so the number of generations
+in flight is capped in Redis rather than per process. Ollama then only
+ever holds as many requests as it serves in parallel, and the client
+timeout measures generation time instead of time spent in Ollama's queue.
+
+Waiting callers queue per workload (extraction, fact_check, propaganda).
+A freed slot goes to the head of the next workload in round-robin order
+that has anyone waiting, so a burst of one kind of call can't starve the
+others.
+
+Redis layout, per model:
+    slots     sorted set of slot holders, scored by lease expiry (ms)
+    waiting:* one sorted set per workload, scored by arrival time (ms)
+    turn      index of the workload to serve next
+    waiter:*  one key per waiting caller, expiring unless refreshed, so
+              callers that died while queued are skipped
+"""
+import asyncio
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from app.config import settings
+from app.core.logging import logger
+from app.core.metrics import LLM_ADMISSION_TIMEOUTS, LLM_SLOT_WAIT
+from app.core.redis import get_redis_client
+from app.services.llm.errors import AdmissionTimeout
+
+# Workloads served round robin; anything else is queued as "default"
+WORKLOADS = ("extraction", "fact_check", "propaganda", "default")
+
+KEY_PREFIX = "factcheck:llm:{model}"
+POLL_INTERVAL_SECONDS = 0.1
+WAITER_TTL_MS = 5000  # A queued caller that stops polling for this long is dropped
+
+# KEYS: slots, turn, waiting:<workload>...   ARGV: token, workload index,
+# now, lease expiry, limit, waiter key prefix, waiter ttl
+_ACQUIRE_SCRIPT = """
+local slots, turn_key = KEYS[1], KEYS[2]
+local token, mine = ARGV[1], tonumber(ARGV[2])
+local now, expires, limit = tonumber(ARGV[3]), ARGV[4], tonumber(ARGV[5])
+local waiter_prefix, waiter_ttl = ARGV[6], ARGV[7]
+local queues = #KEYS - 2
+
+redis.call('ZREMRANGEBYSCORE', slots, '-inf', now)
+redis.call('ZADD', KEYS[2 + mine], 'NX', now, token)
+redis.call('SET', waiter_prefix .. token, 1, 'PX', waiter_ttl)
+if redis.call('ZCARD', slots) >= limit then
+    return 0
+end
+
+local turn = tonumber(redis.call('GET', turn_key)) or 0
+for i = 0, queues - 1 do
+    local index = (turn + i) % queues
+    local queue = KEYS[3 + index]
+    local head = redis.call('ZRANGE', queue, 0, 0)[1]
+    while head and redis.call('EXISTS', waiter_prefix .. head) == 0 do
+        redis.call('ZREM', queue, head)
+        head = redis.call('ZRANGE', queue, 0, 0)[1]
+    end
+    if head then
+        if head ~= token then
+            return 0
+        end
+        redis.call('ZREM', queue, token)
+        redis.call('DEL', waiter_prefix .. token)
+        redis.call('ZADD', slots, expires, token)
+        redis.call('SET', turn_key, (index + 1) % queues)
+        return 1
+    end
+end
+return 0
+"""
+
+# KEYS: slots, waiting:<workload>   ARGV: token, waiter key prefix
+_RELEASE_SCRIPT = """
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('DEL', ARGV[2] .. ARGV[1])
+return 1
+"""
+
+
+class OllamaLimiter:
+    """Distributed semaphore limiting in-flight generations per model."""
+
+    def __init__(self, model: str, limit: Optional[int] = None):
+        self.model = model
+        self.limit = limit or settings.ollama_max_in_flight(model)
+        prefix = KEY_PREFIX.format(model=model)
+        self.slots_key = f"{prefix}:slots"
+        self.turn_key = f"{prefix}:turn"
+        self.waiter_prefix = f"{prefix}:waiter:"
+        self.waiting_keys = [f"{prefix}:waiting:{workload}" for workload in WORKLOADS]
+
+    def _workload_index(self, workload: str) -> int:
+        return WORKLOADS.index(workload) if workload in WORKLOADS else WORKLOADS.index("default")
+
+    @asynccontextmanager
+    async def slot(self, workload: str, lease_seconds: float):
+        """
+        Hold one of the model's slots for the duration of the block.
+
+        Args:
+            workload: 'extraction', 'fact_check' or 'propaganda'
+            lease_seconds: Upper bound on the call; a holder that dies
+                without releasing frees its slot after this long
+
+        Raises:
+            AdmissionTimeout: No slot within OLLAMA_ADMISSION_TIMEOUT_SECONDS
+        """
+        index = self._workload_index(workload)
+        token = uuid.uuid4().hex
+        client = await self._acquire(token, index, lease_seconds)
+        try:
+            yield
+        finally:
+            if client is not None:
+                self._release(client, token, index)
+
+    async def _acquire(self, token: str, index: int, lease_seconds: float):
+        """
+        Poll until this caller is granted a slot.
+
+        The sync Redis client is used on purpose: tasks run each call in a
+        fresh event loop (asyncio.run), which the shared asyncio client's
+        connections can't follow. Each script call is sub-millisecond.
+
+        Returns:
+            The Redis client holding the slot, or None if Redis is
+            unreachable, in which case the call goes through unlimited
+            rather than failing inference
+        """
+        keys = [self.slots_key, self.turn_key, *self.waiting_keys]
+        started = time.monotonic()
+        deadline = started + settings.OLLAMA_ADMISSION_TIMEOUT_SECONDS
+
+        try:
+            client = get_redis_client()
+            while True:
+                now_ms = int(time.time() * 1000)
+                acquired = client.eval(
+                    _ACQUIRE_SCRIPT, len(keys), *keys,
+                    token, index + 1, now_ms, now_ms + int(lease_seconds * 1000),
+                    self.limit, self.waiter_prefix, WAITER_TTL_MS
+                )
+                if acquired:
+                    break
+                if time.monotonic() >= deadline:
+                    self._release(client, token, index)
+                    LLM_ADMISSION_TIMEOUTS.labels(self.model, WORKLOADS[index]).inc()
+                    raise AdmissionTimeout(
+                        f"no {self.model} slot free after {settings.OLLAMA_ADMISSION_TIMEOUT_SECONDS}s"
+                    )
+                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+        except AdmissionTimeout:
+            raise
+        except Exception as e:
+            logger.warning("llm_limiter_unavailable", model=self.model, error=str(e))
+            return None
+
+        LLM_SLOT_WAIT.labels(self.model, WORKLOADS[index]).observe(time.monotonic() - started)
+        return client
+
+    def _release(self, client, token: str, index: int):
+        """Give back a slot (or a place in the queue), best-effort."""
+        try:
+            client.eval(
+                _RELEASE_SCRIPT, 2, self.slots_key, self.waiting_keys[index],
+                token, self.waiter_prefix
+            )
+        except Exception as e:
+            logger.warning("llm_slot_release_failed", model=self.model, error=str(e))
@@ -1,66 +1,358 @@
-"""Ollama API client for LLM inference."""
+"""LLM client: Ollama API, or OpenAI-compatible servers through the router."""
+import asyncio
 import httpx
 import json
-from typing import Optional, Dict, Any
+import time
+from typing import List, Optional, Dict, Any, Sequence, Union
 from app.config import settings
 from app.core.logging import logger
+from app.core.metrics import (
+    LLM_BACKEND_REQUESTS,
+    LLM_EARLY_STOPS,
+    LLM_EVAL_TOKENS,
+    LLM_JSON_RESULTS,
+    LLM_PROMPT_TOKENS,
+    LLM_REQUEST_DURATION,
+    LLM_TIME_TO_FIRST_TOKEN,
+    LLM_TOKENS_PER_SECOND,
+)
+from app.services.llm.errors import AdmissionTimeout, CircuitOpenError
+from app.services.llm.json_repair import JSONRepairError, JSONValueScanner, parse_json
+from app.services.llm.prompts import generation_profile
+from app.services.llm.router import Route, get_router
+from app.services.llm.timeouts import adaptive_timeout, observe_latency
 
 
 class OllamaClient:
     """Client for Ollama API."""
 
-    def __init__(self):
-        self.base_url = settings.OLLAMA_API_URL
-        self.model = settings.OLLAMA_MODEL
-        self.timeout = 60.0
+    def __init__(self, workload: str = "default"):
+        """
+        Args:
+            workload: Caller's prompt type, used for admission control and
+                adaptive timeouts ('extraction', 'fact_check' or 'propaganda'),
+                and to pick its generation profile and model tier
+        """
+        self.router = get_router()
+        self.model = self.router.model_for(workload)
+        self.workload = workload
+        self.profile = generation_profile(workload)
 
     async def generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
-        temperature: float = 0.7,
-        max_tokens: int = 2048
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        stop: Optional[Sequence[str]] = None,
+        format: Optional[Union[str, Dict[str, Any]]] = None,
+        stop_at_json: bool = False
     ) -> str:
-        """Generate completion from Ollama."""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "system": system_prompt,
-                        "stream": False,
-                        "options": {
-                            "temperature": temperature,
-                            "num_predict": max_tokens
-                        }
-                    }
+        """
+        Generate a completion with the workload's model.
+
+        The call goes to the backend the router ranks first, after waiting
+        for a cluster-wide slot on that route, so the (adaptive) timeout
+        only covers generation. Routes whose circuit breaker is open, whose
+        host refuses the connection, or where no slot frees up in time are
+        skipped for the next one.
+
+        With OLLAMA_STREAMING, Ollama responses are consumed as they are
+        generated; OpenAI-compatible backends are always called unstreamed.
+
+        Sampling options not given come from the workload's generation
+        profile, and the request always carries num_ctx so prompts are
+        budgeted against the same context size Ollama uses.
+
+        Args:
+            temperature: Sampling temperature (default: profile)
+            max_tokens: Cap on generated tokens (default: profile)
+            stop: Stop sequences (default: profile)
+            format: Ollama output format, "json" or a JSON schema
+            stop_at_json: When streaming, stop the generation as soon as a
+                complete top-level JSON value has arrived
+
+        Raises:
+            CircuitOpenError: Every backend for the model is failing; the
+                call wasn't made
+            AdmissionTimeout: No slot freed up in time on any backend
+        """
+        timeout = adaptive_timeout(self.model, self.workload)
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "system": system_prompt,
+            "stream": settings.OLLAMA_STREAMING,
+            "options": {
+                "temperature": self.profile.temperature if temperature is None else temperature,
+                "num_predict": max_tokens or self.profile.max_tokens,
+                "num_ctx": settings.OLLAMA_CONTEXT_TOKENS
+            }
+        }
+        stop = self.profile.stop if stop is None else stop
+        if stop:
+            payload["options"]["stop"] = list(stop)
+        if format is not None:
+            payload["format"] = format
+
+        routes = self.router.ranked(self.model)
+        for attempt, route in enumerate(routes, 1):
+            last = attempt == len(routes)
+            try:
+                probe_token = route.breaker.allow(self.workload)
+            except CircuitOpenError:
+                if last:
+                    raise
+                continue
+
+            try:
+                async with route.limiter.slot(self.workload, lease_seconds=timeout + 30):
+                    return await self._post(route, payload, timeout, probe_token, stop_at_json)
+            except AdmissionTimeout as e:
+                # The backend is saturated, not broken; a less busy one can take the call
+                route.breaker.abandon(probe_token)
+                logger.warning("llm_backend_saturated", backend=route.backend.name, error=str(e))
+                if last:
+                    raise
+            except httpx.ConnectError as e:
+                # Nothing was generated; another backend can take the call
+                logger.warning("llm_backend_unreachable", backend=route.backend.name, error=str(e))
+                if last:
+                    raise
+            except Exception as e:
+                logger.error(
+                    "ollama_generation_failed",
+                    backend=route.backend.name,
+                    error=str(e) or type(e).__name__,
+                    timeout=timeout
                 )
-                response.raise_for_status()
-                result = response.json()
-                return result.get("response", "")
-        except Exception as e:
-            logger.error("ollama_generation_failed", error=str(e))
+                raise
+
+    async def _post(
+        self,
+        route: Route,
+        payload: Dict[str, Any],
+        timeout: float,
+        probe_token: Optional[str],
+        stop_at_json: bool = False
+    ) -> str:
+        """Make the generate request, feeding its outcome to the breaker and timeouts."""
+        started = time.monotonic()
+        payload = {**payload, "model": route.model}
+        try:
+            async with httpx.AsyncClient(timeout=httpx.Timeout(timeout, connect=5.0)) as client:
+                if route.backend.kind == "openai":
+                    text = await self._chat_completion(client, route.backend.url, payload)
+                elif payload["stream"]:
+                    # httpx's read timeout applies per chunk; bound the whole generation
+                    text = await asyncio.wait_for(
+                        self._stream(client, route.backend.url, payload, started, stop_at_json), timeout
+                    )
+                else:
+                    response = await client.post(f"{route.backend.url}/api/generate", json=payload)
+                    response.raise_for_status()
+                    data = response.json()
+                    self._record_usage(data)
+                    text = data.get("response", "")
+        except Exception:
+            LLM_REQUEST_DURATION.labels(self.model, self.workload, "error").observe(time.monotonic() - started)
+            LLM_BACKEND_REQUESTS.labels(route.backend.name, self.model, "error").inc()
+            route.breaker.record("error", probe_token)
             raise
 
+        elapsed = time.monotonic() - started
+        outcome = "slow" if elapsed >= settings.OLLAMA_BREAKER_SLOW_CALL_SECONDS else "ok"
+        LLM_REQUEST_DURATION.labels(self.model, self.workload, outcome).observe(elapsed)
+        LLM_BACKEND_REQUESTS.labels(route.backend.name, self.model, outcome).inc()
+        route.breaker.record(outcome, probe_token)
+        observe_latency(self.model, self.workload, elapsed)
+        return text
+
+    async def _chat_completion(self, client: httpx.AsyncClient, base_url: str, payload: Dict[str, Any]) -> str:
+        """
+        Make the request against an OpenAI-compatible /chat/completions endpoint.
+
+        Args:
+            client: HTTP client
+            base_url: API root including the version, e.g. http://vllm:8000/v1
+            payload: Ollama-style payload, translated here
+
+        Returns:
+            Generated text
+        """
+        options = payload["options"]
+        messages: List[Dict[str, str]] = []
+        if payload.get("system"):
+            messages.append({"role": "system", "content": payload["system"]})
+        messages.append({"role": "user", "content": payload["prompt"]})
+        body: Dict[str, Any] = {
+            "model": payload["model"],
+            "messages": messages,
+            "temperature": options["temperature"],
+            "max_tokens": options["num_predict"],
+        }
+        if options.get("stop"):
+            body["stop"] = options["stop"]
+        output_format = payload.get("format")
+        if isinstance(output_format, dict):
+            body["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": f"{self.workload}_response", "schema": output_format}
+            }
+        elif output_format == "json":
+            body["response_format"] = {"type": "json_object"}
+
+        headers = {}
+        if settings.LLM_OPENAI_API_KEY:
+            headers["Authorization"] = f"Bearer {settings.LLM_OPENAI_API_KEY}"
+        response = await client.post(f"{base_url}/chat/completions", json=body, headers=headers)
+        response.raise_for_status()
+        data = response.json()
+        choice = data["choices"][0]
+        usage = data.get("usage") or {}
+        self._record_usage({
+            "prompt_eval_count": usage.get("prompt_tokens"),
+            "eval_count": usage.get("completion_tokens"),
+            "done_reason": choice.get("finish_reason"),
+        })
+        return choice["message"].get("content") or ""
+
+    async def _stream(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        payload: Dict[str, Any],
+        started: float,
+        stop_at_json: bool
+    ) -> str:
+        """
+        Consume a streamed generation (one JSON object per line).
+
+        Leaving the stream early closes the connection, which makes Ollama
+        stop generating for this request.
+
+        Returns:
+            Generated text, ending at the JSON value's closing bracket when
+            stopped early
+        """
+        scanner = JSONValueScanner() if stop_at_json else None
+        parts = []
+        first_token_at = None
+        tokens = 0
+        final: Dict[str, Any] = {}
+
+        async with client.stream("POST", f"{base_url}/api/generate", json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise RuntimeError(f"ollama stream error: {chunk['error']}")
+
+                token = chunk.get("response", "")
+                if token:
+                    if first_token_at is None:
+                        first_token_at = time.monotonic()
+                        LLM_TIME_TO_FIRST_TOKEN.labels(self.model, self.workload).observe(first_token_at - started)
+                    tokens += 1
+                    end = scanner.feed(token) if scanner else None
+                    if end is not None:
+                        parts.append(token[:end])
+                        LLM_EARLY_STOPS.labels(self.model, self.workload).inc()
+                        break
+                    parts.append(token)
+                if chunk.get("done"):
+                    final = chunk
+                    break
+
+        # Ollama's own count when the generation finished, else chunks (one token each)
+        if final.get("eval_count") and final.get("eval_duration"):
+            tokens_per_second = final["eval_count"] / (final["eval_duration"] / 1e9)
+        elif first_token_at is not None and tokens > 1:
+            tokens_per_second = (tokens - 1) / max(time.monotonic() - first_token_at, 1e-6)
+        else:
+            tokens_per_second = None
+        if tokens_per_second is not None:
+            LLM_TOKENS_PER_SECOND.labels(self.model, self.workload).observe(tokens_per_second)
+        self._record_usage(final, streamed_tokens=tokens)
+
+        logger.debug(
+            "ollama_stream_finished",
+            workload=self.workload,
+            tokens=tokens,
+            early_stop=not final,
+            ttft_seconds=round(first_token_at - started, 3) if first_token_at else None,
+            tokens_per_second=round(tokens_per_second, 1) if tokens_per_second else None
+        )
+        return "".join(parts)
+
+    def _record_usage(self, data: Dict[str, Any], streamed_tokens: Optional[int] = None):
+        """
+        Record token counts from Ollama's final response fields.
+
+        Args:
+            data: Non-streamed response, or the final stream chunk ({} when
+                the stream was stopped early and never sent one), or an
+                OpenAI-compatible response's usage in Ollama's field names
+            streamed_tokens: Chunks received, counted as generated tokens
+                when there is no eval_count
+        """
+        prompt_tokens = data.get("prompt_eval_count")
+        eval_tokens = data.get("eval_count") or streamed_tokens
+        if prompt_tokens:
+            LLM_PROMPT_TOKENS.labels(self.model, self.workload).observe(prompt_tokens)
+        if eval_tokens:
+            LLM_EVAL_TOKENS.labels(self.model, self.workload).observe(eval_tokens)
+        if data.get("done_reason") == "length":
+            logger.warning("ollama_output_truncated", workload=self.workload, eval_tokens=eval_tokens)
+
     async def generate_json(
         self,
         prompt: str,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Generate JSON response from Ollama."""
-        response_text = await self.generate(prompt, system_prompt)
+        """
+        Generate JSON response from Ollama.
+
+        Generation is constrained to the schema (or to JSON) per
+        OLLAMA_STRUCTURED_OUTPUT, and whatever comes back is parsed
+        tolerantly, so a generation is only wasted when nothing can be
+        recovered from it.
+
+        Args:
+            prompt: Prompt text
+            system_prompt: Optional system prompt
+            schema: JSON schema the response must follow
+
+        Returns:
+            Parsed response, {} if it couldn't be parsed
+        """
+        mode = settings.OLLAMA_STRUCTURED_OUTPUT
+        if mode == "schema" and schema is not None:
+            output_format = schema
+        elif mode != "off":
+            output_format = "json"
+        else:
+            output_format = None
+
+        response_text = await self.generate(prompt, system_prompt, format=output_format, stop_at_json=True)
 
-        # Try to extract JSON from response
         try:
-            # Remove markdown code blocks if present
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0]
-
-            return json.loads(response_text.strip())
-        except json.JSONDecodeError as e:
-            logger.error("json_parse_failed", response=response_text, error=str(e))
+            result, repaired = parse_json(response_text)
+        except JSONRepairError as e:
+            LLM_JSON_RESULTS.labels(self.model, self.workload, "failed").inc()
+            logger.error("json_parse_failed", response=response_text[:500], error=str(e))
             return {}
+
+        missing = [
+            field for field in (schema or {}).get("required", [])
+            if not isinstance(result, dict) or field not in result
+        ]
+        if missing:
+            LLM_JSON_RESULTS.labels(self.model, self.workload, "invalid").inc()
+            logger.warning("json_missing_fields", workload=self.workload, missing=missing)
+        else:
+            LLM_JSON_RESULTS.labels(self.model, self.workload, "repaired" if repaired else "ok").inc()
+        return result
@@ -1,4 +1,6 @@
 """LLM prompt templates."""
+from dataclasses import dataclass
+from typing import Tuple
 
 CLAIM_EXTRACTION_PROMPT = """You are a fact-checking assistant. Extract all verifiable factual claims from the following article.
 
@@ -19,17 +21,19 @@ For each claim, provide:
 Article:
 {article_text}
 
-Output your response as a JSON array:
-[
-  {{
-    "claim_text": "exact claim from article",
-    "claim_type": "factual|statistic|quote",
-    "context": "surrounding context",
-    "checkability": 0.9
-  }}
-]
-
-Only output the JSON array, no other text.
+Output your response as JSON:
+{{
+  "claims": [
+    {{
+      "claim_text": "exact claim from article",
+      "claim_type": "factual|statistic|quote",
+      "context": "surrounding context",
+      "checkability": 0.9
+    }}
+  ]
+}}
+
+Only output the JSON object, no other text.
 """
 
 FACT_CHECKING_PROMPT = """You are an expert fact-checker. Analyze the following claim using the provided evidence.
@@ -100,3 +104,87 @@ Output as JSON:
 
 Only output the JSON object, no other text.
 """
+
+# JSON schemas for Ollama structured output ("format"), one per prompt above.
+# Ollama constrains generation to these, so the output parses as-is.
+_SCORE = {"type": "number", "minimum": 0.0, "maximum": 1.0}
+
+CLAIM_EXTRACTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "claims": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "claim_text": {"type": "string"},
+                    "claim_type": {"type": "string", "enum": ["factual", "statistic", "quote"]},
+                    "context": {"type": "string"},
+                    "checkability": _SCORE
+                },
+                "required": ["claim_text", "claim_type", "context", "checkability"]
+            }
+        }
+    },
+    "required": ["claims"]
+}
+
+FACT_CHECKING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "verdict": {
+            "type": "string",
+            "enum": ["true", "mostly_true", "mixed", "mostly_false", "false", "unverifiable"]
+        },
+        "confidence": _SCORE,
+        "summary": {"type": "string"},
+        "reasoning": {"type": "string"}
+    },
+    "required": ["verdict", "confidence", "summary", "reasoning"]
+}
+
+PROPAGANDA_DETECTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "techniques_detected": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "technique": {"type": "string"},
+                    "confidence": _SCORE,
+                    "evidence": {"type": "string"}
+                },
+                "required": ["technique", "confidence", "evidence"]
+            }
+        },
+        "overall_propaganda_score": _SCORE
+    },
+    "required": ["techniques_detected", "overall_propaganda_score"]
+}
+
+
+@dataclass(frozen=True)
+class GenerationProfile:
+    """Sampling options for one prompt type."""
+
+    max_tokens: int  # num_predict; also reserved out of the context budget
+    temperature: float
+    stop: Tuple[str, ...] = ()
+
+
+# Per prompt type (the client's workload). Output caps are sized from the
+# schemas above: a claim list for a long article, one verdict with
+# reasoning, a short technique list. JSON prompts get no stop sequences;
+# streamed generations already stop at the closing bracket.
+GENERATION_PROFILES = {
+    "extraction": GenerationProfile(max_tokens=1536, temperature=0.1),
+    "fact_check": GenerationProfile(max_tokens=512, temperature=0.2),
+    "propaganda": GenerationProfile(max_tokens=384, temperature=0.1),
+    "default": GenerationProfile(max_tokens=2048, temperature=0.7),
+}
+
+
+def generation_profile(workload: str) -> GenerationProfile:
+    """Profile for a prompt type, the default one for anything unknown."""
+    return GENERATION_PROFILES.get(workload, GENERATION_PROFILES["default"])
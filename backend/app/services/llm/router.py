@@ -0,0 +1,172 @@
+"""Routing of LLM calls across inference backends and model tiers.
+
+Each prompt type is served by a model tier (LLM_WORKLOAD_TIERS), e.g. a
+small fast model for propaganda screening and a larger one for verdicts
+(LLM_TIER_MODELS). A model can be served by several backends: Ollama
+hosts, or OpenAI-compatible servers such as vLLM or llama.cpp
+(LLM_BACKENDS).
+
+Every (backend, model) pair is a route with its own admission limiter and
+circuit breaker, so one slow host neither blocks nor trips the others.
+Calls go to the healthy route with the least outstanding work: slots in
+use plus callers queued for one, relative to its in-flight limit, read
+from the same Redis keys the limiters and breakers keep.
+"""
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from app.config import settings
+from app.core.logging import logger
+from app.core.redis import get_redis_client
+from app.services.llm.breaker import CircuitBreaker
+from app.services.llm.limiter import OllamaLimiter
+
+BACKEND_KINDS = ("ollama", "openai")
+
+
+@dataclass(frozen=True)
+class Backend:
+    """One inference server."""
+
+    url: str
+    kind: str = "ollama"
+    models: Tuple[str, ...] = ()  # Empty: serves any model
+    max_in_flight: Optional[int] = None  # None: OLLAMA_MAX_IN_FLIGHT / OLLAMA_MODEL_MAX_IN_FLIGHT
+
+    @property
+    def name(self) -> str:
+        return urlsplit(self.url).netloc or self.url
+
+    def serves(self, model: str) -> bool:
+        return not self.models or model in self.models
+
+
+@dataclass
+class Route:
+    """A model on a backend, with the limiter and breaker guarding it."""
+
+    backend: Backend
+    model: str
+    limiter: OllamaLimiter = field(repr=False)
+    breaker: CircuitBreaker = field(repr=False)
+
+
+def parse_backends(spec: str) -> List[Backend]:
+    """
+    Parse LLM_BACKENDS.
+
+    Args:
+        spec: Comma-separated "[kind=]url[|model+model][|max in flight]"
+
+    Returns:
+        Backends, in the order given
+
+    Raises:
+        ValueError: Unknown backend kind
+    """
+    backends = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        location, *options = entry.split("|")
+        kind, sep, url = location.partition("=")
+        if not sep:
+            kind, url = "ollama", location
+        if kind not in BACKEND_KINDS:
+            raise ValueError(f"unknown LLM backend kind {kind!r} in {entry!r}")
+
+        models: Tuple[str, ...] = ()
+        max_in_flight = None
+        for option in options:
+            if option.strip().isdigit():
+                max_in_flight = max(int(option), 1)
+            elif option.strip():
+                models = tuple(model.strip() for model in option.split("+") if model.strip())
+        backends.append(Backend(url.rstrip("/"), kind, models, max_in_flight))
+    return backends
+
+
+class LLMRouter:
+    """Picks a model per prompt type and a backend per call."""
+
+    def __init__(self, backends: Optional[List[Backend]] = None):
+        self.backends = backends or parse_backends(settings.LLM_BACKENDS) or [Backend(settings.OLLAMA_API_URL)]
+        self._routes: Dict[str, List[Route]] = {}
+
+    def model_for(self, workload: str) -> str:
+        """Model of the prompt type's tier."""
+        return settings.llm_model(workload)
+
+    def routes(self, model: str) -> List[Route]:
+        """
+        Every route for a model.
+
+        Raises:
+            ValueError: No backend serves the model
+        """
+        if model not in self._routes:
+            backends = [backend for backend in self.backends if backend.serves(model)]
+            if not backends:
+                raise ValueError(f"no LLM backend serves {model}")
+            routes = []
+            for backend in backends:
+                # A single backend keeps the plain model name, and so the
+                # Redis keys and metric labels it had before routing
+                name = model if len(self.backends) == 1 else f"{model}@{backend.name}"
+                limit = backend.max_in_flight or settings.ollama_max_in_flight(model)
+                routes.append(Route(backend, model, OllamaLimiter(name, limit), CircuitBreaker(name)))
+            self._routes[model] = routes
+        return self._routes[model]
+
+    def ranked(self, model: str) -> List[Route]:
+        """
+        Routes for a model, best first.
+
+        Routes whose breaker is open (and not yet due a probe) go last, the
+        rest by outstanding work relative to their limit, ties broken at
+        random so idle routes share the load. With Redis unreachable the
+        configured order is used.
+        """
+        routes = self.routes(model)
+        if len(routes) == 1:
+            return routes
+
+        now_ms = int(time.time() * 1000)
+        try:
+            pipe = get_redis_client().pipeline(transaction=False)
+            for route in routes:
+                pipe.zcount(route.limiter.slots_key, now_ms, "+inf")
+                for key in route.limiter.waiting_keys:
+                    pipe.zcard(key)
+                pipe.hmget(route.breaker.state_key, "state", "opened_at")
+            results = pipe.execute()
+        except Exception as e:
+            logger.warning("llm_router_state_unavailable", model=model, error=str(e))
+            return list(routes)
+
+        open_ms = settings.OLLAMA_BREAKER_OPEN_SECONDS * 1000
+        scored = []
+        stride = len(routes[0].limiter.waiting_keys) + 2
+        for index, route in enumerate(routes):
+            counts = results[index * stride:(index + 1) * stride]
+            state, opened_at = counts[-1]
+            state = state.decode() if isinstance(state, bytes) else state
+            tripped = state == "open" and now_ms - int(opened_at or 0) < open_ms
+            outstanding = sum(counts[:-1])
+            scored.append((tripped, outstanding / route.limiter.limit, random.random(), index))
+        return [routes[index] for *_, index in sorted(scored)]
+
+
+_router: Optional[LLMRouter] = None
+
+
+def get_router() -> LLMRouter:
+    """Return the process-wide router, built from settings on first use."""
+    global _router
+    if _router is None:
+        _router = LLMRouter()
+    return _router
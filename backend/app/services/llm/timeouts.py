@@ -0,0 +1,80 @@
+"""Ollama timeouts derived from observed latency, per prompt type.
+
+Claim extraction over a whole article takes far longer than a propaganda
+check on one sentence, so a single fixed timeout is either too short for
+one or lets the other hang. The latest successful call durations for each
+(model, prompt type) are kept in Redis, and the timeout is their
+OLLAMA_TIMEOUT_PERCENTILE times OLLAMA_TIMEOUT_MULTIPLIER, clamped to
+[OLLAMA_TIMEOUT_MIN_SECONDS, OLLAMA_TIMEOUT_MAX_SECONDS]. Until enough
+calls have been seen, OLLAMA_TIMEOUT_SECONDS is used.
+"""
+import math
+import time
+from typing import Dict, Tuple
+
+from app.config import settings
+from app.core.logging import logger
+from app.core.metrics import LLM_TIMEOUT_SECONDS
+from app.core.redis import get_redis_client
+
+SAMPLES_KEY = "factcheck:llm:{model}:latency:{prompt_type}"
+MAX_SAMPLES = 200
+MIN_SAMPLES = 20
+CACHE_SECONDS = 30.0  # Recompute a timeout at most this often per process
+
+# (model, prompt type) -> (expires at, timeout)
+_cache: Dict[Tuple[str, str], Tuple[float, float]] = {}
+
+
+def percentile(samples, fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list of numbers."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def observe_latency(model: str, prompt_type: str, seconds: float):
+    """Record the duration of a successful call (best-effort)."""
+    key = SAMPLES_KEY.format(model=model, prompt_type=prompt_type)
+    try:
+        pipe = get_redis_client().pipeline()
+        pipe.lpush(key, round(seconds, 3))
+        pipe.ltrim(key, 0, MAX_SAMPLES - 1)
+        pipe.execute()
+    except Exception as e:
+        logger.warning("llm_latency_record_failed", model=model, error=str(e))
+
+
+def adaptive_timeout(model: str, prompt_type: str) -> float:
+    """
+    Timeout in seconds for a call of this prompt type.
+
+    Args:
+        model: Ollama model name
+        prompt_type: Prompt type (the client's workload)
+
+    Returns:
+        Timeout for the whole generation
+    """
+    now = time.monotonic()
+    cached = _cache.get((model, prompt_type))
+    if cached and cached[0] > now:
+        return cached[1]
+
+    timeout = settings.OLLAMA_TIMEOUT_SECONDS
+    try:
+        samples = get_redis_client().lrange(SAMPLES_KEY.format(model=model, prompt_type=prompt_type), 0, -1)
+    except Exception as e:
+        logger.warning("llm_latency_read_failed", model=model, error=str(e))
+        samples = []
+
+    if len(samples) >= MIN_SAMPLES:
+        observed = percentile([float(sample) for sample in samples], settings.OLLAMA_TIMEOUT_PERCENTILE)
+        timeout = min(
+            max(observed * settings.OLLAMA_TIMEOUT_MULTIPLIER, settings.OLLAMA_TIMEOUT_MIN_SECONDS),
+            settings.OLLAMA_TIMEOUT_MAX_SECONDS
+        )
+
+    _cache[(model, prompt_type)] = (now + CACHE_SECONDS, timeout)
+    LLM_TIMEOUT_SECONDS.labels(model, prompt_type).set(timeout)
+    return timeout
@@ -0,0 +1 @@
+"""Article partitioning and retention services package."""
@@ -0,0 +1,209 @@
+"""Archive expired article partitions to compressed NDJSON on disk."""
+import gzip
+import json
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.logging import logger
+from app.services.cache.investigation_cache import invalidate_investigations
+from app.services.retention.partitions import (
+    PARENT_TABLE, DEFAULT_PARTITION, add_months, attach_partition, list_partitions
+)
+
+# Rows fetched per round trip while streaming a partition out
+ARCHIVE_BATCH_SIZE = 1000
+
+# Rows archived per table for a partition. Claims and their investigations,
+# evidence and techniques go with the articles they were extracted from; the
+# claim and investigation ids are fixed (and locked) up front, in the
+# archive_claims / archive_investigations temporary tables.
+ARCHIVE_QUERIES = {
+    "articles": "SELECT * FROM {partition}",
+    "article_contents": (
+        "SELECT * FROM article_contents "
+        "WHERE content_hash IN (SELECT content_hash FROM {partition})"
+    ),
+    "claims": (
+        "SELECT claims.* FROM claims "
+        "JOIN archive_claims ac ON ac.id = claims.id"
+    ),
+    "investigations": (
+        "SELECT investigations.* FROM investigations "
+        "JOIN archive_investigations ai ON ai.id = investigations.id"
+    ),
+    "evidence": (
+        "SELECT evidence.* FROM evidence "
+        "JOIN archive_investigations ai ON ai.id = evidence.investigation_id"
+    ),
+    "investigation_techniques": (
+        "SELECT investigation_techniques.* FROM investigation_techniques "
+        "JOIN archive_investigations ai ON ai.id = investigation_techniques.investigation_id"
+    ),
+}
+
+
+def _lock_archive_set(db: Session, partition: str) -> None:
+    """
+    Fix the claims and investigations to archive with the (detached) partition.
+
+    The rows are locked FOR UPDATE until the archive commits: that keeps them
+    from changing, and because inserting a row that references them needs a
+    key-share lock, no new investigation, evidence or technique can be added
+    to them in the meantime either. A claim created for one of these articles
+    after this point fails the run (see _archive_detached).
+    """
+    db.execute(text(
+        "CREATE TEMPORARY TABLE archive_claims ON COMMIT DROP AS "
+        "WITH locked AS ("
+        f"SELECT claims.id FROM claims WHERE article_id IN (SELECT id FROM {partition}) "
+        "FOR UPDATE OF claims"
+        ") SELECT id FROM locked"
+    ))
+    db.execute(text(
+        "CREATE TEMPORARY TABLE archive_investigations ON COMMIT DROP AS "
+        "WITH locked AS ("
+        "SELECT investigations.id FROM investigations "
+        "WHERE claim_id IN (SELECT id FROM archive_claims) "
+        "FOR UPDATE OF investigations"
+        ") SELECT id FROM locked"
+    ))
+
+
+def _write_ndjson(db: Session, query: str, path: Path) -> int:
+    """Stream a query's rows into a gzip-compressed NDJSON file."""
+    count = 0
+    result = db.execute(text(query).execution_options(stream_results=True, yield_per=ARCHIVE_BATCH_SIZE))
+    with gzip.open(path, "wb") as handle:
+        for rows in result.mappings().partitions():
+            handle.write(b"".join(orjson.dumps(dict(row), default=str) + b"\n" for row in rows))
+            count += len(rows)
+    return count
+
+
+def archive_partition(db: Session, partition: str, month: datetime, archive_root: str) -> Dict[str, int]:
+    """
+    Archive one monthly partition and drop it.
+
+    Articles, their bodies, claims, investigations and evidence are written to
+    <archive_root>/<YYYY_MM>/<table>.ndjson.gz alongside a manifest.
+
+    The partition is detached first, so no article can be added to it while
+    it is archived, and its claims and investigations are locked (see
+    _lock_archive_set); only the rows that were archived are then deleted.
+    Files are written to a temporary directory and moved into place before
+    anything is deleted. If the run fails, the partition is attached again
+    and nothing is deleted.
+
+    Args:
+        db: Database session
+        partition: Partition table name
+        month: First day of the partition's month
+        archive_root: Directory archives are written under
+
+    Returns:
+        Row counts per archived table
+    """
+    db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition}"))
+    db.commit()
+
+    try:
+        counts, final_dir, investigation_ids = _archive_detached(db, partition, month, archive_root)
+    except Exception:
+        db.rollback()
+        attach_partition(db, partition, month)
+        db.commit()
+        raise
+
+    # The raw-SQL deletes bypass the ORM events that evict cached investigations
+    invalidate_investigations(investigation_ids)
+
+    logger.info("article_partition_archived", partition=partition, path=str(final_dir), rows=counts)
+    return counts
+
+
+def _archive_detached(db: Session, partition: str, month: datetime, archive_root: str):
+    """Write a detached partition's archive and delete what it holds, in one transaction."""
+    final_dir = Path(archive_root) / f"{month:%Y_%m}"
+    tmp_dir = final_dir.with_name(final_dir.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    _lock_archive_set(db, partition)
+
+    counts = {}
+    for table, query in ARCHIVE_QUERIES.items():
+        counts[table] = _write_ndjson(db, query.format(partition=partition), tmp_dir / f"{table}.ndjson.gz")
+
+    (tmp_dir / "manifest.json").write_text(json.dumps({
+        "partition": partition,
+        "from": month.isoformat(),
+        "to": add_months(month, 1).isoformat(),
+        "archived_at": datetime.utcnow().isoformat(),
+        "rows": counts,
+    }, indent=2))
+
+    shutil.rmtree(final_dir, ignore_errors=True)
+    tmp_dir.rename(final_dir)
+
+    investigation_ids = [
+        str(investigation_id)
+        for investigation_id in db.execute(text("SELECT id FROM archive_investigations")).scalars()
+    ]
+    # Claims cascade to investigations and evidence, which are locked to the
+    # archived set; the articles themselves leave by dropping the partition
+    db.execute(text("DELETE FROM claims WHERE id IN (SELECT id FROM archive_claims)"))
+    late_claims = db.execute(
+        text(f"SELECT count(*) FROM claims WHERE article_id IN (SELECT id FROM {partition})")
+    ).scalar()
+    if late_claims:
+        # Created after the set was locked; retry on the next run rather than orphan them
+        raise RuntimeError(f"{late_claims} claims were added to {partition} while it was archived")
+    # Bodies are shared by hash; keep any still referenced by a live article
+    db.execute(text(
+        f"DELETE FROM article_contents WHERE content_hash IN (SELECT content_hash FROM {partition}) "
+        f"AND NOT EXISTS (SELECT 1 FROM {PARENT_TABLE} a WHERE a.content_hash = article_contents.content_hash)"
+    ))
+    db.execute(text(f"DROP TABLE {partition}"))
+    db.commit()
+    return counts, final_dir, investigation_ids
+
+
+def enforce_retention(db: Session, max_age_days: int, archive_root: str) -> List[str]:
+    """
+    Archive and drop every partition that lies entirely past the retention window.
+
+    A month is only archived once its last day is older than max_age_days,
+    so articles are kept for at least max_age_days and at most about a month
+    longer.
+
+    Args:
+        db: Database session
+        max_age_days: Retention window (settings.MAX_ARTICLE_AGE_DAYS)
+        archive_root: Directory archives are written under
+
+    Returns:
+        Names of archived partitions
+    """
+    cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+    archived = []
+
+    for partition, month in list_partitions(db):
+        if add_months(month, 1) > cutoff:
+            break
+        archive_partition(db, partition, month, archive_root)
+        archived.append(partition)
+
+    stale_defaults = db.execute(
+        text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE created_at < :cutoff"),
+        {"cutoff": cutoff}
+    ).scalar()
+    if stale_defaults:
+        logger.warning("article_default_partition_has_expired_rows", rows=stale_defaults)
+
+    return archived
@@ -0,0 +1,125 @@
+"""Monthly range partitions of the articles table."""
+import re
+from datetime import datetime
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.logging import logger
+
+PARENT_TABLE = "articles"
+DEFAULT_PARTITION = "articles_default"
+PARTITION_NAME = re.compile(r"^articles_(\d{4})_(\d{2})$")
+
+
+def month_start(value: datetime) -> datetime:
+    """Truncate a datetime to the first instant of its month."""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    """Shift a month-start datetime by count months."""
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Name of the partition holding articles created in month."""
+    return f"{PARENT_TABLE}_{month:%Y_%m}"
+
+
+def list_partitions(db: Session) -> List[Tuple[str, datetime]]:
+    """
+    List the monthly partitions currently attached to articles.
+
+    Args:
+        db: Database session
+
+    Returns:
+        (partition name, month start) tuples, oldest first. The default
+        partition is not included.
+    """
+    names = db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent"
+        ),
+        {"parent": PARENT_TABLE}
+    ).scalars().all()
+
+    partitions = []
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match:
+            partitions.append((name, datetime(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def attach_partition(db: Session, name: str, month: datetime) -> None:
+    """Attach an existing table as the partition for month (the caller commits)."""
+    # Bounds are computed datetimes, not user input; DDL can't take bind parameters
+    db.execute(text(
+        f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+        f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{add_months(month, 1):%Y-%m-%d}')"
+    ))
+
+
+def create_partition(db: Session, month: datetime) -> bool:
+    """
+    Create and attach the partition for one month, if it doesn't exist yet.
+
+    Rows for that month that already landed in the default partition are
+    moved into the new partition first; Postgres refuses to attach a range
+    the default partition still holds rows for.
+
+    Args:
+        db: Database session (the caller commits)
+        month: Any datetime within the month
+
+    Returns:
+        True if a partition was created
+    """
+    month = month_start(month)
+    name = partition_name(month)
+    exists = db.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar()
+    if exists:
+        return False
+
+    bounds = {"lower": month, "upper": add_months(month, 1)}
+    db.execute(text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS)"))
+    moved = db.execute(
+        text(
+            f"WITH moved AS ("
+            f"DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= :lower AND created_at < :upper RETURNING *"
+            f") INSERT INTO {name} SELECT * FROM moved"
+        ),
+        bounds
+    ).rowcount
+    attach_partition(db, name, month)
+
+    logger.info("article_partition_created", partition=name, rows_moved_from_default=moved)
+    return True
+
+
+def ensure_partitions(db: Session, months_ahead: int) -> List[str]:
+    """
+    Make sure partitions exist for the current month and months_ahead after it.
+
+    Args:
+        db: Database session
+        months_ahead: Number of future months to pre-create
+
+    Returns:
+        Names of newly created partitions
+    """
+    current = month_start(datetime.utcnow())
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if create_partition(db, month):
+            created.append(partition_name(month))
+    db.commit()
+    return created
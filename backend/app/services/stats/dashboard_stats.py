@@ -2,10 +2,22 @@
 from datetime import datetime, timedelta
 from typing import Dict, List
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, distinct, literal
 from app.models.article import Article
 from app.models.claim import Claim
 from app.models.investigation import Investigation
+from app.models.investigation_technique import InvestigationTechnique
+from app.models.source import NewsSource
+
+# Technique count per investigation that maps to a propaganda score of 1.0
+MAX_TECHNIQUES = 10
+
+
+def _propaganda_score(technique_count, investigation_count):
+    """Average techniques per investigation, normalised to 0-1 (SQL expression)."""
+    # least() skips NULLs, so no investigations must become 0 before capping
+    average = technique_count * literal(1.0) / func.nullif(investigation_count, 0) / MAX_TECHNIQUES
+    return func.least(func.coalesce(average, 0.0), 1.0)
 
 
 def parse_time_range(time_range: str) -> int:
@@ -135,21 +147,13 @@ def calculate_quality_metrics(db: Session) -> Dict:
     # Average source reliability
     avg_reliability = db.query(func.avg(Investigation.source_reliability_avg)).scalar() or 0.0
 
-    # Calculate avg propaganda score from propaganda_signals JSONB
-    investigations = db.query(Investigation).all()
-    total_propaganda = 0
-    count = 0
-
-    for inv in investigations:
-        if inv.propaganda_signals and isinstance(inv.propaganda_signals, dict):
-            techniques = inv.propaganda_signals.get('techniques', [])
-            if techniques:
-                total_propaganda += len(techniques)
-                count += 1
-
-    # Normalize to 0-1 scale (assuming max 10 techniques per investigation)
-    avg_propaganda_score = (total_propaganda / count / 10) if count > 0 else 0.0
-    avg_propaganda_score = min(avg_propaganda_score, 1.0)  # Cap at 1.0
+    # Average propaganda score over investigations with at least one technique
+    avg_propaganda_score = float(db.query(
+        _propaganda_score(
+            func.count(InvestigationTechnique.id),
+            func.count(distinct(InvestigationTechnique.investigation_id))
+        )
+    ).scalar() or 0.0)
 
     return {
         "avg_confidence": round(avg_confidence, 2),
@@ -230,63 +234,59 @@ def analyze_propaganda_patterns(db: Session) -> Dict:
     Returns:
         Dictionary with propaganda analysis
     """
-    investigations = db.query(Investigation).all()
-
-    # Count techniques
-    technique_counts = {}
-    source_data = {}
+    # Most frequent techniques (each counted once per investigation)
+    technique_rows = db.query(
+        InvestigationTechnique.technique,
+        func.count(InvestigationTechnique.id).label("count")
+    ).group_by(
+        InvestigationTechnique.technique
+    ).order_by(
+        desc("count"), InvestigationTechnique.technique
+    ).limit(5).all()
 
-    for inv in investigations:
-        # Extract techniques
-        if inv.propaganda_signals and isinstance(inv.propaganda_signals, dict):
-            techniques = inv.propaganda_signals.get('techniques', [])
-            for tech in techniques:
-                if isinstance(tech, str):
-                    technique_counts[tech] = technique_counts.get(tech, 0) + 1
-
-        # Aggregate source data
-        claim = db.query(Claim).filter(Claim.id == inv.claim_id).first()
-        if claim and claim.article and claim.article.source:
-            source_name = claim.article.source.name
-
-            if source_name not in source_data:
-                source_data[source_name] = {
-                    "total_techniques": 0,
-                    "count": 0,
-                    "articles": set()
-                }
-
-            # Count techniques for this source
-            if inv.propaganda_signals and isinstance(inv.propaganda_signals, dict):
-                tech_count = len(inv.propaganda_signals.get('techniques', []))
-                source_data[source_name]["total_techniques"] += tech_count
-
-            source_data[source_name]["count"] += 1
-            source_data[source_name]["articles"].add(str(claim.article_id))
-
-    # Build top techniques list
     top_techniques = [
-        {"technique": k, "count": v}
-        for k, v in sorted(technique_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        {"technique": technique, "count": count}
+        for technique, count in technique_rows
     ]
 
-    # Build problematic sources list
-    problematic_sources = []
-    for name, data in source_data.items():
-        if data["count"] > 0:
-            # Calculate propaganda score (normalized to 0-1)
-            avg_techniques = data["total_techniques"] / data["count"]
-            propaganda_score = min(avg_techniques / 10, 1.0)  # Normalize, cap at 1.0
-
-            problematic_sources.append({
-                "source_name": name,
-                "propaganda_score": round(propaganda_score, 2),
-                "article_count": len(data["articles"])
-            })
-
-    # Sort by score and take top 5
-    problematic_sources.sort(key=lambda x: x["propaganda_score"], reverse=True)
-    problematic_sources = problematic_sources[:5]
+    # Sources ranked by average techniques per investigated claim
+    techniques_per_investigation = db.query(
+        InvestigationTechnique.investigation_id,
+        func.count(InvestigationTechnique.id).label("technique_count")
+    ).group_by(InvestigationTechnique.investigation_id).subquery()
+
+    score = _propaganda_score(
+        func.coalesce(func.sum(techniques_per_investigation.c.technique_count), 0),
+        func.count(Investigation.id)
+    ).label("propaganda_score")
+
+    source_rows = db.query(
+        NewsSource.name,
+        score,
+        func.count(distinct(Claim.article_id)).label("article_count")
+    ).select_from(Investigation).join(
+        Claim, Claim.id == Investigation.claim_id
+    ).join(
+        Article, Article.id == Claim.article_id
+    ).join(
+        NewsSource, NewsSource.id == Article.source_id
+    ).outerjoin(
+        techniques_per_investigation,
+        techniques_per_investigation.c.investigation_id == Investigation.id
+    ).group_by(
+        NewsSource.id, NewsSource.name
+    ).order_by(
+        desc("propaganda_score"), NewsSource.name
+    ).limit(5).all()
+
+    problematic_sources = [
+        {
+            "source_name": name,
+            "propaganda_score": round(float(propaganda_score or 0.0), 2),
+            "article_count": article_count
+        }
+        for name, propaganda_score, article_count in source_rows
+    ]
 
     return {
         "top_techniques": top_techniques,
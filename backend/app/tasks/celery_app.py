@@ -1,8 +1,17 @@
 """Celery application configuration."""
 import os
 from celery import Celery
+from celery.signals import (
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+)
 from celery.schedules import crontab
 
+from app.tasks.routing import task_queues
+
 # Get environment variables
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://redis:6379/1")
@@ -12,7 +21,7 @@ celery_app = Celery(
     "factcheck",
     broker=CELERY_BROKER_URL,
     backend=CELERY_RESULT_BACKEND,
-    include=["app.tasks.rss_tasks", "app.tasks.claim_tasks"]
+    include=["app.tasks.rss_tasks", "app.tasks.claim_tasks", "app.tasks.maintenance_tasks"]
 )
 
 # Celery configuration
@@ -27,6 +36,16 @@ celery_app.conf.update(
     task_soft_time_limit=240,  # Soft limit at 4 minutes
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
+    # Extraction and fact-check tasks go to <stage>.<tier> queues chosen by
+    # influence score (see app.tasks.routing); everything else is routed here
+    task_queues=task_queues(),
+    task_routes={
+        "app.tasks.rss_tasks.*": {"queue": "rss_ingestion"},
+        "app.tasks.maintenance_tasks.*": {"queue": "maintenance"},
+    },
+    # Workers consuming several tiers drain them in -Q order (high first)
+    # instead of round robin
+    broker_transport_options={"queue_order_strategy": "priority"},
 )
 
 # Periodic task schedule using Celery Beat
@@ -46,7 +65,61 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(minute="*/10"),  # Every 10 minutes
         "options": {"queue": "fact_checking"}
     },
+    "maintain-article-partitions-daily": {
+        "task": "app.tasks.maintenance_tasks.maintain_article_partitions",
+        "schedule": crontab(minute=15, hour=2),  # Daily at 02:15 UTC
+        "options": {"queue": "maintenance"}
+    },
+    "enforce-article-retention-daily": {
+        "task": "app.tasks.maintenance_tasks.enforce_article_retention",
+        "schedule": crontab(minute=45, hour=2),  # Daily at 02:45 UTC
+        "options": {"queue": "maintenance"}
+    },
 }
 
 # Optional: Set default queue name
 celery_app.conf.task_default_queue = "default"
+
+
+@worker_init.connect
+def _register_cache_invalidation(**kwargs):
+    """Invalidate cached API responses for rows written by this worker."""
+    from app.services.cache.investigation_cache import register_cache_invalidation
+    register_cache_invalidation()
+
+
+@worker_init.connect
+def _start_metrics_server(**kwargs):
+    """Expose pool metrics from the worker's main process, if configured."""
+    from app.config import settings
+    from app.core.metrics import start_metrics_server
+    if settings.WORKER_METRICS_PORT:
+        start_metrics_server(settings.WORKER_METRICS_PORT)
+
+
+@worker_process_init.connect
+def _reset_db_pools(**kwargs):
+    """Give each prefork child its own database connections."""
+    from app.db.session import reset_pools_after_fork
+    reset_pools_after_fork()
+
+
+@worker_process_shutdown.connect
+def _mark_metrics_process_dead(pid=None, **kwargs):
+    """Stop reporting a finished child's live gauges."""
+    from app.core.metrics import mark_process_dead
+    mark_process_dead(pid or os.getpid())
+
+
+@task_prerun.connect
+def _record_idle_time(task=None, **kwargs):
+    """Count the gap since this process's previous task as idle time."""
+    from app.tasks.dispatch import task_started
+    task_started(task.request.hostname or "unknown")
+
+
+@task_postrun.connect
+def _mark_task_finished(**kwargs):
+    """Start this process's idle clock."""
+    from app.tasks.dispatch import task_finished
+    task_finished()
@@ -1,25 +1,221 @@
 """Celery tasks for claim extraction and fact-checking."""
 import logging
+import time
+from datetime import datetime, timedelta
 from uuid import UUID
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.tasks.celery_app import celery_app
+from app.tasks.routing import EXTRACTION, FACT_CHECK, queue_for
+from app.tasks.dispatch import batch_size, record_task_latency
+from app.config import settings
 from app.db.session import SessionLocal
 from app.models.article import Article
 from app.models.claim import Claim
 from app.models.investigation import Investigation
 from app.models.evidence import Evidence
+from app.models.investigation_technique import InvestigationTechnique
 from app.services.analysis.claim_extractor import ClaimExtractor
 from app.services.analysis.fact_checker import FactChecker
 from app.services.analysis.influence_scorer import InfluenceScorer
 from app.services.analysis.evidence_searcher import EvidenceSearcher
-from app.services.analysis.propaganda_detector import PropagandaDetector
+from app.services.analysis.propaganda_detector import PropagandaDetector, extract_techniques
+from app.services.llm.errors import LLMUnavailableError
+from app.services.events.publisher import (
+    publish_event,
+    publish_queue_depth,
+    release_trailing_publish,
+    ARTICLE_PROCESSED,
+    INVESTIGATION_CREATED,
+)
 import asyncio
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Sweep batch sizes when worker capacity is unknown
+PENDING_ARTICLES_BATCH = 50
+PENDING_CLAIMS_BATCH = 20
+
+
+def pending_articles_query(db, limit: int = PENDING_ARTICLES_BATCH, created_before: Optional[datetime] = None):
+    """
+    Pending articles, highest influence first.
+
+    Served by the partial index ix_articles_pending_influence.
+
+    Args:
+        db: Database session
+        limit: Maximum number of articles
+        created_before: Only articles created before this time
+
+    Returns:
+        Query of (id, influence_score) rows
+    """
+    query = db.query(Article.id, Article.influence_score).filter(Article.status == 'pending')
+    if created_before is not None:
+        query = query.filter(Article.created_at < created_before)
+    return query.order_by(
+        Article.influence_score.desc()
+    ).limit(limit)
+
+
+def pending_claims_query(db, limit: int = PENDING_CLAIMS_BATCH, created_before: Optional[datetime] = None):
+    """
+    Pending, checkable claims, highest priority first.
+
+    Claim.priority mirrors the article's influence score, so no join to
+    articles is needed; served by the partial index ix_claims_pending_priority.
+
+    Args:
+        db: Database session
+        limit: Maximum number of claims
+        created_before: Only claims created before this time
+
+    Returns:
+        Query of (id, priority) rows
+    """
+    query = db.query(Claim.id, Claim.priority).filter(
+        Claim.status == 'pending',
+        Claim.is_checkable == True
+    )
+    if created_before is not None:
+        query = query.filter(Claim.created_at < created_before)
+    return query.order_by(
+        Claim.priority.desc()
+    ).limit(limit)
+
+
+def _set_status(db, model, item_id: UUID, status: str, expected: Optional[str] = None) -> bool:
+    """
+    Set an article's or claim's status and commit.
+
+    With expected set this is an atomic compare-and-set. An item can be
+    queued more than once (on commit of the previous stage and again by a
+    sweeper), so tasks take ownership by moving it out of 'pending'; only
+    the first succeeds, later duplicates see no row updated and skip.
+
+    Args:
+        db: Database session
+        model: Article or Claim
+        item_id: Row id
+        status: New status
+        expected: Only update if the row currently has this status
+
+    Returns:
+        True if the row was updated
+    """
+    query = db.query(model).filter(model.id == item_id)
+    if expected is not None:
+        query = query.filter(model.status == expected)
+    updated = query.update(
+        {model.status: status, model.updated_at: datetime.utcnow()},
+        synchronize_session=False
+    )
+    db.commit()
+    return updated > 0
+
+
+def _sweep_cutoff() -> Optional[datetime]:
+    """
+    Sweepers skip items newer than this in event-driven mode.
+
+    Those were enqueued when they were committed and are most likely still
+    waiting in the queue.
+    """
+    if not settings.PIPELINE_EVENT_DRIVEN:
+        return None
+    return datetime.utcnow() - timedelta(seconds=settings.PIPELINE_SWEEP_GRACE_SECONDS)
+
+
+def _reset_stale(db, model, busy_status: str) -> int:
+    """
+    Hand items stuck in busy_status back to 'pending'.
+
+    Covers workers that died mid-task; the next sweep re-queues them.
+
+    Returns:
+        Number of rows reset
+    """
+    stale_before = datetime.utcnow() - timedelta(seconds=settings.PIPELINE_STALE_SECONDS)
+    reset = db.query(model).filter(
+        model.status == busy_status,
+        model.updated_at < stale_before
+    ).update(
+        {model.status: 'pending', model.updated_at: datetime.utcnow()},
+        synchronize_session=False
+    )
+    db.commit()
+    if reset:
+        logger.warning(f"Reset {reset} {model.__tablename__} stuck in '{busy_status}' to pending")
+    return reset
+
+
+def enqueue_extractions(articles: Iterable[Tuple[UUID, Optional[float]]]) -> List[str]:
+    """
+    Queue claim extraction on the priority queue for each article's influence.
+
+    Args:
+        articles: (article id, influence_score) pairs
+
+    Returns:
+        Task ids
+    """
+    return [
+        extract_claims_from_article.apply_async(
+            args=[str(article_id)], queue=queue_for(EXTRACTION, influence_score)
+        ).id
+        for article_id, influence_score in articles
+    ]
+
+
+def enqueue_fact_checks(claims: Iterable[Tuple[UUID, Optional[float]]]) -> List[str]:
+    """
+    Queue fact-checks on the priority queue for each claim's priority.
+
+    Args:
+        claims: (claim id, priority) pairs
+
+    Returns:
+        Task ids
+    """
+    return [
+        fact_check_claim.apply_async(
+            args=[str(claim_id)], queue=queue_for(FACT_CHECK, priority)
+        ).id
+        for claim_id, priority in claims
+    ]
+
+
+def report_queue_depth(db) -> None:
+    """
+    Publish the queue depth for live dashboards, throttled across workers.
+
+    When this call falls inside another worker's publish window and no
+    trailing publish is pending yet, one is scheduled for when the window
+    closes, so the last depth of a burst (often 0) still goes out.
+    """
+    delay = publish_queue_depth(db)
+    if delay is None:
+        return
+    try:
+        flush_queue_depth.apply_async(countdown=delay)
+    except Exception as e:
+        release_trailing_publish()
+        logger.warning(f"Could not schedule the trailing queue depth publish: {e}")
+
+
+@celery_app.task(name="app.tasks.claim_tasks.flush_queue_depth")
+def flush_queue_depth() -> None:
+    """Trailing queue depth publish, run when a throttle window closes."""
+    release_trailing_publish()
+    db = SessionLocal()
+    try:
+        report_queue_depth(db)
+    finally:
+        db.close()
+
 
 @celery_app.task(
     bind=True,
@@ -55,9 +251,16 @@ def extract_claims_from_article(self, article_id: str) -> Dict[str, any]:
                 "claims_extracted": 0
             }
 
-        # Update article status
-        article.status = "processing"
-        db.commit()
+        # Take ownership; a duplicate task for the same article stops here
+        if not _set_status(db, Article, article_uuid, "processing", expected="pending"):
+            logger.info(f"Article {article_id} is no longer pending, skipping")
+            return {
+                "success": True,
+                "article_id": article_id,
+                "skipped": True,
+                "claims_extracted": 0
+            }
+        started = time.perf_counter()
 
         # Extract claims (async operation)
         extractor = ClaimExtractor()
@@ -67,50 +270,83 @@ def extract_claims_from_article(self, article_id: str) -> Dict[str, any]:
         for claim in claims:
             db.add(claim)
 
-        # Update article status
+        # Update article status and claim counter in the same transaction
         article.status = "processed" if claims else "error"
+        article.claim_count = Article.claim_count + len(claims)
+        db.flush()
+        checkable_claims = [(claim.id, claim.priority) for claim in claims if claim.is_checkable]
         db.commit()
 
         logger.info(f"Extracted {len(claims)} claims from article {article_id}")
 
+        # Event-driven mode: fact-check the new claims now rather than on the next sweep
+        if settings.PIPELINE_EVENT_DRIVEN and checkable_claims:
+            try:
+                enqueue_fact_checks(checkable_claims)
+            except Exception as e:
+                logger.warning(f"Could not enqueue fact-checks for article {article_id}, leaving them to the sweeper: {e}")
+
+        # Notify live subscribers once the claims are committed
+        publish_event(ARTICLE_PROCESSED, {
+            "article_id": article_id,
+            "status": article.status,
+            "claims_extracted": len(claims)
+        })
+        report_queue_depth(db)
+        record_task_latency(EXTRACTION, time.perf_counter() - started)
+
         return {
             "success": True,
             "article_id": article_id,
             "claims_extracted": len(claims)
         }
 
+    except LLMUnavailableError as e:
+        # Ollama is down or saturated: hand the article back for a later
+        # sweep rather than spending retries (and a worker) on it
+        db.rollback()
+        logger.warning(f"Deferring article {article_id}: {e}")
+        _set_status(db, Article, UUID(article_id), "pending", expected="processing")
+        return {
+            "success": False,
+            "article_id": article_id,
+            "deferred": True,
+            "error": str(e),
+            "claims_extracted": 0
+        }
+
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f"Database error extracting claims: {e}")
 
-        try:
+        if self.request.retries < self.max_retries:
+            # Hand the article back so the retry can take ownership again
+            _set_status(db, Article, UUID(article_id), "pending", expected="processing")
             raise self.retry(exc=e)
-        except self.MaxRetriesExceededError:
-            # Update article to error status
-            article = db.query(Article).filter(Article.id == UUID(article_id)).first()
-            if article:
-                article.status = "error"
-                db.commit()
 
-            return {
-                "success": False,
-                "article_id": article_id,
-                "error": f"Database error: {str(e)}",
-                "claims_extracted": 0
-            }
+        _set_status(db, Article, UUID(article_id), "error")
+        return {
+            "success": False,
+            "article_id": article_id,
+            "error": f"Database error: {str(e)}",
+            "claims_extracted": 0
+        }
 
     except Exception as e:
+        db.rollback()
         logger.error(f"Error extracting claims: {e}", exc_info=True)
 
-        try:
+        if self.request.retries < self.max_retries:
+            _set_status(db, Article, UUID(article_id), "pending", expected="processing")
             raise self.retry(exc=e)
-        except self.MaxRetriesExceededError:
-            return {
-                "success": False,
-                "article_id": article_id,
-                "error": str(e),
-                "claims_extracted": 0
-            }
+
+        _set_status(db, Article, UUID(article_id), "error")
+        return {
+            "success": False,
+            "article_id": article_id,
+            "error": str(e),
+            "claims_extracted": 0
+        }
 
     finally:
         db.close()
@@ -124,7 +360,10 @@ def process_pending_articles(self) -> Dict[str, any]:
     """
     Process all pending articles for claim extraction.
 
-    Prioritizes articles by influence_score (highest first) - priority queue system.
+    Prioritizes articles by influence_score (highest first) and queues each
+    on the claim_extraction.<tier> queue for its score.
+    In event-driven mode (PIPELINE_EVENT_DRIVEN) new articles are queued on
+    ingestion, so this only sweeps up articles that were missed.
 
     Returns:
         Dictionary with summary of queued tasks
@@ -134,32 +373,32 @@ def process_pending_articles(self) -> Dict[str, any]:
     try:
         logger.info("Processing pending articles for claim extraction")
 
-        # Query pending articles, ordered by influence score (priority queue)
-        articles = db.query(Article).filter(
-            Article.status == 'pending'
-        ).order_by(
-            Article.influence_score.desc()
-        ).limit(50).all()  # Process max 50 at a time
+        # Query pending articles, ordered by influence score (priority queue).
+        # Only ids and scores (for queue routing) are needed here; content is
+        # loaded by the extraction task.
+        _reset_stale(db, Article, "processing")
+        backlog = db.query(Article).filter(Article.status == 'pending').count()
+        limit = batch_size(EXTRACTION, backlog, fallback=PENDING_ARTICLES_BATCH)
+        articles = pending_articles_query(db, limit, created_before=_sweep_cutoff()).all() if limit else []
 
         if not articles:
-            logger.info("No pending articles to process")
+            logger.info(f"No pending articles to queue (backlog {backlog}, batch {limit})")
             return {
                 "success": True,
                 "articles_queued": 0,
-                "message": "No pending articles"
+                "backlog": backlog,
+                "message": "No pending articles" if not backlog else "Workers already have enough queued"
             }
 
         # Queue extraction tasks
-        task_ids = []
-        for article in articles:
-            result = extract_claims_from_article.delay(str(article.id))
-            task_ids.append(result.id)
+        task_ids = enqueue_extractions(articles)
 
         logger.info(f"Queued {len(articles)} articles for claim extraction")
 
         return {
             "success": True,
             "articles_queued": len(articles),
+            "backlog": backlog,
             "task_ids": task_ids
         }
 
@@ -211,9 +450,15 @@ def fact_check_claim(self, claim_id: str) -> Dict[str, any]:
                 "error": "Claim not found"
             }
 
-        # Update claim status
-        claim.status = "checking"
-        db.commit()
+        # Take ownership; a duplicate task for the same claim stops here
+        if not _set_status(db, Claim, claim_uuid, "checking", expected="pending"):
+            logger.info(f"Claim {claim_id} is no longer pending, skipping")
+            return {
+                "success": True,
+                "claim_id": claim_id,
+                "skipped": True
+            }
+        started = time.perf_counter()
 
         # 1. Search for evidence
         evidence_searcher = EvidenceSearcher()
@@ -258,6 +503,10 @@ def fact_check_claim(self, claim_id: str) -> Dict[str, any]:
 
         # Update investigation with propaganda signals and evidence counts
         investigation.propaganda_signals = propaganda_signals
+        investigation.techniques = [
+            InvestigationTechnique(technique=technique, confidence=confidence)
+            for technique, confidence in extract_techniques(propaganda_signals)
+        ]
         investigation.evidence_count = len(evidence_list)
         investigation.supporting_evidence_count = sum(
             1 for e in evidence_list if e.stance == 'supporting'
@@ -269,6 +518,13 @@ def fact_check_claim(self, claim_id: str) -> Dict[str, any]:
         # Update claim status
         claim.status = "verified"
 
+        # Keep the article's completed investigation counter in step
+        if investigation.status == "completed":
+            db.query(Article).filter(Article.id == claim.article_id).update(
+                {Article.completed_investigation_count: Article.completed_investigation_count + 1},
+                synchronize_session=False
+            )
+
         # Commit all changes
         db.commit()
 
@@ -279,6 +535,18 @@ def fact_check_claim(self, claim_id: str) -> Dict[str, any]:
             f"propaganda_score={propaganda_signals.get('overall_propaganda_score', 0.0)}"
         )
 
+        # Notify live subscribers once the investigation is committed
+        publish_event(INVESTIGATION_CREATED, {
+            "id": str(investigation.id),
+            "claim_id": claim_id,
+            "article_id": str(claim.article_id) if claim.article_id else None,
+            "claim_text": claim.claim_text,
+            "verdict": investigation.verdict,
+            "confidence_score": investigation.confidence_score
+        })
+        report_queue_depth(db)
+        record_task_latency(FACT_CHECK, time.perf_counter() - started)
+
         return {
             "success": True,
             "claim_id": claim_id,
@@ -288,36 +556,48 @@ def fact_check_claim(self, claim_id: str) -> Dict[str, any]:
             "propaganda_score": propaganda_signals.get('overall_propaganda_score', 0.0)
         }
 
+    except LLMUnavailableError as e:
+        # Ollama is down or saturated: hand the claim back for a later sweep
+        db.rollback()
+        logger.warning(f"Deferring claim {claim_id}: {e}")
+        _set_status(db, Claim, UUID(claim_id), "pending", expected="checking")
+        return {
+            "success": False,
+            "claim_id": claim_id,
+            "deferred": True,
+            "error": str(e)
+        }
+
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f"Database error fact-checking claim: {e}")
 
-        try:
+        if self.request.retries < self.max_retries:
+            # Hand the claim back so the retry can take ownership again
+            _set_status(db, Claim, UUID(claim_id), "pending", expected="checking")
             raise self.retry(exc=e)
-        except self.MaxRetriesExceededError:
-            # Update claim to error status
-            claim = db.query(Claim).filter(Claim.id == UUID(claim_id)).first()
-            if claim:
-                claim.status = "error"
-                db.commit()
 
-            return {
-                "success": False,
-                "claim_id": claim_id,
-                "error": f"Database error: {str(e)}"
-            }
+        _set_status(db, Claim, UUID(claim_id), "error")
+        return {
+            "success": False,
+            "claim_id": claim_id,
+            "error": f"Database error: {str(e)}"
+        }
 
     except Exception as e:
+        db.rollback()
         logger.error(f"Error fact-checking claim: {e}", exc_info=True)
 
-        try:
+        if self.request.retries < self.max_retries:
+            _set_status(db, Claim, UUID(claim_id), "pending", expected="checking")
             raise self.retry(exc=e)
-        except self.MaxRetriesExceededError:
-            return {
-                "success": False,
-                "claim_id": claim_id,
-                "error": str(e)
-            }
+
+        _set_status(db, Claim, UUID(claim_id), "error")
+        return {
+            "success": False,
+            "claim_id": claim_id,
+            "error": str(e)
+        }
 
     finally:
         db.close()
@@ -331,7 +611,10 @@ def process_pending_claims(self) -> Dict[str, any]:
     """
     Process all pending claims for fact-checking.
 
-    Prioritizes claims from high-influence articles (priority queue system).
+    Prioritizes claims from high-influence articles and queues each on the
+    fact_checking.<tier> queue for its priority.
+    In event-driven mode claims are queued as soon as they are extracted, so
+    this only sweeps up claims that were missed.
 
     Returns:
         Dictionary with summary of queued tasks
@@ -342,32 +625,32 @@ def process_pending_claims(self) -> Dict[str, any]:
         logger.info("Processing pending claims for fact-checking")
 
         # Query pending claims, prioritized by article influence score
-        claims = db.query(Claim).join(Article).filter(
+        _reset_stale(db, Claim, "checking")
+        backlog = db.query(Claim).filter(
             Claim.status == 'pending',
             Claim.is_checkable == True
-        ).order_by(
-            Article.influence_score.desc()
-        ).limit(20).all()  # Process max 20 at a time
+        ).count()
+        limit = batch_size(FACT_CHECK, backlog, fallback=PENDING_CLAIMS_BATCH)
+        claims = pending_claims_query(db, limit, created_before=_sweep_cutoff()).all() if limit else []
 
         if not claims:
-            logger.info("No pending claims to process")
+            logger.info(f"No pending claims to queue (backlog {backlog}, batch {limit})")
             return {
                 "success": True,
                 "claims_queued": 0,
-                "message": "No pending claims"
+                "backlog": backlog,
+                "message": "No pending claims" if not backlog else "Workers already have enough queued"
             }
 
         # Queue fact-check tasks
-        task_ids = []
-        for claim in claims:
-            result = fact_check_claim.delay(str(claim.id))
-            task_ids.append(result.id)
+        task_ids = enqueue_fact_checks(claims)
 
         logger.info(f"Queued {len(claims)} claims for fact-checking")
 
         return {
             "success": True,
             "claims_queued": len(claims),
+            "backlog": backlog,
             "task_ids": task_ids
         }
 
@@ -416,8 +699,12 @@ def calculate_article_influence(self, article_id: str) -> Dict[str, any]:
         scorer = InfluenceScorer()
         influence_score = scorer.calculate_influence_score(article, article.source)
 
-        # Update article
+        # Update article and the queue priority of its claims
         article.influence_score = influence_score
+        db.query(Claim).filter(Claim.article_id == article.id).update(
+            {Claim.priority: influence_score},
+            synchronize_session=False
+        )
         db.commit()
 
         logger.info(f"Article {article_id} influence score: {influence_score}")
@@ -0,0 +1,203 @@
+"""Adaptive batch sizes for the pipeline sweepers.
+
+A sweep queues roughly what the workers serving a stage can finish before
+the next sweep, less what is already waiting on the broker:
+
+    drain rate = worker slots / mean task latency
+    batch      = drain rate * sweep interval * DISPATCH_HEADROOM - queued
+
+Worker slots come from Celery's inspect API, mean latency from an
+exponentially weighted average kept in Redis by the tasks themselves.
+When no worker answers the inspect broadcast the fixed fallback batch is
+used, as before.
+"""
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from kombu.exceptions import ChannelError
+
+from app.config import settings
+from app.core.logging import logger
+from app.core.metrics import (
+    PIPELINE_BACKLOG,
+    PIPELINE_DISPATCH_BATCH,
+    PIPELINE_DRAIN_RATE,
+    PIPELINE_IDLE_SLOTS,
+    PIPELINE_QUEUED,
+    PIPELINE_TASK_DURATION,
+    WORKER_IDLE_SECONDS,
+)
+from app.core.redis import get_redis_client
+from app.tasks.celery_app import celery_app
+from app.tasks.routing import EXTRACTION, FACT_CHECK, TIERS, tier_queue
+
+# Beat interval of each stage's sweeper (see celery_app.beat_schedule)
+SWEEP_INTERVAL_SECONDS = {EXTRACTION: 300, FACT_CHECK: 600}
+
+# Task doing the work of each stage
+STAGE_TASKS = {
+    EXTRACTION: "app.tasks.claim_tasks.extract_claims_from_article",
+    FACT_CHECK: "app.tasks.claim_tasks.fact_check_claim",
+}
+
+LATENCY_KEY = "factcheck:pipeline:latency:{stage}"
+LATENCY_SMOOTHING = 0.2  # Weight of the newest observation
+
+# EWMA update in one round trip, so concurrent workers don't lose updates
+_EWMA_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]))
+local value = tonumber(ARGV[1])
+if current then
+    value = current + tonumber(ARGV[2]) * (value - current)
+end
+redis.call('SET', KEYS[1], value)
+return tostring(value)
+"""
+
+
+@dataclass
+class WorkerCapacity:
+    """Worker processes consuming a stage's queues, and how many are busy."""
+
+    slots: int
+    busy: int
+
+    @property
+    def idle(self) -> int:
+        return max(self.slots - self.busy, 0)
+
+
+def record_task_latency(stage: str, seconds: float):
+    """
+    Record the duration of a completed task (best-effort).
+
+    Args:
+        stage: EXTRACTION or FACT_CHECK
+        seconds: Task wall time
+    """
+    PIPELINE_TASK_DURATION.labels(stage).observe(seconds)
+    try:
+        get_redis_client().eval(
+            _EWMA_SCRIPT, 1, LATENCY_KEY.format(stage=stage), seconds, LATENCY_SMOOTHING
+        )
+    except Exception as e:
+        logger.warning("task_latency_record_failed", stage=stage, error=str(e))
+
+
+def task_latency(stage: str) -> Optional[float]:
+    """Mean task latency for a stage in seconds, or None if never observed."""
+    try:
+        value = get_redis_client().get(LATENCY_KEY.format(stage=stage))
+    except Exception as e:
+        logger.warning("task_latency_read_failed", stage=stage, error=str(e))
+        return None
+    return float(value) if value is not None else None
+
+
+def queued_tasks(stage: str) -> int:
+    """Tasks waiting in a stage's tier queues on the broker."""
+    total = 0
+    with celery_app.connection_for_read() as conn:
+        for tier in TIERS:
+            # A failed passive declare can close the channel, so one per queue
+            with conn.channel() as channel:
+                try:
+                    total += channel.queue_declare(queue=tier_queue(stage, tier), passive=True).message_count
+                except ChannelError:
+                    pass  # Queue not declared yet (or, on Redis, empty)
+    return total
+
+
+def worker_capacity() -> Optional[Dict[str, WorkerCapacity]]:
+    """
+    Worker slots and busy slots per stage, from Celery's inspect API.
+
+    A worker counts towards every stage whose tier queues it consumes; the
+    tier workers serve both stages, so their slots appear under each.
+
+    Returns:
+        Capacity per stage, or None if no worker replied
+    """
+    inspect = celery_app.control.inspect(timeout=settings.DISPATCH_INSPECT_TIMEOUT_SECONDS)
+    stats = inspect.stats()
+    if not stats:
+        return None
+    queues = inspect.active_queues() or {}
+    active = inspect.active() or {}
+
+    capacity = {stage: WorkerCapacity(slots=0, busy=0) for stage in STAGE_TASKS}
+    for node, node_stats in stats.items():
+        consumed = {queue["name"] for queue in queues.get(node, [])}
+        running = [task.get("name") for task in active.get(node, [])]
+        for stage, task_name in STAGE_TASKS.items():
+            if consumed.isdisjoint(tier_queue(stage, tier) for tier in TIERS):
+                continue
+            capacity[stage].slots += node_stats.get("pool", {}).get("max-concurrency", 0)
+            capacity[stage].busy += running.count(task_name)
+    return capacity
+
+
+def batch_size(stage: str, backlog: int, fallback: int) -> int:
+    """
+    Number of items a sweep should queue for a stage, exporting metrics.
+
+    Args:
+        stage: EXTRACTION or FACT_CHECK
+        backlog: Items pending in the database
+        fallback: Batch to use when worker capacity is unknown
+
+    Returns:
+        Batch size between 0 and DISPATCH_MAX_BATCH
+    """
+    PIPELINE_BACKLOG.labels(stage).set(backlog)
+    try:
+        capacity = worker_capacity()
+    except Exception as e:
+        logger.warning("worker_inspect_failed", stage=stage, error=str(e))
+        capacity = None
+
+    try:
+        queued = queued_tasks(stage)
+    except Exception as e:
+        logger.warning("queue_depth_read_failed", stage=stage, error=str(e))
+        queued = 0
+    PIPELINE_QUEUED.labels(stage).set(queued)
+
+    if capacity is None:
+        batch = min(backlog, fallback)
+        logger.info("dispatch_batch_fallback", stage=stage, backlog=backlog, batch=batch)
+    else:
+        stage_capacity = capacity[stage]
+        latency = task_latency(stage) or settings.DISPATCH_DEFAULT_TASK_SECONDS
+        drain_rate = stage_capacity.slots / latency
+        target = math.ceil(drain_rate * SWEEP_INTERVAL_SECONDS[stage] * settings.DISPATCH_HEADROOM)
+        batch = max(0, min(backlog, target - queued, settings.DISPATCH_MAX_BATCH))
+
+        PIPELINE_DRAIN_RATE.labels(stage).set(drain_rate)
+        PIPELINE_IDLE_SLOTS.labels(stage).set(stage_capacity.idle)
+        logger.info(
+            "dispatch_batch",
+            stage=stage, backlog=backlog, queued=queued, slots=stage_capacity.slots,
+            idle_slots=stage_capacity.idle, latency_seconds=round(latency, 2), batch=batch
+        )
+
+    PIPELINE_DISPATCH_BATCH.labels(stage).set(batch)
+    return batch
+
+
+# Per worker process: when its last task finished
+_last_task_finished: Optional[float] = None
+
+
+def task_started(worker: str):
+    """Count the time since this process's previous task as idle."""
+    if _last_task_finished is not None:
+        WORKER_IDLE_SECONDS.labels(worker).inc(time.monotonic() - _last_task_finished)
+
+
+def task_finished():
+    """Remember when this process became idle."""
+    global _last_task_finished
+    _last_task_finished = time.monotonic()
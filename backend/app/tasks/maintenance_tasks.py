@@ -0,0 +1,84 @@
+"""Celery tasks for database maintenance (article partitions and retention)."""
+import logging
+from typing import Dict
+
+from app.tasks.celery_app import celery_app
+from app.db.session import SessionLocal
+from app.config import settings
+from app.services.retention.partitions import ensure_partitions
+from app.services.retention.archive import enforce_retention
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.maintenance_tasks.maintain_article_partitions"
+)
+def maintain_article_partitions(self) -> Dict[str, any]:
+    """
+    Pre-create monthly articles partitions ahead of time.
+
+    Returns:
+        Dictionary with the partitions created
+    """
+    db = SessionLocal()
+
+    try:
+        created = ensure_partitions(db, settings.ARTICLE_PARTITION_MONTHS_AHEAD)
+        if created:
+            logger.info(f"Created article partitions: {', '.join(created)}")
+        return {
+            "success": True,
+            "partitions_created": created
+        }
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error creating article partitions: {e}", exc_info=True)
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.maintenance_tasks.enforce_article_retention"
+)
+def enforce_article_retention(self) -> Dict[str, any]:
+    """
+    Archive and drop article partitions older than MAX_ARTICLE_AGE_DAYS.
+
+    Returns:
+        Dictionary with the partitions archived
+    """
+    db = SessionLocal()
+
+    try:
+        logger.info(
+            f"Enforcing article retention of {settings.MAX_ARTICLE_AGE_DAYS} days "
+            f"(archive: {settings.ARTICLE_ARCHIVE_PATH})"
+        )
+        archived = enforce_retention(db, settings.MAX_ARTICLE_AGE_DAYS, settings.ARTICLE_ARCHIVE_PATH)
+        if archived:
+            logger.info(f"Archived article partitions: {', '.join(archived)}")
+        return {
+            "success": True,
+            "partitions_archived": archived
+        }
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error enforcing article retention: {e}", exc_info=True)
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+    finally:
+        db.close()
@@ -0,0 +1,70 @@
+"""Priority queues for the inference stages of the pipeline."""
+from typing import List, Optional
+
+from kombu import Queue
+
+from app.config import settings
+
+# Stages whose tasks are routed by influence score
+EXTRACTION = "claim_extraction"
+FACT_CHECK = "fact_checking"
+STAGES = (EXTRACTION, FACT_CHECK)
+
+# Highest first; workers list their queues in this order
+TIERS = ("high", "normal", "low")
+
+# Queues for everything else (RSS fetches, beat sweepers, maintenance)
+CONTROL_QUEUES = ("default", "rss_ingestion", EXTRACTION, FACT_CHECK, "maintenance")
+
+
+def priority_tier(influence_score: Optional[float]) -> str:
+    """
+    Tier for an article's influence score (or a claim's priority).
+
+    Args:
+        influence_score: Score between 0.0 and 1.0, None when not scored
+
+    Returns:
+        'high', 'normal' or 'low'
+    """
+    score = influence_score or 0.0
+    if score >= settings.PRIORITY_HIGH_INFLUENCE_THRESHOLD:
+        return "high"
+    if score < settings.PRIORITY_LOW_INFLUENCE_THRESHOLD:
+        return "low"
+    return "normal"
+
+
+def tier_queue(stage: str, tier: str) -> str:
+    """Broker queue name, e.g. 'fact_checking.high'."""
+    return f"{stage}.{tier}"
+
+
+def queue_for(stage: str, influence_score: Optional[float]) -> str:
+    """Broker queue for a task of a stage about an item with this score."""
+    return tier_queue(stage, priority_tier(influence_score))
+
+
+def worker_queues(tier: str) -> List[str]:
+    """
+    Queues a worker pool for a tier consumes, highest priority first.
+
+    A tier's workers also take work from the tiers above it, so high
+    influence items get every idle worker while low ones only get the low
+    pool's share.
+
+    Args:
+        tier: 'high', 'normal' or 'low'
+
+    Returns:
+        Queue names for `celery worker -Q`
+    """
+    tiers = TIERS[:TIERS.index(tier) + 1]
+    return [tier_queue(stage, t) for t in tiers for stage in STAGES]
+
+
+def task_queues() -> List[Queue]:
+    """All queues, declared for celery_app.conf.task_queues."""
+    tiered = [tier_queue(stage, tier) for tier in TIERS for stage in STAGES]
+    return [Queue(name) for name in (*tiered, *CONTROL_QUEUES)]
+
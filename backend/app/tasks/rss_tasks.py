@@ -7,6 +7,8 @@ from celery import group
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.tasks.celery_app import celery_app
+from app.tasks.claim_tasks import enqueue_extractions, report_queue_depth
+from app.config import settings
 from app.db.session import SessionLocal
 from app.models.source import NewsSource
 from app.services.ingestion.rss_fetcher import fetch_and_store_articles
@@ -61,12 +63,24 @@ def fetch_rss_source_articles(self, source_id: str) -> Dict[str, any]:
             }
 
         # Fetch and store articles
-        articles_added = fetch_and_store_articles(source, db)
+        new_articles = fetch_and_store_articles(source, db)
+        articles_added = len(new_articles)
 
         logger.info(
             f"Successfully fetched {articles_added} articles from {source.name}"
         )
 
+        # Event-driven mode: extract claims now rather than on the next sweep
+        if settings.PIPELINE_EVENT_DRIVEN and new_articles:
+            try:
+                enqueue_extractions(new_articles)
+            except Exception as e:
+                logger.warning(f"Could not enqueue extraction for {source.name}, leaving it to the sweeper: {e}")
+
+        # New pending articles change the queue depth seen by live dashboards
+        if articles_added:
+            report_queue_depth(db)
+
         return {
             "success": True,
             "source_id": source_id,
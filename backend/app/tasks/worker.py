@@ -0,0 +1,42 @@
+"""Celery worker entrypoint for one pool.
+
+The queue list for a pool comes from app.tasks.routing, so deployments
+don't repeat it:
+
+    python -m app.tasks.worker high --concurrency=2
+
+'control' runs the RSS/beat/maintenance queues; 'high', 'normal' and 'low'
+run the inference tiers. Any further arguments go to `celery worker`.
+"""
+import sys
+from typing import List
+
+from app.tasks.celery_app import celery_app
+from app.tasks.routing import CONTROL_QUEUES, TIERS, worker_queues
+
+POOLS = ("control", *TIERS)
+
+
+def pool_queues(pool: str) -> List[str]:
+    """Queues a worker pool consumes, in -Q order."""
+    if pool == "control":
+        return list(CONTROL_QUEUES)
+    return worker_queues(pool)
+
+
+def main(argv: List[str]) -> None:
+    if not argv or argv[0] not in POOLS:
+        sys.exit(f"usage: python -m app.tasks.worker {{{'|'.join(POOLS)}}} [celery worker options]")
+
+    pool, extra = argv[0], argv[1:]
+    celery_app.worker_main([
+        "worker",
+        "--loglevel=info",
+        f"--hostname={pool}@%h",
+        f"--queues={','.join(pool_queues(pool))}",
+        *extra,
+    ])
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
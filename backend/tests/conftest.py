@@ -0,0 +1,52 @@
+"""Shared fixtures for the backend tests.
+
+The tests run against the database in DATABASE_URL (migrated with
+`alembic upgrade head`) and are skipped when it can't be reached.
+"""
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from app.db.session import SessionLocal
+
+
+@pytest.fixture(scope="session")
+def db_available():
+    try:
+        with SessionLocal() as db:
+            db.execute(text("SELECT 1"))
+    except Exception as e:
+        pytest.skip(f"database unavailable: {e}")
+
+
+@pytest.fixture(scope="session")
+def client(db_available):
+    # One client, and so one event loop, for the session: pooled asyncpg
+    # connections are bound to the loop that opened them
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def count_queries():
+    """Count the statements sent to the database (any engine) while the block runs."""
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+
+    return counter
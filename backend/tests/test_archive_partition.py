@@ -0,0 +1,79 @@
+"""Archiving an article partition removes exactly the rows it archived."""
+import gzip
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.models import Article, Claim, Evidence, Investigation, NewsSource
+from app.services.retention import archive
+from app.services.retention.partitions import create_partition, list_partitions, partition_name
+
+MONTH = datetime(2001, 1, 1)
+PARTITION = partition_name(MONTH)
+
+
+@pytest.fixture
+def old_month(db_available):
+    """A partition for MONTH holding one article with a claim, investigation and evidence."""
+    with SessionLocal() as db:
+        create_partition(db, MONTH)
+        source = NewsSource(name="Archive source", source_type="rss", url="http://test.invalid/archive")
+        db.add(source)
+        db.flush()
+        article = Article(
+            source_id=source.id,
+            title="Archived article",
+            url=f"http://test.invalid/articles/{uuid.uuid4()}",
+            created_at=datetime(2001, 1, 15),
+        )
+        db.add(article)
+        db.flush()
+        claim = Claim(article_id=article.id, claim_text="Archived claim")
+        db.add(claim)
+        db.flush()
+        investigation = Investigation(claim_id=claim.id, status="completed")
+        db.add(investigation)
+        db.flush()
+        db.add(Evidence(investigation_id=investigation.id, source_url="http://test.invalid/evidence"))
+        db.commit()
+        ids = {"article": article.id, "claim": claim.id, "investigation": investigation.id}
+
+        yield db, ids
+
+        db.rollback()
+        db.execute(text(f"DROP TABLE IF EXISTS {PARTITION}"))
+        db.execute(text("DELETE FROM claims WHERE id = :id"), {"id": ids["claim"]})
+        db.delete(db.get(NewsSource, source.id))
+        db.commit()
+
+
+def test_archive_writes_then_deletes_the_archived_rows(old_month, tmp_path):
+    db, ids = old_month
+    counts = archive.archive_partition(db, PARTITION, MONTH, str(tmp_path))
+
+    assert counts["articles"] == counts["claims"] == counts["investigations"] == counts["evidence"] == 1
+    with gzip.open(tmp_path / "2001_01" / "claims.ndjson.gz") as handle:
+        assert json.loads(handle.readline())["id"] == str(ids["claim"])
+    assert PARTITION not in dict(list_partitions(db))
+    assert db.execute(text("SELECT to_regclass(:name)"), {"name": PARTITION}).scalar() is None
+    assert db.get(Claim, ids["claim"]) is None
+    assert db.get(Investigation, ids["investigation"]) is None
+
+
+def test_failed_archive_reattaches_the_partition(old_month, tmp_path, monkeypatch):
+    db, ids = old_month
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(archive, "_write_ndjson", fail)
+    with pytest.raises(OSError):
+        archive.archive_partition(db, PARTITION, MONTH, str(tmp_path))
+
+    assert PARTITION in dict(list_partitions(db))
+    assert db.get(Article, ids["article"]) is not None
+    assert db.get(Claim, ids["claim"]) is not None
@@ -0,0 +1,80 @@
+"""Detail endpoints answer a matching If-None-Match with 304.
+
+The version probe behind each revalidation is a separate statement from
+the body query, so it is exercised on its own here: it must run against
+the migrated (partitioned) schema and produce the same ETag as the full
+response.
+"""
+import uuid
+
+import pytest
+from sqlalchemy import func, update
+
+from app.db.session import SessionLocal
+from app.models import Article, Claim, Investigation, NewsSource
+
+
+@pytest.fixture(scope="module")
+def seeded(db_available):
+    """One linked source, article, claim and investigation, removed afterwards."""
+    with SessionLocal() as db:
+        source = NewsSource(name="Conditional GET source", source_type="rss", url="http://test.invalid/etag")
+        db.add(source)
+        db.flush()
+        article = Article(
+            source_id=source.id,
+            title="Conditional GET article",
+            url=f"http://test.invalid/articles/{uuid.uuid4()}",
+        )
+        db.add(article)
+        db.flush()
+        claim = Claim(article_id=article.id, claim_text="Conditional GET claim")
+        db.add(claim)
+        db.flush()
+        investigation = Investigation(
+            claim_id=claim.id,
+            verdict="true",
+            confidence_score=0.9,
+            summary="Supported by the evidence",
+            reasoning="Test fixture",
+            status="completed",
+        )
+        db.add(investigation)
+        db.commit()
+
+        yield {
+            "articles": str(article.id),
+            "claims": str(claim.id),
+            "investigations": str(investigation.id),
+        }
+
+        for row in (investigation, claim, article, source):
+            db.delete(row)
+            db.commit()
+
+
+@pytest.mark.parametrize("resource", ["articles", "claims", "investigations"])
+def test_revalidation_returns_not_modified(client, seeded, resource):
+    path = f"/api/v1/{resource}/{seeded[resource]}"
+    response = client.get(path)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    revalidated = client.get(path, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+
+
+def test_claim_etag_ignores_article_counters(client, seeded):
+    path = f"/api/v1/claims/{seeded['claims']}"
+    etag = client.get(path).headers["ETag"]
+
+    with SessionLocal() as db:
+        db.execute(
+            update(Article)
+            .where(Article.id == seeded["articles"])
+            .values(claim_count=Article.claim_count + 1, updated_at=func.timezone("utc", func.now()))
+        )
+        db.commit()
+
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
@@ -0,0 +1,87 @@
+"""List endpoints issue a fixed number of queries per page.
+
+Related rows (claim and article info on investigations, investigation
+summaries on claims, sources on articles) are loaded in the page's own
+statement. A per-row lookup creeping back in shows up here as a query
+count that grows with the page size.
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db.session import SessionLocal
+from app.models import Article, Claim, Investigation, NewsSource
+
+ROWS = 60
+SMALL_PAGE = 5
+LARGE_PAGE = 50
+
+LIST_PATHS = [
+    "/api/v1/articles",
+    "/api/v1/claims",
+    "/api/v1/investigations",
+    "/api/v1/sources",
+]
+
+
+@pytest.fixture(scope="module")
+def seeded(db_available):
+    """ROWS linked sources, articles, claims and investigations, removed afterwards."""
+    now = datetime.utcnow()
+    with SessionLocal() as db:
+        sources, articles, claims, investigations = [], [], [], []
+        for i in range(ROWS):
+            created_at = now - timedelta(seconds=i)
+            source = NewsSource(name=f"Query count source {i}", source_type="rss", url=f"http://test.invalid/{i}")
+            sources.append(source)
+            db.add(source)
+            db.flush()
+            article = Article(
+                source_id=source.id,
+                title=f"Query count article {i}",
+                url=f"http://test.invalid/articles/{uuid.uuid4()}",
+                created_at=created_at,
+            )
+            articles.append(article)
+            db.add(article)
+            db.flush()
+            claim = Claim(article_id=article.id, claim_text=f"Query count claim {i}", created_at=created_at)
+            claims.append(claim)
+            db.add(claim)
+            db.flush()
+            investigation = Investigation(
+                claim_id=claim.id,
+                verdict="true",
+                confidence_score=0.9,
+                summary="Supported by the evidence",
+                reasoning="Test fixture",
+                status="completed",
+                created_at=created_at,
+            )
+            investigations.append(investigation)
+            db.add(investigation)
+        db.commit()
+
+        yield
+
+        for rows in (investigations, claims, articles, sources):
+            for row in rows:
+                db.delete(row)
+            db.commit()
+
+
+@pytest.mark.parametrize("path", LIST_PATHS)
+def test_query_count_does_not_grow_with_page_size(client, seeded, count_queries, path):
+    counts = {}
+    for limit in (SMALL_PAGE, LARGE_PAGE):
+        with count_queries() as statements:
+            response = client.get(path, params={"limit": limit})
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == limit
+        counts[limit] = len(statements)
+
+    assert counts[SMALL_PAGE] == counts[LARGE_PAGE], (
+        f"{path}: {counts[SMALL_PAGE]} queries for {SMALL_PAGE} rows, "
+        f"{counts[LARGE_PAGE]} for {LARGE_PAGE}"
+    )
@@ -0,0 +1,4 @@
+#!/bin/sh
+# Allow streaming replication connections (used by the optional postgres-replica
+# service). Init scripts only run when the data volume is first created.
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -0,0 +1,13 @@
+#!/bin/sh
+# Clone the primary on first start, then run as a read-only hot standby.
+set -e
+
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+    until pg_basebackup -h postgres -U factcheck -D "$PGDATA" -R -X stream; do
+        echo "Waiting for primary..."
+        sleep 2
+    done
+    chmod 0700 "$PGDATA"
+fi
+
+exec postgres
@@ -14,7 +14,7 @@ export function useDashboardStats(timeRange: string = '24h') {
   return useQuery<DashboardStats>({
     queryKey: ['dashboardStats', timeRange],
     queryFn: () => getDashboardStats(timeRange),
-    refetchInterval: 60000, // Auto-refresh every 60 seconds
+    refetchInterval: 300000, // Live counters arrive via useLiveEvents; full refresh every 5 minutes
     staleTime: 30000, // Consider stale after 30 seconds
   });
 }
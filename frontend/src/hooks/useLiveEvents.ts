@@ -0,0 +1,62 @@
+/**
+ * Subscribe to live pipeline events over server-sent events
+ */
+import { useEffect } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
+import { DashboardStats, ProcessingQueue, VerdictDistribution } from '../types/stats';
+
+const API_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000/api/v1';
+
+interface PipelineEvent<T> {
+  type: string;
+  data: T;
+  timestamp: string;
+}
+
+interface InvestigationCreated {
+  id: string;
+  claim_id: string;
+  verdict: keyof VerdictDistribution | null;
+}
+
+/**
+ * Hook that patches cached dashboard stats from the /events/stream feed
+ * instead of re-fetching /stats/overview on an interval
+ */
+export function useLiveEvents() {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const source = new EventSource(`${API_URL}/events/stream`);
+
+    source.addEventListener('queue.depth', (event) => {
+      const { data } = JSON.parse((event as MessageEvent).data) as PipelineEvent<ProcessingQueue>;
+      queryClient.setQueriesData<DashboardStats>({ queryKey: ['dashboardStats'] }, (old) =>
+        old ? { ...old, processing_queue: data } : old
+      );
+    });
+
+    source.addEventListener('investigation.created', (event) => {
+      const { data } = JSON.parse((event as MessageEvent).data) as PipelineEvent<InvestigationCreated>;
+      queryClient.setQueriesData<DashboardStats>({ queryKey: ['dashboardStats'] }, (old) => {
+        if (!old) return old;
+        const verdicts = { ...old.verdict_distribution };
+        if (data.verdict && data.verdict in verdicts) {
+          verdicts[data.verdict] += 1;
+        }
+        return {
+          ...old,
+          overview: { ...old.overview, total_investigations: old.overview.total_investigations + 1 },
+          verdict_distribution: verdicts,
+          recent_activity: {
+            ...old.recent_activity,
+            new_investigations: old.recent_activity.new_investigations + 1,
+          },
+        };
+      });
+      queryClient.invalidateQueries({ queryKey: ['investigations'] });
+    });
+
+    return () => source.close();
+  }, [queryClient]);
+}
@@ -15,9 +15,13 @@ const ArticlesPage: React.FC = () => {
     offset
   });
 
-  const totalPages = data?.total ? Math.ceil(data.total / ITEMS_PER_PAGE) : 0;
-  const startItem = data?.total ? offset + 1 : 0;
-  const endItem = data?.total ? Math.min(offset + ITEMS_PER_PAGE, data.total) : 0;
+  // Without a total, paging relies on the server reporting a next page
+  const total = data?.total ?? null;
+  const totalPages = total ? Math.ceil(total / ITEMS_PER_PAGE) : 0;
+  const hasNextPage = total !== null ? currentPage < totalPages : Boolean(data?.next_cursor);
+  const itemCount = data?.items?.length ?? 0;
+  const startItem = itemCount ? offset + 1 : 0;
+  const endItem = offset + itemCount;
 
   const handlePreviousPage = () => {
     setCurrentPage(prev => Math.max(1, prev - 1));
@@ -25,7 +29,7 @@ const ArticlesPage: React.FC = () => {
   };
 
   const handleNextPage = () => {
-    setCurrentPage(prev => Math.min(totalPages, prev + 1));
+    if (hasNextPage) setCurrentPage(prev => prev + 1);
     window.scrollTo({ top: 0, behavior: 'smooth' });
   };
 
@@ -36,9 +40,9 @@ const ArticlesPage: React.FC = () => {
     <div className="max-w-6xl mx-auto px-4 py-8">
       <div className="flex items-center justify-between mb-8">
         <h1 className="text-4xl font-bold">Articles</h1>
-        {data?.total && (
+        {itemCount > 0 && (
           <p className="text-gray-600">
-            Showing {startItem}-{endItem} of {data.total} articles
+            Showing {startItem}-{endItem}{total !== null && ` of ${total}`} articles
           </p>
         )}
       </div>
@@ -56,7 +60,7 @@ const ArticlesPage: React.FC = () => {
       )}
 
       {/* Pagination Controls */}
-      {totalPages > 1 && (
+      {(currentPage > 1 || hasNextPage) && (
         <div className="flex items-center justify-center gap-4 mt-8">
           <button
             onClick={handlePreviousPage}
@@ -68,12 +72,12 @@ const ArticlesPage: React.FC = () => {
           </button>
 
           <span className="text-gray-700">
-            Page {currentPage} of {totalPages}
+            Page {currentPage}{total !== null && ` of ${totalPages}`}
           </span>
 
           <button
             onClick={handleNextPage}
-            disabled={currentPage === totalPages}
+            disabled={!hasNextPage}
             className="flex items-center gap-2 px-4 py-2 border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed disabled:hover:bg-white"
           >
             Next
@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
 import { useDashboardStats } from '../hooks/useDashboardStats';
+import { useLiveEvents } from '../hooks/useLiveEvents';
 import { StatCard } from '../components/dashboard/StatCard';
 import { VerdictDistribution } from '../components/dashboard/VerdictDistribution';
 import { RecentActivity } from '../components/dashboard/RecentActivity';
@@ -14,6 +15,7 @@ import { formatDistanceToNow } from 'date-fns';
 const DashboardPage: React.FC = () => {
   const [timeRange, setTimeRange] = useState<'24h' | '7d' | '30d'>('24h');
   const { data, isLoading, error, dataUpdatedAt } = useDashboardStats(timeRange);
+  useLiveEvents();
 
   if (isLoading) return <Loading />;
 
@@ -33,7 +33,10 @@ const InvestigationsPage: React.FC = () => {
     );
   }
 
-  const totalPages = data ? Math.ceil(data.total / limit) : 0;
+  // Without a total, paging relies on the server reporting a next page
+  const total = data?.total ?? null;
+  const totalPages = total !== null ? Math.ceil(total / limit) : 0;
+  const hasNextPage = total !== null ? page < totalPages - 1 : Boolean(data?.next_cursor);
 
   return (
     <div className="max-w-6xl mx-auto px-4 py-8">
@@ -41,7 +44,9 @@ const InvestigationsPage: React.FC = () => {
       <div className="mb-8">
         <h1 className="text-4xl font-bold mb-2">Investigations</h1>
         <p className="text-gray-600">
-          {data?.total || 0} fact-check investigations completed
+          {total !== null
+            ? `${total} fact-check investigations completed`
+            : 'Fact-check investigations'}
         </p>
       </div>
 
@@ -193,7 +198,7 @@ const InvestigationsPage: React.FC = () => {
       )}
 
       {/* Pagination */}
-      {totalPages > 1 && (
+      {(page > 0 || hasNextPage) && (
         <div className="flex justify-center items-center gap-4" role="navigation" aria-label="Pagination">
           <button
             onClick={() => setPage(page - 1)}
@@ -205,12 +210,12 @@ const InvestigationsPage: React.FC = () => {
           </button>
 
           <span className="text-gray-700" aria-live="polite">
-            Page {page + 1} of {totalPages}
+            Page {page + 1}{total !== null && ` of ${totalPages}`}
           </span>
 
           <button
             onClick={() => setPage(page + 1)}
-            disabled={page >= totalPages - 1}
+            disabled={!hasNextPage}
             className="px-4 py-2 bg-primary-700 text-white rounded-md disabled:bg-gray-300 disabled:cursor-not-allowed hover:bg-primary-500 transition-colors"
             aria-label="Next page of investigations"
           >
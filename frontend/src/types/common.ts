@@ -1,6 +1,8 @@
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
+  // null when the server skipped the count (total_mode=none, or a cursor page)
+  total: number | null;
   limit: number;
   offset: number;
+  next_cursor?: string | null;
 }
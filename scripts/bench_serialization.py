@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of list response serialization.
+
+Measures the cost of turning 1,000 investigations into a response body
+along the three list paths, without a database or HTTP server:
+
+- orm:        ORM objects -> InvestigationResponse -> PaginatedResponse -> json
+- projection: projected row dicts -> PaginatedResponse -> json (default)
+- fast:       projected row dicts -> orjson (FAST_JSON_RESPONSES=true)
+
+    python scripts/bench_serialization.py --rows 1000 --repeat 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+# Add parent directory to path (works both from host and Docker container)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+
+if os.path.exists('/app/app'):
+    sys.path.insert(0, '/app')
+else:
+    sys.path.insert(0, os.path.join(parent_dir, 'backend'))
+
+from fastapi.responses import JSONResponse
+
+from app.core.responses import FastJSONResponse
+from app.models import Investigation
+from app.schemas.common import PaginatedResponse
+from app.schemas.investigation import InvestigationResponse
+
+VERDICTS = ["true", "mostly_true", "mixed", "mostly_false", "false", "unverifiable"]
+
+
+def make_rows(count: int):
+    """Build matching ORM objects and projected row dicts for count investigations."""
+    now = datetime.utcnow()
+    orm_rows, dict_rows = [], []
+    for i in range(count):
+        values = {
+            "id": uuid.uuid4(),
+            "claim_id": uuid.uuid4(),
+            "verdict": VERDICTS[i % len(VERDICTS)],
+            "confidence_score": (i % 100) / 100,
+            "summary": "The claim is partially supported by two independent sources. " * 3,
+            "evidence_count": 5,
+            "supporting_evidence_count": 3,
+            "refuting_evidence_count": 2,
+            "propaganda_signals": {"techniques": ["loaded_language"], "score": 0.2},
+            "status": "completed",
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now - timedelta(minutes=i),
+        }
+        joined = {
+            "claim_text": "Unemployment fell to its lowest level in a decade last quarter.",
+            "article_id": uuid.uuid4(),
+            "article_title": "Economy report shows mixed signals",
+            "article_url": f"https://example.com/articles/{i}",
+        }
+        orm_rows.append((Investigation(**values), joined))
+        dict_rows.append({**values, **joined})
+    return orm_rows, dict_rows
+
+
+def page(items):
+    return {"items": items, "total": len(items), "limit": len(items), "offset": 0, "next_cursor": None}
+
+
+def render_validated(payload) -> bytes:
+    """What FastAPI does with a dict returned under response_model=PaginatedResponse."""
+    validated = PaginatedResponse.model_validate(payload)
+    return JSONResponse(validated.model_dump(mode="json")).body
+
+
+def orm_path(orm_rows) -> bytes:
+    items = []
+    for inv, joined in orm_rows:
+        inv_dict = InvestigationResponse.model_validate(inv).model_dump()
+        inv_dict.update(joined, article_id=str(joined["article_id"]))
+        items.append(inv_dict)
+    return render_validated(page(items))
+
+
+def projection_path(dict_rows) -> bytes:
+    return render_validated(page([dict(row) for row in dict_rows]))
+
+
+def fast_path(dict_rows) -> bytes:
+    return FastJSONResponse(page([dict(row) for row in dict_rows])).body
+
+
+def bench(fn, rows, repeat: int):
+    fn(rows)  # warm up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000, help="Investigations per response")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed iterations per path")
+    args = parser.parse_args()
+
+    orm_rows, dict_rows = make_rows(args.rows)
+    results = [
+        ("orm", bench(orm_path, orm_rows, args.repeat), len(orm_path(orm_rows))),
+        ("projection", bench(projection_path, dict_rows, args.repeat), len(projection_path(dict_rows))),
+        ("fast", bench(fast_path, dict_rows, args.repeat), len(fast_path(dict_rows))),
+    ]
+
+    baseline = statistics.median(results[0][1])
+    print(f"{args.rows} investigations, {args.repeat} iterations")
+    print(f"{'path':<12} {'median ms':>10} {'min ms':>8} {'bytes':>9} {'speedup':>8}")
+    for name, samples, size in results:
+        median = statistics.median(samples)
+        print(f"{name:<12} {median:>10.2f} {min(samples):>8.2f} {size:>9} {baseline / median:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Stub LLM server for exercising the router without a GPU.
+
+Speaks enough of the Ollama API (/api/generate, streamed or not,
+/api/tags) and of the OpenAI-compatible API (/v1/chat/completions,
+/v1/models) for the backend's LLM client. Responses follow the JSON
+schema sent in "format" / "response_format", so the analysis services
+parse them as they would real output. Latency, generation speed and
+failures are simulated:
+
+    python scripts/llm_stub_server.py --port 11435 --latency 0.5 --jitter 0.2 \\
+        --tokens-per-second 40 --failure-rate 0.1 --hang-rate 0.02
+
+Run a few with different settings and point LLM_BACKENDS at them, e.g.
+LLM_BACKENDS=http://localhost:11435,openai=http://localhost:11436/v1
+GET /stub/stats shows the requests each one served, to check balancing.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict, Optional
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+FILLER = "The stub server has nothing to say about this prompt."
+
+
+def sample(schema: Dict[str, Any]) -> Any:
+    """A random value satisfying a (simple) JSON schema."""
+    kind = schema.get("type")
+    if "enum" in schema:
+        return random.choice(schema["enum"])
+    if kind == "object":
+        properties = schema.get("properties", {})
+        return {name: sample(properties[name]) for name in schema.get("required", properties)}
+    if kind == "array":
+        return [sample(schema.get("items", {})) for _ in range(random.randint(1, 3))]
+    if kind in ("number", "integer"):
+        low, high = schema.get("minimum", 0), schema.get("maximum", 1)
+        return round(random.uniform(low, high), 2) if kind == "number" else random.randint(low, high)
+    if kind == "boolean":
+        return random.random() < 0.5
+    return "stub"
+
+
+def completion(output_format: Optional[Any]) -> str:
+    """Text the model 'generates' for a request."""
+    if isinstance(output_format, dict):
+        return json.dumps(sample(output_format))
+    if output_format == "json":
+        return "{}"
+    return FILLER
+
+
+def tokenize(text: str):
+    """Split text into pseudo-tokens of a few characters, as a model would stream it."""
+    return [text[i:i + 4] for i in range(0, len(text), 4)]
+
+
+def create_app(args) -> FastAPI:
+    app = FastAPI(title="LLM stub server")
+    stats = {"requests": 0, "in_flight": 0, "max_in_flight": 0, "failures": 0, "hangs": 0}
+
+    async def simulate() -> None:
+        """Prompt-evaluation latency, then maybe an injected failure or hang."""
+        stats["requests"] += 1
+        await asyncio.sleep(max(random.gauss(args.latency, args.jitter), 0))
+        if random.random() < args.failure_rate:
+            stats["failures"] += 1
+            raise HTTPException(status_code=500, detail="stub: injected failure")
+        if random.random() < args.hang_rate:
+            stats["hangs"] += 1
+            await asyncio.sleep(3600)
+
+    async def generated(tokens):
+        """Yield tokens at the configured generation speed."""
+        for token in tokens:
+            await asyncio.sleep(1 / args.tokens_per_second)
+            yield token
+
+    def enter() -> None:
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+
+    def leave() -> None:
+        stats["in_flight"] -= 1
+
+    @app.get("/api/tags")
+    async def tags():
+        return {"models": [{"name": model} for model in args.models]}
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": model, "object": "model"} for model in args.models]}
+
+    @app.get("/stub/stats")
+    async def get_stats():
+        return stats
+
+    @app.post("/api/generate")
+    async def generate(request: Request):
+        payload = await request.json()
+        enter()
+        try:
+            await simulate()
+        except BaseException:
+            leave()
+            raise
+
+        text = completion(payload.get("format"))
+        tokens = tokenize(text)
+        num_predict = (payload.get("options") or {}).get("num_predict") or len(tokens)
+        tokens, done_reason = tokens[:num_predict], "length" if len(tokens) > num_predict else "stop"
+        started = time.monotonic()
+
+        def final() -> Dict[str, Any]:
+            return {
+                "model": payload.get("model"),
+                "done": True,
+                "done_reason": done_reason,
+                "prompt_eval_count": len(payload.get("prompt", "")) // 4,
+                "eval_count": len(tokens),
+                "eval_duration": int((time.monotonic() - started) * 1e9),
+            }
+
+        if not payload.get("stream", True):
+            try:
+                parts = [token async for token in generated(tokens)]
+            finally:
+                leave()
+            return {**final(), "response": "".join(parts)}
+
+        async def lines():
+            try:
+                async for token in generated(tokens):
+                    yield json.dumps({"model": payload.get("model"), "response": token, "done": False}) + "\n"
+                yield json.dumps({**final(), "response": ""}) + "\n"
+            finally:
+                leave()
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        enter()
+        try:
+            return await chat_completion(body)
+        finally:
+            leave()
+
+    async def chat_completion(body: Dict[str, Any]) -> Dict[str, Any]:
+        await simulate()
+        response_format = body.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            output_format = response_format["json_schema"].get("schema", {})
+        else:
+            output_format = "json" if response_format.get("type") == "json_object" else None
+
+        tokens = tokenize(completion(output_format))
+        max_tokens = body.get("max_tokens") or len(tokens)
+        finish_reason = "length" if len(tokens) > max_tokens else "stop"
+        parts = [token async for token in generated(tokens[:max_tokens])]
+        prompt_chars = sum(len(message.get("content", "")) for message in body.get("messages", []))
+        return {
+            "object": "chat.completion",
+            "model": body.get("model"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "".join(parts)},
+                "finish_reason": finish_reason,
+            }],
+            "usage": {
+                "prompt_tokens": prompt_chars // 4,
+                "completion_tokens": len(parts),
+                "total_tokens": prompt_chars // 4 + len(parts),
+            },
+        }
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency", type=float, default=0.5, help="Mean seconds before the first token")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Standard deviation of --latency")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests answered with a 500")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="Share of requests that never answer")
+    parser.add_argument("--model", action="append", dest="models",
+                        help="Model name to list (repeatable); any model is accepted")
+    args = parser.parse_args()
+    args.models = args.models or ["llama2"]
+
+    uvicorn.run(create_app(args), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()